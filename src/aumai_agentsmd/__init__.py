@@ -1,6 +1,7 @@
 """AumAI Agentsmd — parse, validate, and generate AGENTS.md files."""
 
-from aumai_agentsmd.async_core import AsyncAgentsMDService
+from typing import Any
+
 from aumai_agentsmd.core import (
     AgentsMdGenerator,
     AgentsMdParser,
@@ -8,22 +9,50 @@ from aumai_agentsmd.core import (
     ConfigExporter,
     generate_template,
 )
-from aumai_agentsmd.integration import AgentsMDIntegration, setup_agentsmd
-from aumai_agentsmd.llm_enricher import (
-    EnrichmentResult,
-    LLMDocEnricher,
-    build_mock_enricher,
-)
 from aumai_agentsmd.models import (
     AgentsMdDocument,
     AgentsSection,
     ValidationIssue,
     ValidationResult,
 )
-from aumai_agentsmd.store import AgentsMDStore, StoredAgentDoc
 
 __version__ = "0.1.0"
 
+# The async service, store, LLM enricher, and AumOS integration each pull in
+# a foundation library the sync core (and the CLI) never needs.  They are
+# exposed lazily via PEP 562 so `import aumai_agentsmd` stays light.
+_LAZY_ATTRS: dict[str, str] = {
+    # Async service
+    "AsyncAgentsMDService": "aumai_agentsmd.async_core",
+    # Store
+    "AgentsMDStore": "aumai_agentsmd.store",
+    "StoredAgentDoc": "aumai_agentsmd.store",
+    # LLM enricher
+    "LLMDocEnricher": "aumai_agentsmd.llm_enricher",
+    "EnrichmentResult": "aumai_agentsmd.llm_enricher",
+    "build_mock_enricher": "aumai_agentsmd.llm_enricher",
+    # Integration
+    "AgentsMDIntegration": "aumai_agentsmd.integration",
+    "setup_agentsmd": "aumai_agentsmd.integration",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    module = importlib.import_module(module_name)
+    value = getattr(module, name)
+    globals()[name] = value  # cache so __getattr__ runs once per attribute
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
 __all__ = [
     # Core sync API
     "AgentsMdParser",
@@ -8,6 +8,7 @@ concurrency control, and health checks.
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import Executor
 from typing import Any
 
 from aumai_async_core import AsyncEventEmitter, AsyncService, AsyncServiceConfig
@@ -20,6 +21,19 @@ from aumai_agentsmd.core import (
 )
 from aumai_agentsmd.models import AgentsMdDocument, ValidationResult
 
+# Minimal document used to probe the parser during health checks.
+_HEALTH_PROBE: str = "# HealthCheckProject\n\n## Project Context\n\nOK.\n"
+
+
+def _parse_all(parser: AgentsMdParser, contents: list[str]) -> list[AgentsMdDocument]:
+    """Synchronously parse every entry of *contents* (executor helper).
+
+    Module-level rather than a method so only the stateless parser and the
+    inputs cross the executor boundary — a bound method would drag the whole
+    service along, which a ``ProcessPoolExecutor`` cannot pickle.
+    """
+    return [parser.parse(content) for content in contents]
+
 
 class AsyncAgentsMDService(AsyncService):
     """Lifecycle-managed async service for AGENTS.md document operations.
@@ -34,11 +48,16 @@ class AsyncAgentsMDService(AsyncService):
     Events emitted:
         - ``doc.generated``: fired after a document is generated from a
           template or an existing :class:`~aumai_agentsmd.models.AgentsMdDocument`.
-          Payload keys: ``project_name``.
+          Payload keys: ``project_name`` (template path) or the document's
+          ``event_payload`` scalars.
         - ``doc.validated``: fired after a document is validated.
-          Payload keys: ``project_name``, ``valid``, ``issue_count``.
+          Payload keys: the document's ``event_payload`` scalars plus
+          ``valid`` and ``issue_count``.
         - ``doc.parsed``: fired after raw markdown is parsed into a document.
-          Payload keys: ``project_name``.
+          Payload keys: the document's ``event_payload`` scalars
+          (``project_name`` and per-section counts).
+        - ``doc.parsed_batch``: fired once after a :meth:`parse_many` batch.
+          Payload keys: ``count``, ``project_names``.
 
     Example::
 
@@ -60,6 +79,7 @@ class AsyncAgentsMDService(AsyncService):
         config: AsyncServiceConfig | None = None,
         *,
         run_in_executor: bool = True,
+        executor: Executor | None = None,
     ) -> None:
         """Initialise the async agentsmd service.
 
@@ -67,9 +87,16 @@ class AsyncAgentsMDService(AsyncService):
             config: Service configuration.  Defaults to a sensible config
                 with ``name="agentsmd"``.
             run_in_executor: When ``True`` (the default), CPU-bound parsing
-                and validation runs in the default thread executor to avoid
-                blocking the event loop.  Set to ``False`` in tests to keep
-                execution synchronous.
+                and validation runs in an executor to avoid blocking the
+                event loop.  Set to ``False`` in tests to keep execution
+                synchronous.
+            executor: Optional executor for the CPU-bound work.  ``None``
+                (the default) uses the loop's default thread executor, which
+                is right for single-document latency.  Pass a
+                ``concurrent.futures.ProcessPoolExecutor`` for batch
+                throughput: the parser, validator, and generator are all
+                stateless and picklable, so independent documents then scale
+                across cores instead of contending on the GIL.
         """
         effective_config = config or AsyncServiceConfig(
             name="agentsmd",
@@ -81,6 +108,8 @@ class AsyncAgentsMDService(AsyncService):
         self._generator: AgentsMdGenerator = AgentsMdGenerator()
         self._emitter: AsyncEventEmitter = AsyncEventEmitter()
         self._run_in_executor = run_in_executor
+        self._executor = executor
+        self._probe_result: bool | None = None
 
     # ------------------------------------------------------------------
     # Public properties
@@ -104,6 +133,7 @@ class AsyncAgentsMDService(AsyncService):
         self._parser = AgentsMdParser()
         self._validator = AgentsMdValidator()
         self._generator = AgentsMdGenerator()
+        self._probe_result = None
 
     async def on_stop(self) -> None:
         """Remove all event listeners on service shutdown."""
@@ -113,14 +143,17 @@ class AsyncAgentsMDService(AsyncService):
         """Return ``True`` when the underlying parser is operational.
 
         A trivial probe — parse a minimal document and assert a non-empty
-        project name results.
+        project name results.  The parser is stateless, so the probe result
+        is cached per parser instance rather than re-parsed on every health
+        tick; ``on_start`` resets the cache along with the parser.
         """
-        probe = "# HealthCheckProject\n\n## Project Context\n\nOK.\n"
-        try:
-            doc = self._parser.parse(probe)
-            return doc.project_name != ""
-        except Exception:
-            return False
+        if self._probe_result is None:
+            try:
+                doc = self._parser.parse(_HEALTH_PROBE)
+                self._probe_result = doc.project_name != ""
+            except Exception:
+                self._probe_result = False
+        return self._probe_result
 
     # ------------------------------------------------------------------
     # Core async API
@@ -145,7 +178,7 @@ class AsyncAgentsMDService(AsyncService):
             if self._run_in_executor:
                 loop = asyncio.get_running_loop()
                 doc: AgentsMdDocument = await loop.run_in_executor(
-                    None, self._parser.parse, content
+                    self._executor, self._parser.parse, content
                 )
             else:
                 doc = self._parser.parse(content)
@@ -153,9 +186,45 @@ class AsyncAgentsMDService(AsyncService):
             await self.increment_error_count()
             raise
 
-        await self._emitter.emit("doc.parsed", project_name=doc.project_name)
+        await self._emitter.emit("doc.parsed", **doc.event_payload)
         return doc
 
+    async def parse_many(self, contents: list[str]) -> list[AgentsMdDocument]:
+        """Parse a batch of markdown strings with a single executor hop.
+
+        Unlike calling :meth:`parse` in a loop — which pays one executor
+        submission and one awaited event emission per document — the whole
+        batch is mapped inside one executor job and a single aggregated
+        ``doc.parsed_batch`` event is emitted.
+
+        Args:
+            contents: Raw AGENTS.md markdown strings.
+
+        Returns:
+            A list of :class:`~aumai_agentsmd.models.AgentsMdDocument` in the
+            same order as *contents*.
+        """
+        await self.increment_request_count()
+
+        try:
+            if self._run_in_executor:
+                loop = asyncio.get_running_loop()
+                docs: list[AgentsMdDocument] = await loop.run_in_executor(
+                    self._executor, _parse_all, self._parser, contents
+                )
+            else:
+                docs = _parse_all(self._parser, contents)
+        except Exception:
+            await self.increment_error_count()
+            raise
+
+        await self._emitter.emit(
+            "doc.parsed_batch",
+            count=len(docs),
+            project_names=[doc.project_name for doc in docs],
+        )
+        return docs
+
     async def validate(self, doc: AgentsMdDocument) -> ValidationResult:
         """Validate *doc* asynchronously and emit a ``doc.validated`` event.
 
@@ -172,7 +241,7 @@ class AsyncAgentsMDService(AsyncService):
             if self._run_in_executor:
                 loop = asyncio.get_running_loop()
                 result: ValidationResult = await loop.run_in_executor(
-                    None, self._validator.validate, doc
+                    self._executor, self._validator.validate, doc
                 )
             else:
                 result = self._validator.validate(doc)
@@ -182,7 +251,7 @@ class AsyncAgentsMDService(AsyncService):
 
         await self._emitter.emit(
             "doc.validated",
-            project_name=doc.project_name,
+            **doc.event_payload,
             valid=result.valid,
             issue_count=len(result.issues),
         )
@@ -205,7 +274,7 @@ class AsyncAgentsMDService(AsyncService):
             if self._run_in_executor:
                 loop = asyncio.get_running_loop()
                 markdown: str = await loop.run_in_executor(
-                    None, self._generator.generate, doc
+                    self._executor, self._generator.generate, doc
                 )
             else:
                 markdown = self._generator.generate(doc)
@@ -213,7 +282,7 @@ class AsyncAgentsMDService(AsyncService):
             await self.increment_error_count()
             raise
 
-        await self._emitter.emit("doc.generated", project_name=doc.project_name)
+        await self._emitter.emit("doc.generated", **doc.event_payload)
         return markdown
 
     async def parse_and_validate(
@@ -221,8 +290,10 @@ class AsyncAgentsMDService(AsyncService):
     ) -> tuple[AgentsMdDocument, ValidationResult]:
         """Parse *content* and immediately validate the resulting document.
 
-        Convenience method combining :meth:`parse` and :meth:`validate` into a
-        single call.
+        Runs the fused :meth:`~aumai_agentsmd.core.AgentsMdParser.parse_and_validate`
+        as a single executor job — one request-count increment and one
+        executor hop instead of two — then emits ``doc.parsed`` and
+        ``doc.validated`` just as the individual methods would.
 
         Args:
             content: Raw AGENTS.md markdown string.
@@ -230,8 +301,27 @@ class AsyncAgentsMDService(AsyncService):
         Returns:
             A ``(document, validation_result)`` tuple.
         """
-        doc = await self.parse(content)
-        result = await self.validate(doc)
+        await self.increment_request_count()
+
+        try:
+            if self._run_in_executor:
+                loop = asyncio.get_running_loop()
+                doc, result = await loop.run_in_executor(
+                    self._executor, self._parser.parse_and_validate, content
+                )
+            else:
+                doc, result = self._parser.parse_and_validate(content)
+        except Exception:
+            await self.increment_error_count()
+            raise
+
+        await self._emitter.emit("doc.parsed", **doc.event_payload)
+        await self._emitter.emit(
+            "doc.validated",
+            **doc.event_payload,
+            valid=result.valid,
+            issue_count=len(result.issues),
+        )
         return doc, result
 
     async def generate_from_template(self, project_name: str) -> str:
@@ -248,13 +338,10 @@ class AsyncAgentsMDService(AsyncService):
         await self.increment_request_count()
 
         try:
-            if self._run_in_executor:
-                loop = asyncio.get_running_loop()
-                markdown = await loop.run_in_executor(
-                    None, generate_template, project_name
-                )
-            else:
-                markdown = generate_template(project_name)
+            # generate_template is lru_cached and cheap even on a miss (a
+            # single str.format), so the executor hop is not worth its
+            # scheduling overhead here.
+            markdown = generate_template(project_name)
         except Exception:
             await self.increment_error_count()
             raise
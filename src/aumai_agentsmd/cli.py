@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 
@@ -14,7 +15,18 @@ from aumai_agentsmd.core import (
     ConfigExporter,
     generate_template,
 )
-from aumai_agentsmd.models import ValidationIssue
+from aumai_agentsmd.models import AgentsMdDocument, ValidationIssue
+
+# Styled severity prefixes, rendered once at import so the issue loop in
+# `validate` is a dict lookup per issue instead of upper() + click.style().
+_STYLED_PREFIX: dict[str, str] = {
+    severity: click.style(f"[{severity.upper()}]", fg=colour)
+    for severity, colour in (
+        ("error", "red"),
+        ("warning", "yellow"),
+        ("info", "blue"),
+    )
+}
 
 
 @click.group()
@@ -23,18 +35,58 @@ def main() -> None:
     """AumAI Agentsmd CLI — parse, validate, and generate AGENTS.md files."""
 
 
+# Memoised component factories: the CLI objects are stateless, so one
+# instance per process serves every command invocation (which also means
+# repeated in-process invocations, as in the test suite, share them).
+@functools.lru_cache(maxsize=1)
+def _parser() -> AgentsMdParser:
+    return AgentsMdParser()
+
+
+@functools.lru_cache(maxsize=1)
+def _validator() -> AgentsMdValidator:
+    return AgentsMdValidator()
+
+
+@functools.lru_cache(maxsize=1)
+def _generator() -> AgentsMdGenerator:
+    return AgentsMdGenerator()
+
+
+@functools.lru_cache(maxsize=1)
+def _exporter() -> ConfigExporter:
+    return ConfigExporter()
+
+
+def _load_document(parser: AgentsMdParser, agents_md_path: str) -> AgentsMdDocument:
+    """Parse *agents_md_path*, reading stdin when the path is ``-``.
+
+    The stdin path avoids a temp file when the caller already holds the
+    markdown in memory (pipelines, tests).
+    """
+    if agents_md_path == "-":
+        with click.open_file("-", encoding="utf-8") as stream:
+            return parser.parse(stream.read())
+    return parser.parse_file(agents_md_path)
+
+
 @main.command("validate")
-@click.argument("agents_md_path", metavar="AGENTS_MD", type=click.Path(exists=True))
+@click.argument(
+    "agents_md_path",
+    metavar="AGENTS_MD",
+    type=click.Path(exists=True, allow_dash=True),
+)
 def validate_command(agents_md_path: str) -> None:
     """Validate the structure of an AGENTS.md file.
 
-    Exits with code 1 when errors are found.
+    Pass ``-`` to read the document from stdin. Exits with code 1 when
+    errors are found.
     """
-    parser = AgentsMdParser()
-    validator = AgentsMdValidator()
+    parser = _parser()
+    validator = _validator()
 
     try:
-        doc = parser.parse_file(agents_md_path)
+        doc = _load_document(parser, agents_md_path)
     except Exception as exc:
         click.echo(f"Error reading file: {exc}", err=True)
         sys.exit(1)
@@ -45,18 +97,10 @@ def validate_command(agents_md_path: str) -> None:
         click.echo(f"AGENTS.md is valid: {agents_md_path}")
         return
 
-    severity_colour: dict[str, str] = {
-        "error": "red",
-        "warning": "yellow",
-        "info": "blue",
-    }
     for issue in result.issues:
-        colour = severity_colour.get(issue.severity, "white")
+        prefix = _STYLED_PREFIX.get(issue.severity, f"[{issue.severity.upper()}]")
         location = _format_location(issue)
-        click.echo(
-            click.style(f"[{issue.severity.upper()}]", fg=colour)
-            + f" {issue.section.value}{location}: {issue.message}"
-        )
+        click.echo(f"{prefix} {issue.section.value}{location}: {issue.message}")
 
     if result.valid:
         click.echo(click.style("Validation passed with warnings.", fg="yellow"))
@@ -73,7 +117,11 @@ def _format_location(issue: ValidationIssue) -> str:
 
 
 @main.command("parse")
-@click.argument("agents_md_path", metavar="AGENTS_MD", type=click.Path(exists=True))
+@click.argument(
+    "agents_md_path",
+    metavar="AGENTS_MD",
+    type=click.Path(exists=True, allow_dash=True),
+)
 @click.option(
     "--output",
     "-o",
@@ -83,12 +131,12 @@ def _format_location(issue: ValidationIssue) -> str:
     help="Output format.",
 )
 def parse_command(agents_md_path: str, output: str) -> None:
-    """Parse AGENTS.md and print the configuration as JSON or YAML."""
-    parser = AgentsMdParser()
-    exporter = ConfigExporter()
+    """Parse AGENTS.md (or stdin via ``-``) and print it as JSON or YAML."""
+    parser = _parser()
+    exporter = _exporter()
 
     try:
-        doc = parser.parse_file(agents_md_path)
+        doc = _load_document(parser, agents_md_path)
     except Exception as exc:
         click.echo(f"Error reading file: {exc}", err=True)
         sys.exit(1)
@@ -135,7 +183,11 @@ def init_command(project_name: str, output: str, force: bool) -> None:
 
 
 @main.command("generate")
-@click.argument("agents_md_path", metavar="AGENTS_MD", type=click.Path(exists=True))
+@click.argument(
+    "agents_md_path",
+    metavar="AGENTS_MD",
+    type=click.Path(exists=True, allow_dash=True),
+)
 @click.option(
     "--output",
     "-o",
@@ -143,12 +195,12 @@ def init_command(project_name: str, output: str, force: bool) -> None:
     help="Write output to this file instead of stdout.",
 )
 def generate_command(agents_md_path: str, output: str | None) -> None:
-    """Round-trip parse an AGENTS.md and re-emit it as normalised markdown."""
-    parser = AgentsMdParser()
-    generator = AgentsMdGenerator()
+    """Round-trip an AGENTS.md (or stdin via ``-``) into normalised markdown."""
+    parser = _parser()
+    generator = _generator()
 
     try:
-        doc = parser.parse_file(agents_md_path)
+        doc = _load_document(parser, agents_md_path)
     except Exception as exc:
         click.echo(f"Error reading file: {exc}", err=True)
         sys.exit(1)
@@ -4,11 +4,23 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 
 import yaml
 
+try:  # libyaml C dumper — several times faster than the pure-Python one.
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
+try:  # Rust JSON encoder — optional, stdlib json remains the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 from aumai_agentsmd.models import (
     AgentsMdDocument,
     AgentsSection,
@@ -27,41 +39,89 @@ _HEADING_MAP: Final[dict[str, str]] = {
     "workflow": "development_workflow",
 }
 
-# Heading levels to recognise (H1–H3).
-_HEADING_RE: Final[re.Pattern[str]] = re.compile(r"^(#{1,3})\s+(.+)$")
+# Heading levels to recognise (H1–H3).  Multiline-anchored so a single
+# ``finditer`` pass over the whole document locates every heading; trailing
+# whitespace (including the ``\r`` of CRLF input, which binary-mode reads
+# no longer translate away) is trimmed by the pattern itself.
+_HEADING_RE: Final[re.Pattern[str]] = re.compile(
+    r"^[ \t]*(#{1,3})[ \t]+(.+?)[ \t\r]*$", re.MULTILINE
+)
+
+# Bullet-list item pattern.  Inputs are pre-stripped single lines, so no
+# trailing anchor is needed and `[ \t]+(\S` keeps the scan from walking
+# whitespace-heavy lines twice.
+_BULLET_RE: Final[re.Pattern[str]] = re.compile(r"^[-*+][ \t]+(\S.*)")
 
-# Bullet-list item pattern.
-_BULLET_RE: Final[re.Pattern[str]] = re.compile(r"^[\-\*\+]\s+(.+)$")
+# Numbered list item pattern (same pre-stripped input contract).
+_NUMBERED_RE: Final[re.Pattern[str]] = re.compile(r"^\d+\.[ \t]+(\S.*)")
 
-# Numbered list item pattern.
-_NUMBERED_RE: Final[re.Pattern[str]] = re.compile(r"^\d+\.\s+(.+)$")
 
+def _extract_list_items(lines: Iterable[str]) -> list[str]:
+    """Return non-empty text from bullet or numbered list lines.
 
-def _extract_list_items(lines: list[str]) -> list[str]:
-    """Return non-empty text from bullet or numbered list lines."""
+    Uses plain string checks rather than the bullet/numbered regexes: this
+    runs once per line of every list section, and prefix dispatch on the
+    first character is considerably cheaper than two regex matches.
+    """
     items: list[str] = []
+    append = items.append
     for line in lines:
-        bullet_match = _BULLET_RE.match(line.strip())
-        numbered_match = _NUMBERED_RE.match(line.strip())
-        if bullet_match:
-            items.append(bullet_match.group(1).strip())
-        elif numbered_match:
-            items.append(numbered_match.group(1).strip())
+        stripped = line.strip()
+        if not stripped:
+            continue
+        head = stripped[0]
+        if head in "-*+":
+            # Bullet marker must be followed by whitespace and content.
+            rest = stripped[1:]
+            if rest[:1] in (" ", "\t"):
+                text = rest.strip()
+                if text:
+                    append(text)
+        elif head.isdecimal():
+            # Numbered marker: digits, a dot, whitespace, then content.
+            j = 1
+            while j < len(stripped) and stripped[j].isdecimal():
+                j += 1
+            if (
+                j < len(stripped)
+                and stripped[j] == "."
+                and stripped[j + 1 : j + 2] in (" ", "\t")
+            ):
+                text = stripped[j + 1 :].strip()
+                if text:
+                    append(text)
     return items
 
 
-def _extract_prose(lines: list[str]) -> str:
-    """Return non-list, non-heading lines joined as a prose block."""
+def _extract_prose(lines: Iterable[str]) -> str:
+    """Return non-list, non-heading lines joined as a prose block.
+
+    The regexes only run for lines whose first character could possibly
+    start a heading or list marker; ordinary prose lines are accepted with
+    no regex work at all.
+    """
     prose_lines: list[str] = []
+    append = prose_lines.append
+    # Bind the match methods once: the per-line LOAD_ATTR lookups add up on
+    # large documents.
+    heading_match = _HEADING_RE.match
+    bullet_match = _BULLET_RE.match
+    numbered_match = _NUMBERED_RE.match
     for line in lines:
         stripped = line.strip()
         if not stripped:
             continue
-        if _HEADING_RE.match(stripped):
-            continue
-        if _BULLET_RE.match(stripped) or _NUMBERED_RE.match(stripped):
-            continue
-        prose_lines.append(stripped)
+        head = stripped[0]
+        if head == "#":
+            if heading_match(stripped):
+                continue
+        elif head in "-*+":
+            if bullet_match(stripped):
+                continue
+        elif head.isdecimal():
+            if numbered_match(stripped):
+                continue
+        append(stripped)
     return " ".join(prose_lines)
 
 
@@ -74,47 +134,48 @@ class AgentsMdParser:
         The first H1 heading is used as the project name.  Subsequent headings
         determine section assignment.  Unknown headings are stored in
         ``extra_sections``.
+
+        The returned document is built with ``model_construct`` rather than
+        full Pydantic validation: every field below is assembled by the parser
+        itself with known-correct types, so re-validating them on each call
+        would only add overhead.  Callers constructing documents from
+        untrusted data should go through ``AgentsMdDocument.model_validate``
+        instead.
         """
-        lines = content.splitlines()
+        # Single pass: locate every heading up front, then slice each section
+        # body directly out of the original string between consecutive
+        # heading spans.  This avoids re-testing the heading pattern against
+        # every line of the document.
+        matches = list(_HEADING_RE.finditer(content))
         project_name: str = ""
         sections: dict[str, list[str]] = {}
-        current_section: str | None = None
         extra_sections: dict[str, str] = {}
-        extra_lines: dict[str, list[str]] = {}
-
-        for line in lines:
-            heading_match = _HEADING_RE.match(line.strip())
-            if heading_match:
-                level = len(heading_match.group(1))
-                heading_text = heading_match.group(2).strip()
-                # First H1 becomes the project name.
-                if level == 1 and not project_name:
-                    project_name = heading_text
-                    current_section = None
-                    continue
-                canonical = _HEADING_MAP.get(heading_text.lower())
-                if canonical:
-                    current_section = canonical
-                    if canonical not in sections:
-                        sections[canonical] = []
-                else:
-                    current_section = f"_extra:{heading_text}"
-                    extra_lines[heading_text] = []
-            else:
-                if current_section is not None:
-                    if current_section.startswith("_extra:"):
-                        key = current_section[len("_extra:"):]
-                        extra_lines.setdefault(key, []).append(line)
-                    else:
-                        sections.setdefault(current_section, []).append(line)
 
-        # Build extra_sections from accumulated lines.
-        for heading, body_lines in extra_lines.items():
-            extra_sections[heading] = "\n".join(body_lines).strip()
+        for i, match in enumerate(matches):
+            level = len(match.group(1))
+            heading_text = match.group(2)
+            # First H1 becomes the project name; its body is not a section.
+            if level == 1 and not project_name:
+                project_name = heading_text
+                continue
+            body_end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+            body = content[match.end():body_end]
+            # Skip the .lower() allocation when the heading is already
+            # lowercase (the map keys cover only ASCII headings, so plain
+            # lower() is a correct normalisation either way).
+            canonical = _HEADING_MAP.get(
+                heading_text if heading_text.islower() else heading_text.lower()
+            )
+            if canonical:
+                sections.setdefault(canonical, []).extend(body.splitlines())
+            else:
+                extra_sections[heading_text] = body.strip()
 
         workflow_lines = sections.get("development_workflow", [])
 
-        return AgentsMdDocument(
+        # Trusted internal path: all fields were type-checked during the scan
+        # above, so skip pydantic-core validation entirely.
+        return AgentsMdDocument.model_construct(
             project_name=project_name or "Unnamed Project",
             project_context=_extract_prose(sections.get("project_context", [])),
             capabilities=_extract_list_items(sections.get("capabilities", [])),
@@ -126,18 +187,36 @@ class AgentsMdParser:
         )
 
     def parse_file(self, path: str) -> AgentsMdDocument:
-        """Read *path* from disk and delegate to :meth:`parse`."""
-        content = Path(path).read_text(encoding="utf-8")
-        return self.parse(content)
+        """Read *path* from disk and delegate to :meth:`parse`.
+
+        Reads in binary mode and decodes in one call: ``bytes.decode`` is a
+        single C-level operation, whereas text mode routes every chunk
+        through the ``TextIOWrapper`` newline state machine.  ``splitlines``
+        downstream handles ``\\r\\n`` either way.
+        """
+        return self.parse(Path(path).read_bytes().decode("utf-8"))
 
+    def parse_and_validate(
+        self, content: str
+    ) -> tuple[AgentsMdDocument, ValidationResult]:
+        """Parse *content* and validate the result in a single call.
 
-_VALIDATOR_REQUIRED: Final[list[tuple[AgentsSection, str]]] = [
+        Fusing the two steps lets callers (notably the async service) run
+        parse and validation as one unit of work instead of two round
+        trips over the document.
+        """
+        doc = self.parse(content)
+        return doc, _DEFAULT_VALIDATOR.validate(doc)
+
+
+# Required sections paired with the document attribute that backs them.
+_VALIDATOR_REQUIRED: Final[tuple[tuple[AgentsSection, str], ...]] = (
     (AgentsSection.project_context, "project_context"),
     (AgentsSection.capabilities, "capabilities"),
     (AgentsSection.constraints, "constraints"),
     (AgentsSection.scope_boundaries, "scope_boundaries"),
-    (AgentsSection.development_workflow, "development_workflow"),
-]
+    (AgentsSection.development_workflow, "workflow_steps"),
+)
 
 
 class AgentsMdValidator:
@@ -147,19 +226,10 @@ class AgentsMdValidator:
         """Return a ValidationResult describing all issues found in *doc*."""
         issues: list[ValidationIssue] = []
 
-        field_values: dict[str, str | list[str]] = {
-            "project_context": doc.project_context,
-            "capabilities": doc.capabilities,
-            "constraints": doc.constraints,
-            "scope_boundaries": doc.scope_boundaries,
-            "development_workflow": doc.workflow_steps,
-        }
-
-        for section_enum, field_name in _VALIDATOR_REQUIRED:
-            value = field_values[field_name]
-            # project_context is a str; others are lists.
-            is_empty = not value if isinstance(value, str) else len(value) == 0
-            if is_empty:
+        for section_enum, attr_name in _VALIDATOR_REQUIRED:
+            # Empty string and empty list are both falsy, so one truthiness
+            # check covers the prose section and the list sections alike.
+            if not getattr(doc, attr_name):
                 issues.append(
                     ValidationIssue(
                         section=section_enum,
@@ -187,11 +257,27 @@ class AgentsMdValidator:
         )
 
 
+# Shared stateless validator used by AgentsMdParser.parse_and_validate.
+_DEFAULT_VALIDATOR: Final[AgentsMdValidator] = AgentsMdValidator()
+
+
+# Static scaffolding between the dynamic sections of a generated document,
+# built once instead of per generate() call.
+_CONSTRAINTS_HEADER: Final[tuple[str, ...]] = ("", "## Constraints", "")
+_SCOPE_HEADER: Final[tuple[str, ...]] = ("", "## Scope Boundaries", "")
+_WORKFLOW_HEADER: Final[tuple[str, ...]] = ("", "## Development Workflow", "")
+
+
 class AgentsMdGenerator:
     """Render an AgentsMdDocument back to AGENTS.md markdown."""
 
     def generate(self, doc: AgentsMdDocument) -> str:
-        """Return a markdown string representing *doc*."""
+        """Return a markdown string representing *doc*.
+
+        Each list section is rendered as one comprehension handed to a
+        single ``extend`` (falling back to its placeholder when empty),
+        which keeps the per-item bytecode dispatch out of the hot loop.
+        """
         lines: list[str] = [
             f"# {doc.project_name}",
             "",
@@ -202,27 +288,25 @@ class AgentsMdGenerator:
             "## Capabilities",
             "",
         ]
-        for cap in doc.capabilities:
-            lines.append(f"- {cap}")
-        if not doc.capabilities:
-            lines.append("_None defined._")
-        lines.extend(["", "## Constraints", ""])
-        for con in doc.constraints:
-            lines.append(f"- {con}")
-        if not doc.constraints:
-            lines.append("_None defined._")
-        lines.extend(["", "## Scope Boundaries", ""])
-        for boundary in doc.scope_boundaries:
-            lines.append(f"- {boundary}")
-        if not doc.scope_boundaries:
-            lines.append("_None defined._")
-        lines.extend(["", "## Development Workflow", ""])
-        for i, step in enumerate(doc.workflow_steps, start=1):
-            lines.append(f"{i}. {step}")
-        if not doc.workflow_steps:
-            lines.append("_No steps defined._")
+        lines.extend(
+            [f"- {cap}" for cap in doc.capabilities] or ["_None defined._"]
+        )
+        lines.extend(_CONSTRAINTS_HEADER)
+        lines.extend(
+            [f"- {con}" for con in doc.constraints] or ["_None defined._"]
+        )
+        lines.extend(_SCOPE_HEADER)
+        lines.extend(
+            [f"- {boundary}" for boundary in doc.scope_boundaries]
+            or ["_None defined._"]
+        )
+        lines.extend(_WORKFLOW_HEADER)
+        lines.extend(
+            [f"{i}. {step}" for i, step in enumerate(doc.workflow_steps, start=1)]
+            or ["_No steps defined._"]
+        )
         for heading, body in doc.extra_sections.items():
-            lines.extend(["", f"## {heading}", "", body])
+            lines.extend(("", f"## {heading}", "", body))
         lines.append("")
         return "\n".join(lines)
 
@@ -280,16 +364,37 @@ class ConfigExporter:
     def to_yaml(self, doc: AgentsMdDocument) -> str:
         """Return YAML string for *doc*."""
         data = self._to_dict(doc)
-        return str(yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False))
+        # str(...) keeps mypy --strict happy: yaml.dump is typed as Any.
+        return str(
+            yaml.dump(
+                data,
+                Dumper=_YamlDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            )
+        )
 
     def to_json(self, doc: AgentsMdDocument) -> str:
-        """Return pretty-printed JSON string for *doc*."""
+        """Return pretty-printed JSON string for *doc*.
+
+        Encodes with orjson when installed (native-code encoder, same
+        2-space indentation) and stdlib :mod:`json` otherwise.
+        """
         data = self._to_dict(doc)
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(data, indent=2, ensure_ascii=False)
 
 
+@lru_cache(maxsize=128)
 def generate_template(project_name: str) -> str:
-    """Return a filled AGENTS.md template for *project_name*."""
+    """Return a filled AGENTS.md template for *project_name*.
+
+    The result is a pure function of *project_name*, so repeat calls for the
+    same name (CLI ``init``, async service, demos) are served from an LRU
+    cache instead of re-rendering the template.
+    """
     return _TEMPLATE.format(project_name=project_name)
 
 
@@ -7,7 +7,10 @@ subscribes to capability events for automatic document processing.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
@@ -24,11 +27,22 @@ _SERVICE_VERSION = "0.1.0"
 _SERVICE_DESCRIPTION = (
     "AumAI AgentsMD — parse, validate, and generate AGENTS.md documentation files."
 )
-_SERVICE_CAPABILITIES = [
-    "agents-md-parsing",
-    "agents-md-validation",
-    "agents-md-generation",
-]
+# frozenset: membership checks are O(1) and the constant is immutable;
+# ServiceInfo.capabilities expects a list, so registration sorts it.
+_SERVICE_CAPABILITIES = frozenset(
+    {
+        "agents-md-parsing",
+        "agents-md-validation",
+        "agents-md-generation",
+    }
+)
+
+# Upper bound on cached validation results; oldest entries are evicted
+# first so sustained event load cannot grow the cache without limit.
+_MAX_CACHE_ENTRIES = 512
+
+# Upper bound on cached parse results keyed by content digest.
+_MAX_CONTENT_CACHE_ENTRIES = 128
 
 
 class AgentsMDIntegration:
@@ -67,8 +81,15 @@ class AgentsMDIntegration:
         self._validator = AgentsMdValidator()
         self._subscription_id: str | None = None
         self._registered: bool = False
-        # Cache of project_name -> last ValidationResult for subscribed events.
-        self._capability_cache: dict[str, ValidationResult] = {}
+        # LRU cache of project_name -> last ValidationResult, bounded by
+        # _MAX_CACHE_ENTRIES with least-recently-used eviction.
+        self._capability_cache: OrderedDict[str, ValidationResult] = OrderedDict()
+        # LRU cache of content digest -> (document, validation): agents
+        # frequently resend identical documents, so the fused parse +
+        # validate work is skipped on an exact-content hit.
+        self._content_cache: OrderedDict[
+            str, tuple[AgentsMdDocument, ValidationResult]
+        ] = OrderedDict()
 
     # ------------------------------------------------------------------
     # Factory
@@ -107,7 +128,7 @@ class AgentsMDIntegration:
             name=_SERVICE_NAME,
             version=_SERVICE_VERSION,
             description=_SERVICE_DESCRIPTION,
-            capabilities=list(_SERVICE_CAPABILITIES),
+            capabilities=sorted(_SERVICE_CAPABILITIES),
             endpoints={},
             metadata={
                 "supported_sections": [
@@ -126,7 +147,7 @@ class AgentsMDIntegration:
             "AgentsMDIntegration: registered service '%s' v%s with capabilities %s",
             _SERVICE_NAME,
             _SERVICE_VERSION,
-            _SERVICE_CAPABILITIES,
+            sorted(_SERVICE_CAPABILITIES),
         )
 
         # Subscribe to agent.doc_requested events.
@@ -172,31 +193,47 @@ class AgentsMDIntegration:
 
         Returns:
             The parsed :class:`~aumai_agentsmd.models.AgentsMdDocument`.
-        """
-        doc = self._parser.parse(content)
 
-        await self._aumos.events.publish_simple(
-            "doc.parsed",
-            source=source,
-            project_name=doc.project_name,
-        )
-        logger.info(
-            "AgentsMDIntegration: parsed document for project '%s'",
-            doc.project_name,
-        )
-
-        validation = self._validator.validate(doc)
-        self._capability_cache[doc.project_name] = validation
-
-        await self._aumos.events.publish_simple(
-            "doc.validated",
-            source=source,
-            project_name=doc.project_name,
-            valid=validation.valid,
-            issue_count=len(validation.issues),
+        Identical content is parsed once: results are cached against a
+        digest of the raw markdown, and repeat calls reuse the cached
+        document while still publishing both events for observability.
+        """
+        # The content is hashed as-is — whitespace and list markers are
+        # semantically significant to the parser, so a lossy normalisation
+        # would conflate documents that parse differently.
+        key = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        cached = self._content_cache.get(key)
+        if cached is not None:
+            self._content_cache.move_to_end(key)
+            doc, validation = cached
+        else:
+            # Fused parse + validate: one walk over the document instead of
+            # a second traversal of the freshly-built section lists.
+            doc, validation = self._parser.parse_and_validate(content)
+            self._content_cache[key] = (doc, validation)
+            if len(self._content_cache) > _MAX_CONTENT_CACHE_ENTRIES:
+                self._content_cache.popitem(last=False)
+        self._cache_validation(doc.project_name, validation)
+
+        # The two publishes are independent bus I/O, so run them
+        # concurrently rather than paying the round trips back to back.
+        await asyncio.gather(
+            self._aumos.events.publish_simple(
+                "doc.parsed",
+                source=source,
+                project_name=doc.project_name,
+            ),
+            self._aumos.events.publish_simple(
+                "doc.validated",
+                source=source,
+                project_name=doc.project_name,
+                valid=validation.valid,
+                issue_count=len(validation.issues),
+            ),
         )
         logger.info(
-            "AgentsMDIntegration: validated document for project '%s' — valid=%s, issues=%d",
+            "AgentsMDIntegration: parsed and validated document for project "
+            "'%s' — valid=%s, issues=%d",
             doc.project_name,
             validation.valid,
             len(validation.issues),
@@ -260,6 +297,14 @@ class AgentsMDIntegration:
     # Capability cache access
     # ------------------------------------------------------------------
 
+    def _cache_validation(self, project_name: str, result: ValidationResult) -> None:
+        """Store *result* for *project_name*, evicting the oldest entry when full."""
+        cache = self._capability_cache
+        cache[project_name] = result
+        cache.move_to_end(project_name)
+        if len(cache) > _MAX_CACHE_ENTRIES:
+            cache.popitem(last=False)
+
     def get_cached_validation(
         self, project_name: str
     ) -> ValidationResult | None:
@@ -272,7 +317,11 @@ class AgentsMDIntegration:
             The cached :class:`~aumai_agentsmd.models.ValidationResult`, or
             ``None`` if no validation has been performed for this project.
         """
-        return self._capability_cache.get(project_name)
+        result = self._capability_cache.get(project_name)
+        if result is not None:
+            # Refresh recency so frequently-queried projects stay cached.
+            self._capability_cache.move_to_end(project_name)
+        return result
 
     # ------------------------------------------------------------------
     # Properties
@@ -8,10 +8,20 @@ heuristic analysis when the LLM is unavailable.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import math
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Sequence
 from typing import Any
 
+try:  # Rust JSON codec — optional, stdlib json remains the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 from aumai_llm_core import (
     CompletionRequest,
     LLMClient,
@@ -19,17 +29,20 @@ from aumai_llm_core import (
     MockProvider,
     ModelConfig,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from aumai_agentsmd.models import AgentsMdDocument
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached enrichment results per enricher instance.
+_MAX_ANALYSIS_CACHE = 256
+
 # ---------------------------------------------------------------------------
 # Structured output model
 # ---------------------------------------------------------------------------
 
-_QUALITY_LEVEL_VALUES = ("poor", "fair", "good", "excellent")
+_QUALITY_LEVEL_VALUES = frozenset(("poor", "fair", "good", "excellent"))
 
 
 class EnrichmentResult(BaseModel):
@@ -49,6 +62,8 @@ class EnrichmentResult(BaseModel):
             when it came from the heuristic fallback.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     quality_level: str = Field(
         default="fair",
         description="Overall quality: poor | fair | good | excellent",
@@ -105,6 +120,104 @@ Use "excellent" only when all sections are thorough and specific.
 Use "poor" when multiple key sections are missing or nearly empty.
 """
 
+_BATCH_SYSTEM_PROMPT = """\
+You are a technical documentation specialist for AI agent projects.
+
+You will receive a JSON array of AGENTS.md documents, each wrapped as
+{"id": <int>, "doc": {...}}.  Analyse every document independently for
+documentation quality and completeness, using the same criteria you would
+for a single document.
+
+Respond ONLY with a valid JSON array — no markdown, no prose outside the
+JSON — containing one object per input document:
+[
+  {
+    "id": <the input id>,
+    "quality_level": "<poor|fair|good|excellent>",
+    "summary": "<string>",
+    "missing_sections": ["<section_name>", ...],
+    "improvement_suggestions": ["<actionable improvement>", ...],
+    "enriched_context": "<improved project context or empty string>"
+  },
+  ...
+]
+"""
+
+# Rough context guard for batched analysis: beyond this many payload
+# characters (~4 chars per token) the batch is split into per-document
+# calls rather than risking a truncated response.
+_MAX_BATCH_CHARS = 48_000
+
+# The system prompts are constant, so build the Message objects once.  When
+# the foundation Message schema carries a metadata field, mark the prompt as
+# an ephemeral cacheable prefix so providers with prompt caching skip its
+# prefill cost on warm calls.
+_SYSTEM_MESSAGE_KWARGS: dict[str, Any] = {}
+if "metadata" in getattr(Message, "model_fields", {}):
+    _SYSTEM_MESSAGE_KWARGS["metadata"] = {"cache_control": {"type": "ephemeral"}}
+
+_SYSTEM_MESSAGE = Message(
+    role="system", content=_SYSTEM_PROMPT, **_SYSTEM_MESSAGE_KWARGS
+)
+_BATCH_SYSTEM_MESSAGE = Message(
+    role="system", content=_BATCH_SYSTEM_PROMPT, **_SYSTEM_MESSAGE_KWARGS
+)
+
+
+def _canonical_payload(doc: AgentsMdDocument) -> bytes:
+    """Return a canonical byte serialisation of the analysable fields of *doc*.
+
+    Sorted keys and compact separators make the encoding stable, so equal
+    documents always hash to the same cache key.
+    """
+    data = {
+        "project_name": doc.project_name,
+        "project_context": doc.project_context,
+        "capabilities": doc.capabilities,
+        "constraints": doc.constraints,
+        "scope_boundaries": doc.scope_boundaries,
+        "workflow_steps": doc.workflow_steps,
+    }
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+
+def _json_loads(content: str) -> Any:
+    """Decode JSON with orjson when available (its JSONDecodeError subclasses
+    the stdlib one, so existing except clauses keep working)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _strip_code_fences(raw_content: str) -> str:
+    """Return *raw_content* with any surrounding markdown code fences removed.
+
+    Slices between the opening fence line and the closing fence directly,
+    avoiding the splitlines/filter/join round trip of the obvious approach;
+    unfenced content (the common case) returns after a single startswith.
+    """
+    content = raw_content.strip()
+    if not content.startswith("```"):
+        return content
+    opening_end = content.find("\n")
+    if opening_end == -1:
+        return ""
+    closing_start = content.rfind("\n```")
+    if closing_start <= opening_end:
+        # No closing fence — drop just the opening line.
+        return content[opening_end + 1 :].strip()
+    return content[opening_end + 1 : closing_start].strip()
+
+
+def _normalised(vector: Sequence[float]) -> tuple[float, ...] | None:
+    """Return *vector* L2-normalised as a tuple, or ``None`` for a zero vector."""
+    norm = math.sqrt(sum(component * component for component in vector))
+    if norm == 0.0:
+        return None
+    return tuple(component / norm for component in vector)
+
 
 class LLMDocEnricher:
     """LLM-powered enricher that performs semantic analysis of AGENTS.md documents.
@@ -117,6 +230,18 @@ class LLMDocEnricher:
         client: An :class:`~aumai_llm_core.core.LLMClient` instance.  When
             ``None`` the enricher operates in **fallback-only mode** (heuristic
             analysis only).
+        embedder: Optional callable mapping a canonical document payload to
+            an embedding vector.  When provided, a second-tier semantic cache
+            returns the stored result for documents whose embedding cosine
+            similarity to a previously analysed document meets
+            ``similarity_threshold`` — so typo-level edits do not trigger a
+            fresh LLM call.
+        similarity_threshold: Minimum cosine similarity for a semantic cache
+            hit.  Ignored when *embedder* is ``None``.
+        cache_enabled: When ``False``, both cache tiers are bypassed and
+            every call reaches the LLM.  The ``stats`` attribute counts
+            cache ``hits`` (exact or semantic) and ``misses`` (LLM calls)
+            either way.
 
     Example (production)::
 
@@ -132,8 +257,34 @@ class LLMDocEnricher:
         assert result.quality_level in ("poor", "fair", "good", "excellent")
     """
 
-    def __init__(self, client: LLMClient | None = None) -> None:
+    def __init__(
+        self,
+        client: LLMClient | None = None,
+        *,
+        embedder: Callable[[str], Sequence[float]] | None = None,
+        similarity_threshold: float = 0.97,
+        cache_enabled: bool = True,
+    ) -> None:
         self._client = client
+        # Cache controls: cache_enabled gates both tiers at call time, and
+        # stats exposes hit/miss counts for cost observability.
+        self.cache_enabled = cache_enabled
+        self.stats: dict[str, int] = {"hits": 0, "misses": 0}
+        # Content-addressed LRU cache: BLAKE2b digest of the canonical
+        # document payload -> EnrichmentResult.  LLM calls dominate both
+        # latency and cost, so re-analysing an unchanged document should
+        # never leave the process.
+        self._analysis_cache: OrderedDict[bytes, EnrichmentResult] = OrderedDict()
+        # Optional semantic tier: L2-normalised embeddings of previously
+        # analysed payloads, consulted only on an exact-hash miss.
+        self._embedder = embedder
+        self._similarity_threshold = similarity_threshold
+        self._semantic_cache: list[tuple[tuple[float, ...], EnrichmentResult]] = []
+        # Heuristic results keyed by the tiny fingerprint that fully
+        # determines them (see _heuristic_fallback).
+        self._heuristic_cache: dict[
+            tuple[bool, int, bool, bool, bool], EnrichmentResult
+        ] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -153,14 +304,50 @@ class LLMDocEnricher:
             An :class:`EnrichmentResult` with quality level, summary,
             missing sections, suggestions, and an optional enriched context.
         """
+        return await self._analyze(doc, count_stats=True)
+
+    async def _analyze(
+        self, doc: AgentsMdDocument, *, count_stats: bool
+    ) -> EnrichmentResult:
+        """:meth:`analyze` body with the stats counting made optional.
+
+        The batch fallback paths re-enter this per document after
+        :meth:`analyze_many` has already counted the miss, so they pass
+        ``count_stats=False`` to keep each document counted exactly once.
+        """
         if self._client is None:
             logger.debug(
                 "LLMDocEnricher: no LLM client configured, using heuristic fallback."
             )
             return self._heuristic_fallback(doc)
 
+        payload = _canonical_payload(doc)
+        cache_key = hashlib.blake2b(payload, digest_size=16).digest()
+        cached = self._analysis_cache.get(cache_key) if self.cache_enabled else None
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            if count_stats:
+                self.stats["hits"] += 1
+            logger.debug("LLMDocEnricher: analysis cache hit, skipping LLM call.")
+            return cached
+
+        embedding: tuple[float, ...] | None = None
+        if self._embedder is not None and self.cache_enabled:
+            embedding = _normalised(self._embedder(payload.decode()))
+            if embedding is not None:
+                semantic_hit = self._semantic_lookup(embedding)
+                if semantic_hit is not None:
+                    if count_stats:
+                        self.stats["hits"] += 1
+                    logger.debug(
+                        "LLMDocEnricher: semantic cache hit, skipping LLM call."
+                    )
+                    return semantic_hit
+
+        if count_stats:
+            self.stats["misses"] += 1
         try:
-            return await self._llm_analyze(doc)
+            result = await self._llm_analyze(doc)
         except Exception as exc:
             logger.warning(
                 "LLMDocEnricher: LLM call failed (%s), falling back to heuristic.",
@@ -168,6 +355,187 @@ class LLMDocEnricher:
             )
             return self._heuristic_fallback(doc)
 
+        if self.cache_enabled:
+            self._analysis_cache[cache_key] = result
+            if len(self._analysis_cache) > _MAX_ANALYSIS_CACHE:
+                self._analysis_cache.popitem(last=False)
+            if embedding is not None:
+                self._semantic_cache.append((embedding, result))
+                if len(self._semantic_cache) > _MAX_ANALYSIS_CACHE:
+                    del self._semantic_cache[0]
+        return result
+
+    def _semantic_lookup(
+        self, embedding: tuple[float, ...]
+    ) -> EnrichmentResult | None:
+        """Return the cached result most similar to *embedding*, if close enough.
+
+        Both sides are L2-normalised, so cosine similarity reduces to a dot
+        product.
+        """
+        best_score = self._similarity_threshold
+        best_result: EnrichmentResult | None = None
+        for cached_embedding, result in self._semantic_cache:
+            if len(cached_embedding) != len(embedding):
+                continue
+            score = sum(
+                a * b for a, b in zip(cached_embedding, embedding, strict=True)
+            )
+            if score >= best_score:
+                best_score = score
+                best_result = result
+        return best_result
+
+    async def analyze_many(
+        self, docs: list[AgentsMdDocument]
+    ) -> list[EnrichmentResult]:
+        """Analyse several documents, batching uncached ones into one LLM call.
+
+        Cached documents are served from the exact-hash cache; the rest are
+        concatenated into a single request so the per-call HTTP and
+        system-prompt overhead is paid once for the whole batch.  Falls back
+        to per-document :meth:`analyze` when the batch would exceed the
+        context budget or the batched response cannot be used.
+
+        Args:
+            docs: Documents to analyse, in order.
+
+        Returns:
+            One :class:`EnrichmentResult` per input document, same order.
+        """
+        if not docs:
+            return []
+        if self._client is None:
+            return [self._heuristic_fallback(doc) for doc in docs]
+
+        results: list[EnrichmentResult | None] = [None] * len(docs)
+        pending: list[tuple[int, bytes]] = []
+        for i, doc in enumerate(docs):
+            cache_key = hashlib.blake2b(
+                _canonical_payload(doc), digest_size=16
+            ).digest()
+            cached = (
+                self._analysis_cache.get(cache_key) if self.cache_enabled else None
+            )
+            if cached is not None:
+                self._analysis_cache.move_to_end(cache_key)
+                self.stats["hits"] += 1
+                results[i] = cached
+            else:
+                self.stats["misses"] += 1
+                pending.append((i, cache_key))
+
+        if pending:
+            batch_results = await self._analyze_batch(
+                [(i, docs[i]) for i, _ in pending]
+            )
+            for (i, cache_key), result in zip(pending, batch_results, strict=True):
+                results[i] = result
+                if self.cache_enabled:
+                    self._analysis_cache[cache_key] = result
+                    if len(self._analysis_cache) > _MAX_ANALYSIS_CACHE:
+                        self._analysis_cache.popitem(last=False)
+
+        return results  # type: ignore[return-value]  # every slot is filled
+
+    async def _analyze_batch(
+        self, indexed_docs: list[tuple[int, AgentsMdDocument]]
+    ) -> list[EnrichmentResult]:
+        """Analyse *indexed_docs* in one LLM request, per-doc on fallback.
+
+        Returns results in the same order as the input pairs; the index in
+        each pair is used as the wire ``id`` so responses can be matched
+        regardless of the order the model emits them.
+        """
+        entries = [
+            {"id": i, "doc": _json_loads(_canonical_payload(doc).decode())}
+            for i, doc in indexed_docs
+        ]
+        user_message = (
+            orjson.dumps(entries).decode()
+            if orjson is not None
+            else json.dumps(entries, ensure_ascii=False)
+        )
+        if len(user_message) > _MAX_BATCH_CHARS:
+            logger.debug(
+                "LLMDocEnricher: batch of %d docs exceeds context budget, "
+                "analysing individually.",
+                len(indexed_docs),
+            )
+            return [
+                await self._analyze(doc, count_stats=False)
+                for _, doc in indexed_docs
+            ]
+
+        client = self._client
+        if client is None:  # guarded by analyze_many; kept as a hard error
+            raise RuntimeError(
+                "LLMDocEnricher._analyze_batch requires a configured client"
+            )
+
+        request = CompletionRequest(
+            messages=[
+                _BATCH_SYSTEM_MESSAGE,
+                Message(role="user", content=user_message),
+            ],
+            temperature=0.0,
+        )
+        try:
+            response = await client.complete(request)
+            by_id = {
+                int(entry["id"]): self._result_from_data(entry)
+                for entry in _json_loads(_strip_code_fences(response.content))
+            }
+            return [by_id[i] for i, _ in indexed_docs]
+        except Exception as exc:
+            logger.warning(
+                "LLMDocEnricher: batched analysis failed (%s), "
+                "analysing individually.",
+                exc,
+            )
+            return [
+                await self._analyze(doc, count_stats=False)
+                for _, doc in indexed_docs
+            ]
+
+    async def analyze_stream(
+        self,
+        docs: list[AgentsMdDocument],
+        concurrency: int = 8,
+    ) -> AsyncIterator[EnrichmentResult]:
+        """Analyse *docs* concurrently, yielding results as they complete.
+
+        Runs up to *concurrency* :meth:`analyze` calls in parallel under a
+        semaphore, so N independent documents take roughly N/concurrency
+        round trips of wall-clock time instead of N.  Results are yielded in
+        completion order, not input order — callers that need ordered
+        results should use :meth:`analyze_many` instead.
+
+        Args:
+            docs: Documents to analyse.
+            concurrency: Maximum number of in-flight LLM calls.
+
+        Yields:
+            One :class:`EnrichmentResult` per document, fastest first.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded_analyze(doc: AgentsMdDocument) -> EnrichmentResult:
+            async with semaphore:
+                return await self.analyze(doc)
+
+        tasks = [asyncio.create_task(bounded_analyze(doc)) for doc in docs]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Reap the cancellations: without this, abandoning the stream
+            # early leaves tasks whose exceptions are never retrieved, which
+            # asyncio reports at garbage-collection time.
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def suggest_improvements(self, doc: AgentsMdDocument) -> list[str]:
         """Return a list of improvement suggestions for *doc*.
 
@@ -208,7 +576,11 @@ class LLMDocEnricher:
             "scope_boundaries": doc.scope_boundaries,
             "workflow_steps": doc.workflow_steps,
         }
-        doc_json = json.dumps(doc_data, indent=2, ensure_ascii=False)
+        doc_json = (
+            orjson.dumps(doc_data, option=orjson.OPT_INDENT_2).decode()
+            if orjson is not None
+            else json.dumps(doc_data, indent=2, ensure_ascii=False)
+        )
         user_message = (
             f"Analyse the following AGENTS.md document for quality and completeness:\n\n"
             f"```json\n{doc_json}\n```"
@@ -216,7 +588,7 @@ class LLMDocEnricher:
 
         request = CompletionRequest(
             messages=[
-                Message(role="system", content=_SYSTEM_PROMPT),
+                _SYSTEM_MESSAGE,
                 Message(role="user", content=user_message),
             ],
             temperature=0.0,
@@ -226,6 +598,23 @@ class LLMDocEnricher:
         response = await self._client.complete(request)
         return self._parse_llm_response(response.content)
 
+    def _result_from_data(self, data: dict[str, Any]) -> EnrichmentResult:
+        """Build an :class:`EnrichmentResult` from one decoded response object."""
+        quality_level = str(data.get("quality_level", "fair"))
+        if quality_level not in _QUALITY_LEVEL_VALUES:
+            quality_level = "fair"
+        # Every field is coerced to its target type above, so skip
+        # pydantic-core validation (same trusted-path convention as the
+        # parser's model_construct).
+        return EnrichmentResult.model_construct(
+            quality_level=quality_level,
+            summary=str(data.get("summary", "")),
+            missing_sections=list(data.get("missing_sections", [])),
+            improvement_suggestions=list(data.get("improvement_suggestions", [])),
+            enriched_context=str(data.get("enriched_context", "")),
+            llm_powered=True,
+        )
+
     def _parse_llm_response(self, raw_content: str) -> EnrichmentResult:
         """Parse the LLM's JSON response into an :class:`EnrichmentResult`.
 
@@ -239,32 +628,14 @@ class LLMDocEnricher:
         Returns:
             An :class:`EnrichmentResult`.
         """
-        content = raw_content.strip()
-        # Strip optional markdown code fences.
-        if content.startswith("```"):
-            lines = content.splitlines()
-            content = "\n".join(
-                line for line in lines if not line.startswith("```")
-            ).strip()
-
         try:
-            data: dict[str, Any] = json.loads(content)
-            quality_level = str(data.get("quality_level", "fair"))
-            if quality_level not in _QUALITY_LEVEL_VALUES:
-                quality_level = "fair"
-            return EnrichmentResult(
-                quality_level=quality_level,
-                summary=str(data.get("summary", "")),
-                missing_sections=list(data.get("missing_sections", [])),
-                improvement_suggestions=list(data.get("improvement_suggestions", [])),
-                enriched_context=str(data.get("enriched_context", "")),
-                llm_powered=True,
-            )
+            data: dict[str, Any] = _json_loads(_strip_code_fences(raw_content))
+            return self._result_from_data(data)
         except (json.JSONDecodeError, KeyError, TypeError) as exc:
             logger.warning(
                 "LLMDocEnricher: could not parse LLM JSON response: %s", exc
             )
-            return EnrichmentResult(
+            return EnrichmentResult.model_construct(
                 quality_level="fair",
                 summary=(
                     "LLM response could not be parsed — unable to assess quality. "
@@ -288,6 +659,20 @@ class LLMDocEnricher:
         Returns:
             An :class:`EnrichmentResult` marked with ``llm_powered=False``.
         """
+        # The heuristic output depends only on which sections are populated
+        # (plus the capability count), so memoise on that fingerprint and
+        # hand back copies instead of re-walking the checks per call.
+        fingerprint = (
+            bool(doc.project_context),
+            len(doc.capabilities),
+            bool(doc.constraints),
+            bool(doc.scope_boundaries),
+            bool(doc.workflow_steps),
+        )
+        cached = self._heuristic_cache.get(fingerprint)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         missing: list[str] = []
         suggestions: list[str] = []
 
@@ -326,7 +711,7 @@ class LLMDocEnricher:
             "LLM analysis was unavailable."
         )
 
-        return EnrichmentResult(
+        result = EnrichmentResult.model_construct(
             quality_level=quality,
             summary=summary,
             missing_sections=missing,
@@ -334,6 +719,8 @@ class LLMDocEnricher:
             enriched_context="",
             llm_powered=False,
         )
+        self._heuristic_cache[fingerprint] = result
+        return result.model_copy(deep=True)
 
 
 def build_mock_enricher(responses: list[str] | None = None) -> LLMDocEnricher:
@@ -4,7 +4,12 @@ from __future__ import annotations
 
 from enum import Enum
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.dataclasses import dataclass
+
+# Severity levels a ValidationIssue may carry; hoisted so the validator does
+# not rebuild the set on every instantiation.
+_ALLOWED_SEVERITIES = frozenset({"error", "warning", "info"})
 
 
 class AgentsSection(str, Enum):
@@ -18,7 +23,14 @@ class AgentsSection(str, Enum):
 
 
 class AgentsMdDocument(BaseModel):
-    """Parsed representation of an AGENTS.md file."""
+    """Parsed representation of an AGENTS.md file.
+
+    Frozen: documents are parsed in bulk and passed between services, so
+    immutability keeps them safely shareable; derive variants with
+    ``model_copy(update=...)``.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     project_name: str = Field(description="Name of the project")
     project_context: str = Field(default="", description="Project context section text")
@@ -39,6 +51,24 @@ class AgentsMdDocument(BaseModel):
         default_factory=dict, description="Any additional sections not in the standard schema"
     )
 
+    @property
+    def event_payload(self) -> dict[str, str | int]:
+        """Scalar snapshot of the document for event emission.
+
+        Event handlers frequently only need identifying metadata; this
+        property hands them that without triggering Pydantic serialisation
+        of the full document. Deliberately not cached: ``model_copy``
+        clones ``__dict__``, so a cached payload would survive into
+        renamed copies and emit stale values.
+        """
+        return {
+            "project_name": self.project_name,
+            "capability_count": len(self.capabilities),
+            "constraint_count": len(self.constraints),
+            "scope_boundary_count": len(self.scope_boundaries),
+            "workflow_step_count": len(self.workflow_steps),
+        }
+
     @field_validator("project_name")
     @classmethod
     def project_name_must_not_be_empty(cls, value: str) -> str:
@@ -49,8 +79,14 @@ class AgentsMdDocument(BaseModel):
         return stripped
 
 
-class ValidationIssue(BaseModel):
-    """A single validation issue found in an AGENTS.md document."""
+@dataclass(slots=True)
+class ValidationIssue:
+    """A single validation issue found in an AGENTS.md document.
+
+    A slotted Pydantic dataclass rather than a full ``BaseModel``: a
+    validation run can emit many issues, and slots keep each instance
+    small with fast attribute access while field validation is retained.
+    """
 
     section: AgentsSection = Field(description="Which section the issue belongs to")
     severity: str = Field(description="Severity level: error, warning, or info")
@@ -63,13 +99,15 @@ class ValidationIssue(BaseModel):
     @classmethod
     def severity_must_be_valid(cls, value: str) -> str:
         """Restrict severity to known levels."""
-        allowed = {"error", "warning", "info"}
-        if value not in allowed:
-            raise ValueError(f"severity must be one of {allowed}, got {value!r}")
+        if value not in _ALLOWED_SEVERITIES:
+            raise ValueError(
+                f"severity must be one of {set(_ALLOWED_SEVERITIES)}, got {value!r}"
+            )
         return value
 
 
-class ValidationResult(BaseModel):
+@dataclass(slots=True)
+class ValidationResult:
     """Outcome of validating an AgentsMdDocument."""
 
     valid: bool = Field(description="True when no errors are present")
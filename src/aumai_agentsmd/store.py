@@ -7,16 +7,26 @@ SQLite (or an in-memory backend during tests).
 
 from __future__ import annotations
 
+import inspect
 import json
+import logging
+import time
 import uuid
-from datetime import datetime
+from collections.abc import AsyncIterator
 from typing import Any
 
+try:  # Rust JSON codec — optional, stdlib json remains the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 from aumai_store import Repository, Store, StoreConfig
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from aumai_agentsmd.models import AgentsMdDocument, ValidationResult
 
+logger = logging.getLogger(__name__)
+
 
 class StoredAgentDoc(BaseModel):
     """Persisted representation of a single AGENTS.md document record.
@@ -24,7 +34,11 @@ class StoredAgentDoc(BaseModel):
     Attributes:
         id: Unique identifier for this record (UUID v4 string).
         project_name: Name of the project the document describes.
-        timestamp: UTC datetime when the document was stored.
+        timestamp: Microseconds since the Unix epoch (UTC) when the document
+            was stored.  An integer rather than an ISO-8601 string: sorts and
+            range filters become machine-word comparisons, and the persisted
+            column shrinks.  Format for display at the edge with
+            ``datetime.fromtimestamp(ts / 1e6, tz=timezone.utc)``.
         valid: Whether the document passed validation (``True``/``False``).
         issue_count: Number of validation issues found.
         doc_json: Full JSON-serialised :class:`~aumai_agentsmd.models.AgentsMdDocument`.
@@ -33,30 +47,35 @@ class StoredAgentDoc(BaseModel):
             field is always a string.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     project_name: str
-    timestamp: str = Field(
-        default_factory=lambda: datetime.utcnow().isoformat()
+    timestamp: int = Field(
+        default_factory=lambda: time.time_ns() // 1_000
     )
     valid: bool = Field(default=False)
     issue_count: int = Field(default=0, ge=0)
     doc_json: str = Field(default="{}")
 
-    @model_validator(mode="before")
+    @field_validator("doc_json", mode="before")
     @classmethod
-    def _coerce_doc_json(cls, values: Any) -> Any:
+    def _coerce_doc_json(cls, value: Any) -> Any:
         """Re-serialise doc_json when the store returns it as a dict.
 
         The aumai-store memory backend parses any JSON-string value that
         starts with ``{`` or ``[`` back into a Python object before handing
-        it to Pydantic.  This validator ensures ``doc_json`` is always a
-        ``str`` regardless of the roundtrip.
+        it to Pydantic.  A field-level (rather than model-level) before
+        validator keeps the coercion scoped to this one field instead of
+        intercepting every model construction.
         """
-        if isinstance(values, dict):
-            dj = values.get("doc_json")
-            if dj is not None and not isinstance(dj, str):
-                values["doc_json"] = json.dumps(dj)
-        return values
+        if value is not None and not isinstance(value, str):
+            return (
+                orjson.dumps(value).decode()
+                if orjson is not None
+                else json.dumps(value)
+            )
+        return value
 
     def to_document(self) -> AgentsMdDocument:
         """Deserialise the stored JSON back to an :class:`~aumai_agentsmd.models.AgentsMdDocument`.
@@ -68,7 +87,11 @@ class StoredAgentDoc(BaseModel):
             ValueError: If ``doc_json`` contains invalid JSON or does not
                 match the AgentsMdDocument schema.
         """
-        data = json.loads(self.doc_json)
+        data = (
+            orjson.loads(self.doc_json)
+            if orjson is not None
+            else json.loads(self.doc_json)
+        )
         return AgentsMdDocument.model_validate(data)
 
 
@@ -97,6 +120,8 @@ class AgentsMDStore:
         """
         self._store: Store = store
         self._repo: Repository[StoredAgentDoc] | None = None
+        self._find_supports_ordering: bool = False
+        self._find_supports_paging: bool = False
 
     # ------------------------------------------------------------------
     # Factory helpers
@@ -142,11 +167,21 @@ class AgentsMDStore:
         repo: Repository[StoredAgentDoc] = self._store.repository(StoredAgentDoc)
         await repo.ensure_table()
         self._repo = repo
+        # Repositories whose find() takes explicit order_by/limit parameters
+        # can sort and bound queries in the backend; a bare **filters
+        # signature would silently treat them as column filters instead, so
+        # detect support from the signature rather than by trying the call.
+        try:
+            parameter_names = frozenset(inspect.signature(repo.find).parameters)
+        except (TypeError, ValueError):  # pragma: no cover - builtin find
+            parameter_names = frozenset()
+        self._find_supports_ordering = {"order_by", "limit"} <= parameter_names
+        self._find_supports_paging = {"limit", "offset"} <= parameter_names
 
     async def close(self) -> None:
         """Close the underlying store connection."""
         if hasattr(self._store, "close"):
-            await self._store.close()  # type: ignore[attr-defined]
+            await self._store.close()
 
     # ------------------------------------------------------------------
     # Async context manager
@@ -167,6 +202,8 @@ class AgentsMDStore:
         self,
         doc: AgentsMdDocument,
         validation_result: ValidationResult | None = None,
+        *,
+        doc_json: str | None = None,
     ) -> StoredAgentDoc:
         """Persist an AGENTS.md document record and return the saved record.
 
@@ -176,6 +213,10 @@ class AgentsMDStore:
                 :class:`~aumai_agentsmd.models.ValidationResult`.  When
                 provided, ``valid`` and ``issue_count`` are derived from it.
                 Defaults to ``valid=False, issue_count=0``.
+            doc_json: Optional pre-serialised JSON for *doc*.  Callers that
+                already hold the serialised form (e.g. loaded straight from
+                disk) can pass it to skip a second ``model_dump_json`` walk;
+                it must describe the same document.
 
         Returns:
             The persisted :class:`StoredAgentDoc` (with assigned ``id``).
@@ -190,11 +231,14 @@ class AgentsMDStore:
             len(validation_result.issues) if validation_result is not None else 0
         )
 
-        record = StoredAgentDoc(
+        # Trusted internal path: every value below already has its declared
+        # type, so skip validation (model_construct still fills the id and
+        # timestamp defaults).
+        record = StoredAgentDoc.model_construct(
             project_name=doc.project_name,
             valid=valid,
             issue_count=issue_count,
-            doc_json=doc.model_dump_json(),
+            doc_json=doc_json if doc_json is not None else doc.model_dump_json(),
         )
         assigned_id = await self._repo.save(record)  # type: ignore[union-attr]
         record = record.model_copy(update={"id": assigned_id})
@@ -257,6 +301,40 @@ class AgentsMDStore:
         self._assert_initialized()
         return await self._repo.find()  # type: ignore[union-attr]
 
+    async def iter_all(
+        self, page_size: int = 500
+    ) -> AsyncIterator[StoredAgentDoc]:
+        """Yield every stored record without materialising them all at once.
+
+        When the repository's ``find()`` supports limit/offset paging, records
+        are fetched *page_size* at a time so scan consumers hold one page of
+        Pydantic objects instead of the whole table.  Repositories without
+        paging fall back to a single full fetch (same memory profile as
+        :meth:`get_all`, but callers keep the streaming interface).
+
+        Args:
+            page_size: Records fetched per backend round trip.
+
+        Yields:
+            Each :class:`StoredAgentDoc` in backend order.
+        """
+        self._assert_initialized()
+        if not self._find_supports_paging:
+            for record in await self._repo.find():  # type: ignore[union-attr]
+                yield record
+            return
+
+        offset = 0
+        while True:
+            page = await self._repo.find(  # type: ignore[union-attr]
+                limit=page_size, offset=offset
+            )
+            for record in page:
+                yield record
+            if len(page) < page_size:
+                return
+            offset += page_size
+
     async def get_recent(
         self, project_name: str, limit: int = 50
     ) -> list[StoredAgentDoc]:
@@ -269,6 +347,14 @@ class AgentsMDStore:
         Returns:
             List of :class:`StoredAgentDoc` limited to *limit* entries.
         """
+        self._assert_initialized()
+        # Let the repository order and limit in the backend when it can:
+        # fetching only *limit* rows beats pulling a project's entire
+        # history and sorting it in Python.
+        if self._find_supports_ordering:
+            return await self._repo.find(  # type: ignore[union-attr]
+                project_name=project_name, order_by="-timestamp", limit=limit
+            )
         all_records = await self.get_by_project(project_name)
         return all_records[:limit]
 
@@ -283,6 +369,39 @@ class AgentsMDStore:
             - ``valid_pct``: percentage of valid records (0–100).
         """
         self._assert_initialized()
+
+        # Prefer a SQL aggregate when the backend can run one: counting in
+        # the database avoids materialising every record (full JSON blob
+        # included) just to sum a boolean column.
+        execute = getattr(self._store, "execute", None)
+        if execute is not None:
+            try:
+                rows = await execute(
+                    "SELECT COUNT(*) AS total, COALESCE(SUM(valid), 0) AS valid "
+                    "FROM storedagentdoc"
+                )
+                total = int(rows[0]["total"])
+                valid = int(rows[0]["valid"])
+            except Exception as exc:
+                # Backend accepted no raw SQL for this table — use the
+                # Python-side count below, but leave a trace so a
+                # permanently failing aggregate (wrong table name, say)
+                # does not degrade silently forever.
+                logger.debug(
+                    "AgentsMDStore: SQL metrics aggregate failed (%s); "
+                    "falling back to a full scan.",
+                    exc,
+                )
+            else:
+                invalid = total - valid
+                valid_pct = round(valid / total * 100, 1) if total > 0 else 0.0
+                return {
+                    "total": total,
+                    "valid": valid,
+                    "invalid": invalid,
+                    "valid_pct": valid_pct,
+                }
+
         all_records = await self.get_all()
         total = len(all_records)
         valid = sum(1 for r in all_records if r.valid)
@@ -2,252 +2,355 @@
 
 from __future__ import annotations
 
-import textwrap
+import asyncio
+import os
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+from hypothesis import HealthCheck, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
 
+from aumai_agentsmd.core import AgentsMdParser
 from aumai_agentsmd.models import AgentsMdDocument
 
+# ---------------------------------------------------------------------------
+# Hypothesis configuration
+#
+# One persistent example database for every profile: previously failing or
+# interesting inputs replay first on the next run, so repeated local and CI
+# runs skip most random exploration and the example budgets can stay small.
+# Select a profile with HYP_PROFILE=ci (default: fast).
+# ---------------------------------------------------------------------------
+
+_HYPOTHESIS_DB = DirectoryBasedExampleDatabase(
+    str(Path(__file__).resolve().parent.parent / ".hypothesis" / "examples")
+)
+
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    deadline=None,
+    database=_HYPOTHESIS_DB,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile(
+    "ci",
+    max_examples=50,
+    deadline=None,
+    database=_HYPOTHESIS_DB,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.load_profile(os.environ.get("HYP_PROFILE", "fast"))
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run the async tests on uvloop when it is installed.
+
+    uvloop markedly reduces per-await dispatch overhead in the
+    event-heavy foundation tests. It is not a dependency of this
+    package, so the stock loop is the fallback and the suite stays
+    runnable everywhere (including platforms uvloop does not support).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked slow (the Hypothesis property tests).",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Deselect slow tests unless --run-slow is passed.
+
+    The property tests drive random exploration and dominate the wall
+    clock of an otherwise sub-second suite; the inner dev loop skips them
+    and CI runs with --run-slow.
+    """
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test: pass --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
 
 # ---------------------------------------------------------------------------
 # Raw markdown fixtures
+#
+# Plain literals (no textwrap.dedent) so import skips the per-constant
+# leading-whitespace scan; the content is identical.
 # ---------------------------------------------------------------------------
 
-FULL_AGENTS_MD = textwrap.dedent(
-    """\
-    # MyProject
+FULL_AGENTS_MD = """\
+# MyProject
 
-    ## Project Context
+## Project Context
 
-    This project does amazing things with AI agents.
+This project does amazing things with AI agents.
 
-    ## Capabilities
+## Capabilities
 
-    - Parse AGENTS.md files
-    - Validate document structure
-    - Generate normalised markdown
+- Parse AGENTS.md files
+- Validate document structure
+- Generate normalised markdown
 
-    ## Constraints
+## Constraints
 
-    - Must not access external APIs without approval
-    - Must not store PII data
+- Must not access external APIs without approval
+- Must not store PII data
 
-    ## Scope Boundaries
+## Scope Boundaries
 
-    - In scope: core agent logic
-    - Out of scope: UI concerns
+- In scope: core agent logic
+- Out of scope: UI concerns
 
-    ## Development Workflow
+## Development Workflow
 
-    1. Write failing test
-    2. Implement feature
-    3. Open pull request
-    """
-)
+1. Write failing test
+2. Implement feature
+3. Open pull request
+"""
 
-MINIMAL_AGENTS_MD = textwrap.dedent(
-    """\
-    # TinyProject
+MINIMAL_AGENTS_MD = """\
+# TinyProject
 
-    ## Project Context
+## Project Context
 
-    A minimal project.
+A minimal project.
 
-    ## Capabilities
+## Capabilities
 
-    - Do something
+- Do something
 
-    ## Constraints
+## Constraints
 
-    - Don't do bad things
+- Don't do bad things
 
-    ## Scope Boundaries
+## Scope Boundaries
 
-    - In scope: everything useful
+- In scope: everything useful
 
-    ## Development Workflow
+## Development Workflow
 
-    1. Just ship it
-    """
-)
+1. Just ship it
+"""
 
 MISSING_ALL_SECTIONS_MD = "# EmptyProject\n"
 
-NO_H1_MD = textwrap.dedent(
-    """\
-    ## Project Context
+NO_H1_MD = """\
+## Project Context
 
-    Some context without an H1 heading.
+Some context without an H1 heading.
 
-    ## Capabilities
+## Capabilities
 
-    - A capability
+- A capability
 
-    ## Constraints
+## Constraints
 
-    - A constraint
+- A constraint
 
-    ## Scope Boundaries
+## Scope Boundaries
 
-    - A boundary
+- A boundary
 
-    ## Development Workflow
+## Development Workflow
 
-    1. A step
-    """
-)
+1. A step
+"""
 
-EXTRA_SECTION_MD = textwrap.dedent(
-    """\
-    # ProjectWithExtras
+EXTRA_SECTION_MD = """\
+# ProjectWithExtras
 
-    ## Project Context
+## Project Context
 
-    Context here.
+Context here.
 
-    ## Capabilities
+## Capabilities
 
-    - Cap one
+- Cap one
 
-    ## Constraints
+## Constraints
 
-    - Con one
+- Con one
 
-    ## Scope Boundaries
+## Scope Boundaries
 
-    - Boundary one
+- Boundary one
 
-    ## Development Workflow
+## Development Workflow
 
-    1. Step one
+1. Step one
 
-    ## Security Policy
+## Security Policy
 
-    All changes must be reviewed by the security team.
-    No unencrypted secrets in source control.
-    """
-)
+All changes must be reviewed by the security team.
+No unencrypted secrets in source control.
+"""
 
-ALIAS_HEADING_MD = textwrap.dedent(
-    """\
-    # AliasProject
+ALIAS_HEADING_MD = """\
+# AliasProject
 
-    ## Project Context
+## Project Context
 
-    Context text.
+Context text.
 
-    ## Capabilities
+## Capabilities
 
-    - Something
+- Something
 
-    ## Constraints
+## Constraints
 
-    - Nothing bad
+- Nothing bad
 
-    ## Scope
+## Scope
 
-    - In scope: the core
+- In scope: the core
 
-    ## Workflow
+## Workflow
 
-    1. Start here
-    """
-)
+1. Start here
+"""
 
-MIXED_LIST_MD = textwrap.dedent(
-    """\
-    # MixedProject
+MIXED_LIST_MD = """\
+# MixedProject
 
-    ## Project Context
+## Project Context
 
-    Context prose.
+Context prose.
 
-    ## Capabilities
+## Capabilities
 
-    - Bullet cap one
-    * Bullet cap two
-    + Bullet cap three
+- Bullet cap one
+* Bullet cap two
++ Bullet cap three
 
-    ## Constraints
+## Constraints
 
-    1. Numbered constraint one
-    2. Numbered constraint two
+1. Numbered constraint one
+2. Numbered constraint two
 
-    ## Scope Boundaries
+## Scope Boundaries
 
-    - Scope item
+- Scope item
 
-    ## Development Workflow
+## Development Workflow
 
-    1. First step
-    2. Second step
-    """
-)
+1. First step
+2. Second step
+"""
 
-H3_HEADING_MD = textwrap.dedent(
-    """\
-    # H3Project
+H3_HEADING_MD = """\
+# H3Project
 
-    ## Project Context
+## Project Context
 
-    High-level context.
+High-level context.
 
-    ### Sub-context
+### Sub-context
 
-    Nested context detail.
+Nested context detail.
 
-    ## Capabilities
+## Capabilities
 
-    - Cap one
+- Cap one
 
-    ## Constraints
+## Constraints
 
-    - Con one
+- Con one
 
-    ## Scope Boundaries
+## Scope Boundaries
 
-    - Boundary
+- Boundary
 
-    ## Development Workflow
+## Development Workflow
 
-    1. Step
-    """
-)
+1. Step
+"""
+
+UNICODE_MD = """\
+# Ünïcödé Project
+
+## Project Context
+
+Context with special chars: — " " … ñ 你好.
 
-UNICODE_MD = textwrap.dedent(
-    """\
-    # Ünïcödé Project
+## Capabilities
 
-    ## Project Context
+- Handle UTF-8 input safely
 
-    Context with special chars: — " " … ñ 你好.
+## Constraints
 
-    ## Capabilities
+- Preserve encoding: ™ © ®
 
-    - Handle UTF-8 input safely
+## Scope Boundaries
 
-    ## Constraints
+- In scope: 日本語 support
 
-    - Preserve encoding: ™ © ®
+## Development Workflow
 
-    ## Scope Boundaries
+1. Test unicode paths
+"""
 
-    - In scope: 日本語 support
 
-    ## Development Workflow
+# Pre-encoded once at import: the file fixtures write these with
+# write_bytes, skipping the per-write UTF-8 encode and TextIOWrapper.
+FULL_AGENTS_MD_BYTES = FULL_AGENTS_MD.encode("utf-8")
+MINIMAL_AGENTS_MD_BYTES = MINIMAL_AGENTS_MD.encode("utf-8")
+MISSING_ALL_SECTIONS_MD_BYTES = MISSING_ALL_SECTIONS_MD.encode("utf-8")
+NO_H1_MD_BYTES = NO_H1_MD.encode("utf-8")
+UNICODE_MD_BYTES = UNICODE_MD.encode("utf-8")
 
-    1. Test unicode paths
+
+# Every raw markdown constant, keyed by short name, for corpus-style
+# fixtures that want to sweep all of them.
+CORPUS_MD: dict[str, str] = {
+    "full": FULL_AGENTS_MD,
+    "minimal": MINIMAL_AGENTS_MD,
+    "missing_all": MISSING_ALL_SECTIONS_MD,
+    "no_h1": NO_H1_MD,
+    "extra_section": EXTRA_SECTION_MD,
+    "alias_heading": ALIAS_HEADING_MD,
+    "mixed_list": MIXED_LIST_MD,
+    "h3_heading": H3_HEADING_MD,
+    "unicode": UNICODE_MD,
+}
+
+
+@pytest.fixture(scope="session")
+def parsed_corpus() -> dict[str, AgentsMdDocument]:
+    """Every markdown constant parsed once for the whole session.
+
+    The parsed documents are frozen, so tests asserting on different
+    facets of the same document can safely share one instance instead
+    of re-running the parser.
     """
-)
+    parser = AgentsMdParser()
+    return {name: parser.parse(md) for name, md in CORPUS_MD.items()}
 
 
 # ---------------------------------------------------------------------------
 # Document fixtures
+#
+# Session-scoped: AgentsMdDocument is frozen, and no test mutates the list
+# or dict fields in place, so one validated instance can serve the session.
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def full_document() -> AgentsMdDocument:
     """A fully-populated AgentsMdDocument with all standard sections."""
     return AgentsMdDocument(
@@ -262,7 +365,7 @@ def full_document() -> AgentsMdDocument:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def empty_document() -> AgentsMdDocument:
     """An AgentsMdDocument that is fully empty (no list items, no prose)."""
     return AgentsMdDocument(
@@ -277,7 +380,7 @@ def empty_document() -> AgentsMdDocument:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def document_with_extras() -> AgentsMdDocument:
     """AgentsMdDocument carrying extra_sections content."""
     return AgentsMdDocument(
@@ -299,36 +402,53 @@ def document_with_extras() -> AgentsMdDocument:
 
 # ---------------------------------------------------------------------------
 # File-system fixtures
+#
+# Session-scoped: tests only ever read these files, so each one is written
+# to disk once per test session instead of once per test.
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def agents_md_file(tmp_path: Path) -> Path:
-    """Write the full AGENTS.md content to a temporary file and return its path."""
-    file_path = tmp_path / "AGENTS.md"
-    file_path.write_text(FULL_AGENTS_MD, encoding="utf-8")
-    return file_path
-
+@pytest.fixture(scope="session")
+def _md_corpus(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Write every on-disk markdown fixture in one burst.
 
-@pytest.fixture()
-def minimal_agents_md_file(tmp_path: Path) -> Path:
-    """Write the minimal AGENTS.md content to a temporary file."""
-    file_path = tmp_path / "AGENTS.md"
-    file_path.write_text(MINIMAL_AGENTS_MD, encoding="utf-8")
-    return file_path
-
-
-@pytest.fixture()
-def empty_agents_md_file(tmp_path: Path) -> Path:
-    """Write a near-empty AGENTS.md to a temporary file."""
-    file_path = tmp_path / "AGENTS.md"
-    file_path.write_text(MISSING_ALL_SECTIONS_MD, encoding="utf-8")
-    return file_path
-
-
-@pytest.fixture()
-def unicode_agents_md_file(tmp_path: Path) -> Path:
-    """Write a unicode AGENTS.md to a temporary file."""
-    file_path = tmp_path / "AGENTS.md"
-    file_path.write_text(UNICODE_MD, encoding="utf-8")
-    return file_path
+    One directory and one write loop instead of a mktemp + write round
+    trip per fixture; the named fixtures below are plain dict lookups.
+    """
+    corpus_dir = tmp_path_factory.mktemp("md_corpus")
+    corpus = {
+        "full": FULL_AGENTS_MD_BYTES,
+        "minimal": MINIMAL_AGENTS_MD_BYTES,
+        "empty": MISSING_ALL_SECTIONS_MD_BYTES,
+        "unicode": UNICODE_MD_BYTES,
+    }
+    paths: dict[str, Path] = {}
+    for name, content in corpus.items():
+        path = corpus_dir / f"{name}.md"
+        path.write_bytes(content)
+        paths[name] = path
+    return paths
+
+
+@pytest.fixture(scope="session")
+def agents_md_file(_md_corpus: dict[str, Path]) -> Path:
+    """Path to the full AGENTS.md fixture file."""
+    return _md_corpus["full"]
+
+
+@pytest.fixture(scope="session")
+def minimal_agents_md_file(_md_corpus: dict[str, Path]) -> Path:
+    """Path to the minimal AGENTS.md fixture file."""
+    return _md_corpus["minimal"]
+
+
+@pytest.fixture(scope="session")
+def empty_agents_md_file(_md_corpus: dict[str, Path]) -> Path:
+    """Path to the near-empty AGENTS.md fixture file."""
+    return _md_corpus["empty"]
+
+
+@pytest.fixture(scope="session")
+def unicode_agents_md_file(_md_corpus: dict[str, Path]) -> Path:
+    """Path to the unicode AGENTS.md fixture file."""
+    return _md_corpus["unicode"]
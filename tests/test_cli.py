@@ -3,16 +3,31 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
+from typing import Callable
 
 import pytest
-import yaml
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
 from aumai_agentsmd.cli import main, _format_location
 from aumai_agentsmd.models import AgentsSection, ValidationIssue
 
-from conftest import FULL_AGENTS_MD, MINIMAL_AGENTS_MD, MISSING_ALL_SECTIONS_MD
+from conftest import (
+    FULL_AGENTS_MD,
+    FULL_AGENTS_MD_BYTES,
+    MINIMAL_AGENTS_MD_BYTES,
+    MISSING_ALL_SECTIONS_MD,
+    MISSING_ALL_SECTIONS_MD_BYTES,
+    NO_H1_MD,
+)
+
+
+# Compiled once: a single alternation pass over the validate output
+# instead of five separate substring scans.
+_SECTION_NAMES_RE = re.compile(
+    "project_context|capabilities|constraints|scope_boundaries|development_workflow"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -20,32 +35,101 @@ from conftest import FULL_AGENTS_MD, MINIMAL_AGENTS_MD, MISSING_ALL_SECTIONS_MD
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+# Session-scoped: CliRunner carries no per-test state for plain invoke()
+# calls, so one instance serves the whole session.
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
     return CliRunner()
 
 
 @pytest.fixture()
-def valid_agents_file(tmp_path: Path) -> Path:
-    path = tmp_path / "AGENTS.md"
-    path.write_text(FULL_AGENTS_MD, encoding="utf-8")
+def cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run the test from an empty per-test directory.
+
+    Cheaper than runner.isolated_filesystem(): pytest already provisions
+    tmp_path, so this is a single chdir with no extra mkdtemp/rmtree.
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+# Session-scoped: the CLI only reads these files, so write each once.
+@pytest.fixture(scope="session")
+def valid_agents_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("cli_valid") / "AGENTS.md"
+    path.write_bytes(FULL_AGENTS_MD_BYTES)
     return path
 
 
-@pytest.fixture()
-def invalid_agents_file(tmp_path: Path) -> Path:
-    path = tmp_path / "AGENTS.md"
-    path.write_text(MISSING_ALL_SECTIONS_MD, encoding="utf-8")
+@pytest.fixture(scope="session")
+def invalid_agents_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("cli_invalid") / "AGENTS.md"
+    path.write_bytes(MISSING_ALL_SECTIONS_MD_BYTES)
     return path
 
 
-@pytest.fixture()
-def minimal_agents_file(tmp_path: Path) -> Path:
-    path = tmp_path / "AGENTS.md"
-    path.write_text(MINIMAL_AGENTS_MD, encoding="utf-8")
+@pytest.fixture(scope="session")
+def minimal_agents_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("cli_minimal") / "AGENTS.md"
+    path.write_bytes(MINIMAL_AGENTS_MD_BYTES)
     return path
 
 
+# Cached invocation results. Several tests assert different facets of the
+# same command output, so run each read-only command once per session and
+# share the Result (and decoded payload) instead of re-invoking the CLI.
+# They feed the markdown via the "-" stdin sentinel, which skips the temp
+# file entirely; file-path resolution stays covered by the remaining
+# per-file tests. These depend only on other session-scoped fixtures,
+# which keeps the wider scope legal.
+@pytest.fixture(scope="session")
+def parse_json_result(runner: CliRunner) -> tuple[Result, dict]:
+    result = runner.invoke(main, ["parse", "-"], input=FULL_AGENTS_MD)
+    return result, json.loads(result.output)
+
+
+@pytest.fixture(scope="session")
+def validate_valid_result(runner: CliRunner) -> Result:
+    return runner.invoke(main, ["validate", "-"], input=FULL_AGENTS_MD)
+
+
+@pytest.fixture(scope="session")
+def validate_invalid_result(runner: CliRunner) -> Result:
+    return runner.invoke(main, ["validate", "-"], input=MISSING_ALL_SECTIONS_MD)
+
+
+@pytest.fixture(scope="session")
+def validate_warnings_result(runner: CliRunner) -> Result:
+    return runner.invoke(main, ["validate", "-"], input=NO_H1_MD)
+
+
+@pytest.fixture(scope="session")
+def generate_result(runner: CliRunner) -> Result:
+    return runner.invoke(main, ["generate", "-"], input=FULL_AGENTS_MD)
+
+
+# PyYAML is imported lazily so collection and non-YAML subsets
+# (e.g. `pytest -k "not yaml"`) skip its module-import cost.
+@pytest.fixture(scope="session")
+def yaml_loads() -> Callable[[str], dict]:
+    import yaml
+
+    try:  # libyaml parses roughly an order of magnitude faster when present
+        from yaml import CSafeLoader as loader
+    except ImportError:  # pragma: no cover - depends on how PyYAML was built
+        from yaml import SafeLoader as loader
+
+    return lambda text: yaml.load(text, Loader=loader)
+
+
+@pytest.fixture(scope="session")
+def parse_yaml_result(
+    runner: CliRunner, yaml_loads: Callable[[str], dict]
+) -> tuple[Result, dict]:
+    result = runner.invoke(main, ["parse", "-", "--output", "yaml"], input=FULL_AGENTS_MD)
+    return result, yaml_loads(result.output)
+
+
 # ---------------------------------------------------------------------------
 # main group tests
 # ---------------------------------------------------------------------------
@@ -82,27 +166,24 @@ class TestValidateCommand:
     """Tests for the 'validate' CLI command."""
 
     def test_validate_valid_file_exit_zero(
-        self, runner: CliRunner, valid_agents_file: Path
+        self, validate_valid_result: Result
     ) -> None:
-        result = runner.invoke(main, ["validate", str(valid_agents_file)])
-        assert result.exit_code == 0
+        assert validate_valid_result.exit_code == 0
 
     def test_validate_valid_file_reports_valid(
-        self, runner: CliRunner, valid_agents_file: Path
+        self, validate_valid_result: Result
     ) -> None:
-        result = runner.invoke(main, ["validate", str(valid_agents_file)])
-        assert "valid" in result.output.lower()
+        assert "valid" in validate_valid_result.output.lower()
 
     def test_validate_invalid_file_exit_one(
-        self, runner: CliRunner, invalid_agents_file: Path
+        self, validate_invalid_result: Result
     ) -> None:
-        result = runner.invoke(main, ["validate", str(invalid_agents_file)])
-        assert result.exit_code == 1
+        assert validate_invalid_result.exit_code == 1
 
     def test_validate_invalid_file_reports_error(
-        self, runner: CliRunner, invalid_agents_file: Path
+        self, validate_invalid_result: Result
     ) -> None:
-        result = runner.invoke(main, ["validate", str(invalid_agents_file)])
+        result = validate_invalid_result
         assert "ERROR" in result.output or "failed" in result.output.lower()
 
     def test_validate_missing_file_exit_nonzero(
@@ -118,23 +199,15 @@ class TestValidateCommand:
         assert "AGENTS_MD" in result.output
 
     def test_validate_with_warnings_exit_zero(
-        self, runner: CliRunner, tmp_path: Path
+        self, validate_warnings_result: Result
     ) -> None:
-        """A file with warnings only should exit 0 (still valid)."""
-        from conftest import NO_H1_MD
-        path = tmp_path / "AGENTS.md"
-        path.write_text(NO_H1_MD, encoding="utf-8")
-        result = runner.invoke(main, ["validate", str(path)])
-        assert result.exit_code == 0
+        """A document with warnings only should exit 0 (still valid)."""
+        assert validate_warnings_result.exit_code == 0
 
     def test_validate_warning_shows_warning_text(
-        self, runner: CliRunner, tmp_path: Path
+        self, validate_warnings_result: Result
     ) -> None:
-        from conftest import NO_H1_MD
-        path = tmp_path / "AGENTS.md"
-        path.write_text(NO_H1_MD, encoding="utf-8")
-        result = runner.invoke(main, ["validate", str(path)])
-        assert "WARNING" in result.output
+        assert "WARNING" in validate_warnings_result.output
 
     def test_validate_minimal_file_exit_zero(
         self, runner: CliRunner, minimal_agents_file: Path
@@ -143,29 +216,16 @@ class TestValidateCommand:
         assert result.exit_code == 0
 
     def test_validate_output_contains_section_name(
-        self, runner: CliRunner, invalid_agents_file: Path
+        self, validate_invalid_result: Result
     ) -> None:
-        result = runner.invoke(main, ["validate", str(invalid_agents_file)])
         # Should mention at least one section name
-        assert any(
-            sec in result.output
-            for sec in [
-                "project_context",
-                "capabilities",
-                "constraints",
-                "scope_boundaries",
-                "development_workflow",
-            ]
-        )
+        assert _SECTION_NAMES_RE.search(validate_invalid_result.output) is not None
 
     def test_validate_passed_with_warnings_message(
-        self, runner: CliRunner, tmp_path: Path
+        self, validate_warnings_result: Result
     ) -> None:
-        from conftest import NO_H1_MD
-        path = tmp_path / "AGENTS.md"
-        path.write_text(NO_H1_MD, encoding="utf-8")
-        result = runner.invoke(main, ["validate", str(path)])
-        assert "warnings" in result.output.lower() or "WARNING" in result.output
+        output = validate_warnings_result.output
+        assert "warnings" in output.lower() or "WARNING" in output
 
 
 # ---------------------------------------------------------------------------
@@ -177,25 +237,22 @@ class TestParseCommand:
     """Tests for the 'parse' CLI command."""
 
     def test_parse_default_json_output(
-        self, runner: CliRunner, valid_agents_file: Path
+        self, parse_json_result: tuple[Result, dict]
     ) -> None:
-        result = runner.invoke(main, ["parse", str(valid_agents_file)])
+        result, parsed = parse_json_result
         assert result.exit_code == 0
-        parsed = json.loads(result.output)
         assert isinstance(parsed, dict)
 
     def test_parse_json_contains_project_name(
-        self, runner: CliRunner, valid_agents_file: Path
+        self, parse_json_result: tuple[Result, dict]
     ) -> None:
-        result = runner.invoke(main, ["parse", str(valid_agents_file)])
-        data = json.loads(result.output)
+        _, data = parse_json_result
         assert data["project_name"] == "MyProject"
 
     def test_parse_json_contains_capabilities(
-        self, runner: CliRunner, valid_agents_file: Path
+        self, parse_json_result: tuple[Result, dict]
     ) -> None:
-        result = runner.invoke(main, ["parse", str(valid_agents_file)])
-        data = json.loads(result.output)
+        _, data = parse_json_result
         assert isinstance(data["capabilities"], list)
         assert len(data["capabilities"]) > 0
 
@@ -208,26 +265,27 @@ class TestParseCommand:
         assert "project_name" in data
 
     def test_parse_yaml_output(
-        self, runner: CliRunner, valid_agents_file: Path
+        self, parse_yaml_result: tuple[Result, dict]
     ) -> None:
-        result = runner.invoke(main, ["parse", str(valid_agents_file), "--output", "yaml"])
+        result, data = parse_yaml_result
         assert result.exit_code == 0
-        data = yaml.safe_load(result.output)
         assert isinstance(data, dict)
 
     def test_parse_yaml_contains_project_name(
-        self, runner: CliRunner, valid_agents_file: Path
+        self, parse_yaml_result: tuple[Result, dict]
     ) -> None:
-        result = runner.invoke(main, ["parse", str(valid_agents_file), "--output", "yaml"])
-        data = yaml.safe_load(result.output)
+        _, data = parse_yaml_result
         assert data["project_name"] == "MyProject"
 
     def test_parse_yaml_short_flag(
-        self, runner: CliRunner, valid_agents_file: Path
+        self,
+        runner: CliRunner,
+        valid_agents_file: Path,
+        yaml_loads: Callable[[str], dict],
     ) -> None:
         result = runner.invoke(main, ["parse", str(valid_agents_file), "-o", "yaml"])
         assert result.exit_code == 0
-        data = yaml.safe_load(result.output)
+        data = yaml_loads(result.output)
         assert "project_name" in data
 
     def test_parse_missing_file_exit_nonzero(
@@ -244,17 +302,15 @@ class TestParseCommand:
         assert "yaml" in result.output.lower()
 
     def test_parse_json_constraints_list(
-        self, runner: CliRunner, valid_agents_file: Path
+        self, parse_json_result: tuple[Result, dict]
     ) -> None:
-        result = runner.invoke(main, ["parse", str(valid_agents_file)])
-        data = json.loads(result.output)
+        _, data = parse_json_result
         assert isinstance(data["constraints"], list)
 
     def test_parse_json_workflow_steps(
-        self, runner: CliRunner, valid_agents_file: Path
+        self, parse_json_result: tuple[Result, dict]
     ) -> None:
-        result = runner.invoke(main, ["parse", str(valid_agents_file)])
-        data = json.loads(result.output)
+        _, data = parse_json_result
         assert isinstance(data["workflow_steps"], list)
         assert len(data["workflow_steps"]) == 3
 
@@ -273,85 +329,82 @@ class TestParseCommand:
 class TestInitCommand:
     """Tests for the 'init' CLI command."""
 
-    def test_init_creates_default_file(self, runner: CliRunner) -> None:
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init"])
-            assert result.exit_code == 0
-            assert Path("AGENTS.md").exists()
-
-    def test_init_default_project_name(self, runner: CliRunner) -> None:
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init"])
-            content = Path("AGENTS.md").read_text(encoding="utf-8")
-            assert "MyProject" in content
-
-    def test_init_custom_project_name(self, runner: CliRunner) -> None:
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "--project-name", "AwesomeProject"])
-            assert result.exit_code == 0
-            content = Path("AGENTS.md").read_text(encoding="utf-8")
-            assert "AwesomeProject" in content
-
-    def test_init_custom_output_path(self, runner: CliRunner) -> None:
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "--output", "MY_AGENTS.md"])
-            assert result.exit_code == 0
-            assert Path("MY_AGENTS.md").exists()
-
-    def test_init_short_output_flag(self, runner: CliRunner) -> None:
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "-o", "OUTPUT.md"])
-            assert result.exit_code == 0
-            assert Path("OUTPUT.md").exists()
-
-    def test_init_existing_file_without_force_fails(self, runner: CliRunner) -> None:
-        with runner.isolated_filesystem():
-            Path("AGENTS.md").write_text("existing content", encoding="utf-8")
-            result = runner.invoke(main, ["init"])
-            assert result.exit_code == 1
+    def test_init_creates_default_file(self, runner: CliRunner, cwd: Path) -> None:
+        result = runner.invoke(main, ["init"])
+        assert result.exit_code == 0
+        assert Path("AGENTS.md").exists()
+
+    def test_init_default_project_name(self, runner: CliRunner, cwd: Path) -> None:
+        # The success message echoes the project name, so asserting on the
+        # output skips a file read; on-disk content is covered by the
+        # custom-name test below.
+        result = runner.invoke(main, ["init"])
+        assert "MyProject" in result.output
+
+    def test_init_custom_project_name(self, runner: CliRunner, cwd: Path) -> None:
+        result = runner.invoke(main, ["init", "--project-name", "AwesomeProject"])
+        assert result.exit_code == 0
+        assert "AwesomeProject" in result.output
+        content = Path("AGENTS.md").read_text(encoding="utf-8")
+        assert "AwesomeProject" in content
+
+    def test_init_custom_output_path(self, runner: CliRunner, cwd: Path) -> None:
+        result = runner.invoke(main, ["init", "--output", "MY_AGENTS.md"])
+        assert result.exit_code == 0
+        assert Path("MY_AGENTS.md").exists()
+
+    def test_init_short_output_flag(self, runner: CliRunner, cwd: Path) -> None:
+        result = runner.invoke(main, ["init", "-o", "OUTPUT.md"])
+        assert result.exit_code == 0
+        assert Path("OUTPUT.md").exists()
+
+    def test_init_existing_file_without_force_fails(
+        self, runner: CliRunner, cwd: Path
+    ) -> None:
+        Path("AGENTS.md").write_text("existing content", encoding="utf-8")
+        result = runner.invoke(main, ["init"])
+        assert result.exit_code == 1
 
     def test_init_existing_file_without_force_error_message(
-        self, runner: CliRunner
+        self, runner: CliRunner, cwd: Path
     ) -> None:
-        with runner.isolated_filesystem():
-            Path("AGENTS.md").write_text("existing content", encoding="utf-8")
-            result = runner.invoke(main, ["init"])
-            assert "already exists" in result.output or "already exists" in (result.stderr or "")
-
-    def test_init_force_overwrites_existing(self, runner: CliRunner) -> None:
-        with runner.isolated_filesystem():
-            Path("AGENTS.md").write_text("old content", encoding="utf-8")
-            result = runner.invoke(main, ["init", "--force"])
-            assert result.exit_code == 0
-            content = Path("AGENTS.md").read_text(encoding="utf-8")
-            assert "MyProject" in content
-            assert "old content" not in content
-
-    def test_init_output_mentions_project_name(self, runner: CliRunner) -> None:
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "--project-name", "TestProject"])
-            assert "TestProject" in result.output
-
-    def test_init_file_is_valid_agents_md(self, runner: CliRunner) -> None:
-        from aumai_agentsmd.core import AgentsMdParser, AgentsMdValidator
-        with runner.isolated_filesystem():
-            runner.invoke(main, ["init", "--project-name", "ValidProject"])
-            content = Path("AGENTS.md").read_text(encoding="utf-8")
-            parser = AgentsMdParser()
-            validator = AgentsMdValidator()
-            doc = parser.parse(content)
-            result = validator.validate(doc)
-            assert result.valid is True
+        Path("AGENTS.md").write_text("existing content", encoding="utf-8")
+        result = runner.invoke(main, ["init"])
+        assert "already exists" in result.output or "already exists" in (result.stderr or "")
+
+    def test_init_force_overwrites_existing(self, runner: CliRunner, cwd: Path) -> None:
+        Path("AGENTS.md").write_text("old content", encoding="utf-8")
+        result = runner.invoke(main, ["init", "--force"])
+        assert result.exit_code == 0
+        content = Path("AGENTS.md").read_text(encoding="utf-8")
+        assert "MyProject" in content
+        assert "old content" not in content
+
+    def test_init_template_is_valid_agents_md(self) -> None:
+        # Pure-logic check: init just writes generate_template() output, so
+        # validate that directly instead of round-tripping through Click and
+        # the filesystem.
+        from aumai_agentsmd.core import (
+            AgentsMdParser,
+            AgentsMdValidator,
+            generate_template,
+        )
+
+        content = generate_template("ValidProject")
+        doc = AgentsMdParser().parse(content)
+        result = AgentsMdValidator().validate(doc)
+        assert result.valid is True
 
     def test_init_help(self, runner: CliRunner) -> None:
         result = runner.invoke(main, ["init", "--help"])
         assert result.exit_code == 0
         assert "project-name" in result.output or "project_name" in result.output
 
-    def test_init_success_message_contains_filename(self, runner: CliRunner) -> None:
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["init", "-o", "MY_AGENTS.md"])
-            assert "MY_AGENTS.md" in result.output
+    def test_init_success_message_contains_filename(
+        self, runner: CliRunner, cwd: Path
+    ) -> None:
+        result = runner.invoke(main, ["init", "-o", "MY_AGENTS.md"])
+        assert "MY_AGENTS.md" in result.output
 
 
 # ---------------------------------------------------------------------------
@@ -362,17 +415,12 @@ class TestInitCommand:
 class TestGenerateCommand:
     """Tests for the 'generate' CLI command."""
 
-    def test_generate_stdout_output(
-        self, runner: CliRunner, valid_agents_file: Path
-    ) -> None:
-        result = runner.invoke(main, ["generate", str(valid_agents_file)])
-        assert result.exit_code == 0
-        assert "# MyProject" in result.output
+    def test_generate_stdout_output(self, generate_result: Result) -> None:
+        assert generate_result.exit_code == 0
+        assert "# MyProject" in generate_result.output
 
-    def test_generate_contains_all_sections(
-        self, runner: CliRunner, valid_agents_file: Path
-    ) -> None:
-        result = runner.invoke(main, ["generate", str(valid_agents_file)])
+    def test_generate_contains_all_sections(self, generate_result: Result) -> None:
+        result = generate_result
         assert "## Project Context" in result.output
         assert "## Capabilities" in result.output
         assert "## Constraints" in result.output
@@ -429,24 +477,16 @@ class TestGenerateCommand:
         assert result.exit_code == 0
         assert "AGENTS_MD" in result.output
 
-    def test_generate_output_is_valid_markdown(
-        self, runner: CliRunner, valid_agents_file: Path
-    ) -> None:
-        result = runner.invoke(main, ["generate", str(valid_agents_file)])
-        output = result.output
-        assert output.startswith("#")
+    def test_generate_output_is_valid_markdown(self, generate_result: Result) -> None:
+        assert generate_result.output.startswith("#")
 
-    def test_generate_capabilities_in_output(
-        self, runner: CliRunner, valid_agents_file: Path
-    ) -> None:
-        result = runner.invoke(main, ["generate", str(valid_agents_file)])
-        assert "Parse AGENTS.md files" in result.output
+    def test_generate_capabilities_in_output(self, generate_result: Result) -> None:
+        assert "Parse AGENTS.md files" in generate_result.output
 
     def test_generate_numbered_workflow_in_output(
-        self, runner: CliRunner, valid_agents_file: Path
+        self, generate_result: Result
     ) -> None:
-        result = runner.invoke(main, ["generate", str(valid_agents_file)])
-        assert "1. Write failing test" in result.output
+        assert "1. Write failing test" in generate_result.output
 
 
 # ---------------------------------------------------------------------------
@@ -457,42 +497,20 @@ class TestGenerateCommand:
 class TestFormatLocation:
     """Tests for the _format_location helper function."""
 
-    def test_with_line_number(self) -> None:
+    @pytest.mark.parametrize(
+        ("line_number", "expected"),
+        [
+            (10, " (line 10)"),
+            (None, ""),
+            (1, " (line 1)"),
+            (9999, " (line 9999)"),
+        ],
+    )
+    def test_format_location(self, line_number: int | None, expected: str) -> None:
         issue = ValidationIssue(
             section=AgentsSection.capabilities,
             severity="error",
             message="msg",
-            line_number=10,
-        )
-        result = _format_location(issue)
-        assert "(line 10)" in result
-
-    def test_without_line_number(self) -> None:
-        issue = ValidationIssue(
-            section=AgentsSection.capabilities,
-            severity="error",
-            message="msg",
-            line_number=None,
-        )
-        result = _format_location(issue)
-        assert result == ""
-
-    def test_line_number_one(self) -> None:
-        issue = ValidationIssue(
-            section=AgentsSection.constraints,
-            severity="warning",
-            message="msg",
-            line_number=1,
-        )
-        result = _format_location(issue)
-        assert "(line 1)" in result
-
-    def test_large_line_number(self) -> None:
-        issue = ValidationIssue(
-            section=AgentsSection.constraints,
-            severity="info",
-            message="msg",
-            line_number=9999,
+            line_number=line_number,
         )
-        result = _format_location(issue)
-        assert "9999" in result
+        assert _format_location(issue) == expected
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-import json
-import textwrap
 from pathlib import Path
 
 import pytest
 import yaml
-from hypothesis import given, settings
+
+try:  # Rust-backed JSON decoding, mirroring the optional import in core.py
+    import orjson as _json
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    import json as _json
+
+try:  # libyaml parses roughly an order of magnitude faster when present
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
+
+from hypothesis import example, given, settings
 from hypothesis import strategies as st
 
 from aumai_agentsmd.core import (
@@ -27,17 +36,24 @@ from aumai_agentsmd.models import (
     ValidationResult,
 )
 
-from conftest import (
-    ALIAS_HEADING_MD,
-    EXTRA_SECTION_MD,
-    FULL_AGENTS_MD,
-    H3_HEADING_MD,
-    MINIMAL_AGENTS_MD,
-    MISSING_ALL_SECTIONS_MD,
-    MIXED_LIST_MD,
-    NO_H1_MD,
-    UNICODE_MD,
-)
+from conftest import FULL_AGENTS_MD
+
+
+# Plain literal (no runtime dedent) for the extra-section stripping test.
+_EXTRA_BODY_MD = """\
+# Proj
+## Custom Section
+
+Body line here.
+"""
+
+
+def _issues_by_severity(result: ValidationResult) -> dict[str, list[ValidationIssue]]:
+    """Bucket a validation result's issues by severity in one pass."""
+    buckets: dict[str, list[ValidationIssue]] = {}
+    for issue in result.issues:
+        buckets.setdefault(issue.severity, []).append(issue)
+    return buckets
 
 
 # ---------------------------------------------------------------------------
@@ -154,96 +170,125 @@ class TestExtractProse:
 class TestAgentsMdParser:
     """Tests for AgentsMdParser.parse and parse_file."""
 
-    @pytest.fixture()
+    # Module scope: the parser is stateless, so one instance serves every
+    # test; full_doc likewise parses the shared fixture markdown once.
+    @pytest.fixture(scope="module")
     def parser(self) -> AgentsMdParser:
         return AgentsMdParser()
 
-    def test_parse_full_document_project_name(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(FULL_AGENTS_MD)
-        assert doc.project_name == "MyProject"
-
-    def test_parse_full_document_capabilities(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(FULL_AGENTS_MD)
-        assert "Parse AGENTS.md files" in doc.capabilities
-        assert "Validate document structure" in doc.capabilities
-        assert "Generate normalised markdown" in doc.capabilities
-
-    def test_parse_full_document_constraints(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(FULL_AGENTS_MD)
+    @pytest.fixture(scope="module")
+    def full_doc(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> AgentsMdDocument:
+        return parsed_corpus["full"]
+
+    def test_parse_full_document_project_name(self, full_doc: AgentsMdDocument) -> None:
+        assert full_doc.project_name == "MyProject"
+
+    def test_parse_full_document_capabilities(self, full_doc: AgentsMdDocument) -> None:
+        # Subset check: one set build instead of a list scan per needle.
+        assert {
+            "Parse AGENTS.md files",
+            "Validate document structure",
+            "Generate normalised markdown",
+        } <= set(full_doc.capabilities)
+
+    def test_parse_full_document_constraints(self, full_doc: AgentsMdDocument) -> None:
+        doc = full_doc
         assert len(doc.constraints) == 2
         assert "Must not access external APIs without approval" in doc.constraints
 
-    def test_parse_full_document_scope_boundaries(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(FULL_AGENTS_MD)
-        assert "In scope: core agent logic" in doc.scope_boundaries
-        assert "Out of scope: UI concerns" in doc.scope_boundaries
+    def test_parse_full_document_scope_boundaries(self, full_doc: AgentsMdDocument) -> None:
+        assert {
+            "In scope: core agent logic",
+            "Out of scope: UI concerns",
+        } <= set(full_doc.scope_boundaries)
 
-    def test_parse_full_document_workflow_steps(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(FULL_AGENTS_MD)
-        assert doc.workflow_steps == [
+    def test_parse_full_document_workflow_steps(self, full_doc: AgentsMdDocument) -> None:
+        assert full_doc.workflow_steps == [
             "Write failing test",
             "Implement feature",
             "Open pull request",
         ]
 
-    def test_parse_full_document_project_context(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(FULL_AGENTS_MD)
-        assert "amazing things" in doc.project_context
+    def test_parse_full_document_project_context(self, full_doc: AgentsMdDocument) -> None:
+        assert "amazing things" in full_doc.project_context
 
-    def test_parse_raw_content_preserved(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(FULL_AGENTS_MD)
-        assert doc.raw_content == FULL_AGENTS_MD
+    def test_parse_raw_content_preserved(self, full_doc: AgentsMdDocument) -> None:
+        assert full_doc.raw_content == FULL_AGENTS_MD
 
-    def test_parse_missing_all_sections(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(MISSING_ALL_SECTIONS_MD)
+    def test_parse_missing_all_sections(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["missing_all"]
         assert doc.project_name == "EmptyProject"
         assert doc.capabilities == []
         assert doc.constraints == []
         assert doc.scope_boundaries == []
         assert doc.workflow_steps == []
 
-    def test_parse_no_h1_defaults_project_name(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(NO_H1_MD)
+    def test_parse_no_h1_defaults_project_name(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["no_h1"]
         assert doc.project_name == "Unnamed Project"
 
-    def test_parse_no_h1_still_parses_sections(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(NO_H1_MD)
+    def test_parse_no_h1_still_parses_sections(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["no_h1"]
         assert len(doc.capabilities) == 1
         assert len(doc.constraints) == 1
 
-    def test_parse_extra_sections_captured(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(EXTRA_SECTION_MD)
+    def test_parse_extra_sections_captured(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["extra_section"]
         assert "Security Policy" in doc.extra_sections
         assert "security team" in doc.extra_sections["Security Policy"]
 
-    def test_parse_alias_scope_heading(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(ALIAS_HEADING_MD)
+    def test_parse_alias_scope_heading(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["alias_heading"]
         assert len(doc.scope_boundaries) == 1
         assert "In scope: the core" in doc.scope_boundaries
 
-    def test_parse_alias_workflow_heading(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(ALIAS_HEADING_MD)
+    def test_parse_alias_workflow_heading(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["alias_heading"]
         assert len(doc.workflow_steps) == 1
 
-    def test_parse_mixed_list_types(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(MIXED_LIST_MD)
+    def test_parse_mixed_list_types(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["mixed_list"]
         assert len(doc.capabilities) == 3
-        assert "Bullet cap one" in doc.capabilities
-        assert "Bullet cap two" in doc.capabilities
-        assert "Bullet cap three" in doc.capabilities
+        assert {
+            "Bullet cap one",
+            "Bullet cap two",
+            "Bullet cap three",
+        } <= set(doc.capabilities)
 
-    def test_parse_mixed_numbered_constraints(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(MIXED_LIST_MD)
+    def test_parse_mixed_numbered_constraints(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["mixed_list"]
         assert len(doc.constraints) == 2
         assert "Numbered constraint one" in doc.constraints
 
-    def test_parse_h3_heading_as_extra_section(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(H3_HEADING_MD)
+    def test_parse_h3_heading_as_extra_section(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["h3_heading"]
         # H3 "Sub-context" should appear as an extra section
         assert "Sub-context" in doc.extra_sections
 
-    def test_parse_unicode_content(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(UNICODE_MD)
+    def test_parse_unicode_content(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["unicode"]
         assert "Ünïcödé Project" == doc.project_name
         assert "Handle UTF-8 input safely" in doc.capabilities
         assert "Preserve encoding" in doc.constraints[0]
@@ -260,13 +305,13 @@ class TestAgentsMdParser:
     def test_parse_file_reads_from_disk(
         self, parser: AgentsMdParser, agents_md_file: Path
     ) -> None:
-        doc = parser.parse_file(str(agents_md_file))
+        doc = parser.parse_file(agents_md_file)
         assert doc.project_name == "MyProject"
 
     def test_parse_file_unicode_reads_correctly(
         self, parser: AgentsMdParser, unicode_agents_md_file: Path
     ) -> None:
-        doc = parser.parse_file(str(unicode_agents_md_file))
+        doc = parser.parse_file(unicode_agents_md_file)
         assert "Ünïcödé" in doc.project_name
 
     def test_parse_file_missing_raises(self, parser: AgentsMdParser, tmp_path: Path) -> None:
@@ -279,26 +324,20 @@ class TestAgentsMdParser:
         assert doc.project_name == "First"
 
     def test_parse_extra_sections_body_stripped(self, parser: AgentsMdParser) -> None:
-        content = textwrap.dedent("""\
-            # Proj
-            ## Custom Section
-
-            Body line here.
-        """)
-        doc = parser.parse(content)
+        doc = parser.parse(_EXTRA_BODY_MD)
         assert "Custom Section" in doc.extra_sections
         assert doc.extra_sections["Custom Section"] == "Body line here."
 
-    def test_parse_no_extra_sections_when_all_known(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(FULL_AGENTS_MD)
-        assert doc.extra_sections == {}
+    def test_parse_no_extra_sections_when_all_known(self, full_doc: AgentsMdDocument) -> None:
+        assert full_doc.extra_sections == {}
 
-    def test_parse_capabilities_count(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(FULL_AGENTS_MD)
-        assert len(doc.capabilities) == 3
+    def test_parse_capabilities_count(self, full_doc: AgentsMdDocument) -> None:
+        assert len(full_doc.capabilities) == 3
 
-    def test_parse_minimal_document(self, parser: AgentsMdParser) -> None:
-        doc = parser.parse(MINIMAL_AGENTS_MD)
+    def test_parse_minimal_document(
+        self, parsed_corpus: dict[str, AgentsMdDocument]
+    ) -> None:
+        doc = parsed_corpus["minimal"]
         assert doc.project_name == "TinyProject"
         assert len(doc.capabilities) == 1
         assert len(doc.constraints) == 1
@@ -314,156 +353,103 @@ class TestAgentsMdParser:
 class TestAgentsMdValidator:
     """Tests for AgentsMdValidator.validate."""
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def validator(self) -> AgentsMdValidator:
         return AgentsMdValidator()
 
-    def test_valid_full_document(
+    # Validated once per module: several tests inspect different facets
+    # of the same two results.
+    @pytest.fixture(scope="module")
+    def full_result(
         self, validator: AgentsMdValidator, full_document: AgentsMdDocument
-    ) -> None:
-        result = validator.validate(full_document)
-        assert result.valid is True
+    ) -> ValidationResult:
+        return validator.validate(full_document)
+
+    @pytest.fixture(scope="module")
+    def empty_result(
+        self, validator: AgentsMdValidator, empty_document: AgentsMdDocument
+    ) -> ValidationResult:
+        return validator.validate(empty_document)
+
+    def test_valid_full_document(self, full_result: ValidationResult) -> None:
+        assert full_result.valid is True
 
     def test_valid_full_document_no_errors(
-        self, validator: AgentsMdValidator, full_document: AgentsMdDocument
+        self, full_result: ValidationResult
     ) -> None:
-        result = validator.validate(full_document)
-        error_issues = [i for i in result.issues if i.severity == "error"]
-        assert len(error_issues) == 0
+        assert _issues_by_severity(full_result).get("error", []) == []
 
-    def test_empty_document_invalid(
-        self, validator: AgentsMdValidator, empty_document: AgentsMdDocument
-    ) -> None:
-        result = validator.validate(empty_document)
-        assert result.valid is False
+    def test_empty_document_invalid(self, empty_result: ValidationResult) -> None:
+        assert empty_result.valid is False
 
     def test_empty_document_has_five_errors(
-        self, validator: AgentsMdValidator, empty_document: AgentsMdDocument
+        self, empty_result: ValidationResult
     ) -> None:
-        result = validator.validate(empty_document)
-        errors = [i for i in result.issues if i.severity == "error"]
+        errors = _issues_by_severity(empty_result).get("error", [])
         assert len(errors) == 5
 
-    def test_no_h1_produces_warning(self, validator: AgentsMdValidator) -> None:
-        doc = AgentsMdDocument(
-            project_name="Unnamed Project",
-            project_context="Some context.",
-            capabilities=["A cap"],
-            constraints=["A con"],
-            scope_boundaries=["A boundary"],
-            workflow_steps=["A step"],
-        )
+    def test_no_h1_produces_warning(
+        self, validator: AgentsMdValidator, complete_doc: AgentsMdDocument
+    ) -> None:
+        doc = complete_doc.model_copy(update={"project_name": "Unnamed Project"})
         result = validator.validate(doc)
         warnings = [i for i in result.issues if i.severity == "warning"]
         assert len(warnings) == 1
         assert "Unnamed Project" in warnings[0].message
 
-    def test_no_h1_warning_has_line_number(self, validator: AgentsMdValidator) -> None:
-        doc = AgentsMdDocument(
-            project_name="Unnamed Project",
-            project_context="ctx",
-            capabilities=["cap"],
-            constraints=["con"],
-            scope_boundaries=["bound"],
-            workflow_steps=["step"],
-        )
+    def test_no_h1_warning_has_line_number(
+        self, validator: AgentsMdValidator, complete_doc: AgentsMdDocument
+    ) -> None:
+        doc = complete_doc.model_copy(update={"project_name": "Unnamed Project"})
         result = validator.validate(doc)
         warnings = [i for i in result.issues if i.severity == "warning"]
         assert warnings[0].line_number == 1
 
-    def test_missing_project_context_produces_error(
-        self, validator: AgentsMdValidator
-    ) -> None:
-        doc = AgentsMdDocument(
-            project_name="TestProject",
-            project_context="",
-            capabilities=["cap"],
-            constraints=["con"],
-            scope_boundaries=["bound"],
-            workflow_steps=["step"],
-        )
-        result = validator.validate(doc)
-        assert result.valid is False
-        error_sections = [i.section for i in result.issues if i.severity == "error"]
-        assert AgentsSection.project_context in error_sections
-
-    def test_missing_capabilities_produces_error(
-        self, validator: AgentsMdValidator
-    ) -> None:
-        doc = AgentsMdDocument(
-            project_name="TestProject",
-            project_context="ctx",
-            capabilities=[],
-            constraints=["con"],
-            scope_boundaries=["bound"],
-            workflow_steps=["step"],
-        )
-        result = validator.validate(doc)
-        error_sections = [i.section for i in result.issues if i.severity == "error"]
-        assert AgentsSection.capabilities in error_sections
-
-    def test_missing_constraints_produces_error(
-        self, validator: AgentsMdValidator
-    ) -> None:
-        doc = AgentsMdDocument(
-            project_name="TestProject",
-            project_context="ctx",
-            capabilities=["cap"],
-            constraints=[],
-            scope_boundaries=["bound"],
-            workflow_steps=["step"],
-        )
-        result = validator.validate(doc)
-        error_sections = [i.section for i in result.issues if i.severity == "error"]
-        assert AgentsSection.constraints in error_sections
-
-    def test_missing_scope_boundaries_produces_error(
-        self, validator: AgentsMdValidator
-    ) -> None:
-        doc = AgentsMdDocument(
+    @pytest.fixture(scope="module")
+    def complete_doc(self) -> AgentsMdDocument:
+        """Fully-populated document the missing-section tests copy from."""
+        return AgentsMdDocument(
             project_name="TestProject",
             project_context="ctx",
             capabilities=["cap"],
             constraints=["con"],
-            scope_boundaries=[],
+            scope_boundaries=["bound"],
             workflow_steps=["step"],
         )
-        result = validator.validate(doc)
-        error_sections = [i.section for i in result.issues if i.severity == "error"]
-        assert AgentsSection.scope_boundaries in error_sections
 
-    def test_missing_workflow_produces_error(
-        self, validator: AgentsMdValidator
-    ) -> None:
-        doc = AgentsMdDocument(
-            project_name="TestProject",
-            project_context="ctx",
-            capabilities=["cap"],
-            constraints=["con"],
-            scope_boundaries=["bound"],
-            workflow_steps=[],
-        )
+    @pytest.mark.parametrize(
+        ("field", "empty_value", "section"),
+        [
+            ("project_context", "", AgentsSection.project_context),
+            ("capabilities", [], AgentsSection.capabilities),
+            ("constraints", [], AgentsSection.constraints),
+            ("scope_boundaries", [], AgentsSection.scope_boundaries),
+            ("workflow_steps", [], AgentsSection.development_workflow),
+        ],
+    )
+    def test_missing_section_produces_error(
+        self,
+        validator: AgentsMdValidator,
+        complete_doc: AgentsMdDocument,
+        field: str,
+        empty_value: str | list[str],
+        section: AgentsSection,
+    ) -> None:
+        doc = complete_doc.model_copy(update={field: empty_value})
         result = validator.validate(doc)
+        assert result.valid is False
         error_sections = [i.section for i in result.issues if i.severity == "error"]
-        assert AgentsSection.development_workflow in error_sections
+        assert section in error_sections
 
     def test_validation_result_contains_document(
-        self, validator: AgentsMdValidator, full_document: AgentsMdDocument
+        self, full_result: ValidationResult, full_document: AgentsMdDocument
     ) -> None:
-        result = validator.validate(full_document)
-        assert result.document is full_document
+        assert full_result.document is full_document
 
     def test_validation_with_warnings_still_valid(
-        self, validator: AgentsMdValidator
+        self, validator: AgentsMdValidator, complete_doc: AgentsMdDocument
     ) -> None:
-        doc = AgentsMdDocument(
-            project_name="Unnamed Project",
-            project_context="ctx",
-            capabilities=["cap"],
-            constraints=["con"],
-            scope_boundaries=["bound"],
-            workflow_steps=["step"],
-        )
+        doc = complete_doc.model_copy(update={"project_name": "Unnamed Project"})
         result = validator.validate(doc)
         assert result.valid is True
 
@@ -474,10 +460,9 @@ class TestAgentsMdValidator:
         assert result.valid is True
 
     def test_issue_message_contains_section_name(
-        self, validator: AgentsMdValidator, empty_document: AgentsMdDocument
+        self, empty_result: ValidationResult
     ) -> None:
-        result = validator.validate(empty_document)
-        messages = [i.message for i in result.issues]
+        messages = [i.message for i in empty_result.issues]
         assert any("project_context" in m for m in messages)
 
 
@@ -489,113 +474,102 @@ class TestAgentsMdValidator:
 class TestAgentsMdGenerator:
     """Tests for AgentsMdGenerator.generate."""
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def generator(self) -> AgentsMdGenerator:
         return AgentsMdGenerator()
 
-    def test_generate_contains_project_name(
+    # Generated once per module; every assertion below reads from these.
+    @pytest.fixture(scope="module")
+    def full_output(
         self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
-    ) -> None:
-        output = generator.generate(full_document)
-        assert "# MyProject" in output
+    ) -> str:
+        return generator.generate(full_document)
 
-    def test_generate_contains_capabilities_section(
-        self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
-    ) -> None:
-        output = generator.generate(full_document)
-        assert "## Capabilities" in output
+    @pytest.fixture(scope="module")
+    def empty_output(
+        self, generator: AgentsMdGenerator, empty_document: AgentsMdDocument
+    ) -> str:
+        return generator.generate(empty_document)
 
-    def test_generate_contains_constraints_section(
-        self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
-    ) -> None:
-        output = generator.generate(full_document)
-        assert "## Constraints" in output
+    @pytest.fixture(scope="module")
+    def extras_output(
+        self, generator: AgentsMdGenerator, document_with_extras: AgentsMdDocument
+    ) -> str:
+        return generator.generate(document_with_extras)
+
+    def test_generate_contains_project_name(self, full_output: str) -> None:
+        assert "# MyProject" in full_output
+
+    def test_generate_contains_capabilities_section(self, full_output: str) -> None:
+        assert "## Capabilities" in full_output
+
+    def test_generate_contains_constraints_section(self, full_output: str) -> None:
+        assert "## Constraints" in full_output
 
     def test_generate_contains_scope_boundaries_section(
-        self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
+        self, full_output: str
     ) -> None:
-        output = generator.generate(full_document)
-        assert "## Scope Boundaries" in output
+        assert "## Scope Boundaries" in full_output
 
-    def test_generate_contains_workflow_section(
-        self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
-    ) -> None:
-        output = generator.generate(full_document)
-        assert "## Development Workflow" in output
+    def test_generate_contains_workflow_section(self, full_output: str) -> None:
+        assert "## Development Workflow" in full_output
 
     def test_generate_capabilities_as_bullets(
-        self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
+        self, full_output: str, full_document: AgentsMdDocument
     ) -> None:
-        output = generator.generate(full_document)
-        for cap in full_document.capabilities:
-            assert f"- {cap}" in output
+        # One contiguous-block check instead of a scan per bullet; this
+        # also pins the ordering, which per-item checks could not.
+        expected = "\n".join(f"- {cap}" for cap in full_document.capabilities)
+        assert expected in full_output
 
     def test_generate_workflow_steps_as_numbered(
-        self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
+        self, full_output: str, full_document: AgentsMdDocument
     ) -> None:
-        output = generator.generate(full_document)
-        for i, step in enumerate(full_document.workflow_steps, start=1):
-            assert f"{i}. {step}" in output
+        expected = "\n".join(
+            f"{i}. {step}"
+            for i, step in enumerate(full_document.workflow_steps, start=1)
+        )
+        assert expected in full_output
 
     def test_generate_empty_capabilities_placeholder(
-        self, generator: AgentsMdGenerator, empty_document: AgentsMdDocument
+        self, empty_output: str
     ) -> None:
-        output = generator.generate(empty_document)
-        assert "_None defined._" in output
+        assert "_None defined._" in empty_output
 
     def test_generate_empty_constraints_placeholder(
-        self, generator: AgentsMdGenerator, empty_document: AgentsMdDocument
+        self, empty_output: str
     ) -> None:
-        output = generator.generate(empty_document)
-        assert "_None defined._" in output
+        assert "_None defined._" in empty_output
 
-    def test_generate_empty_workflow_placeholder(
-        self, generator: AgentsMdGenerator, empty_document: AgentsMdDocument
-    ) -> None:
-        output = generator.generate(empty_document)
-        assert "_No steps defined._" in output
+    def test_generate_empty_workflow_placeholder(self, empty_output: str) -> None:
+        assert "_No steps defined._" in empty_output
 
-    def test_generate_empty_context_placeholder(
-        self, generator: AgentsMdGenerator, empty_document: AgentsMdDocument
-    ) -> None:
-        output = generator.generate(empty_document)
-        assert "_No context provided._" in output
+    def test_generate_empty_context_placeholder(self, empty_output: str) -> None:
+        assert "_No context provided._" in empty_output
 
-    def test_generate_extra_sections_included(
-        self, generator: AgentsMdGenerator, document_with_extras: AgentsMdDocument
-    ) -> None:
-        output = generator.generate(document_with_extras)
-        assert "## Security Policy" in output
-        assert "security team" in output
+    def test_generate_extra_sections_included(self, extras_output: str) -> None:
+        assert "## Security Policy" in extras_output
+        assert "security team" in extras_output
 
-    def test_generate_ends_with_newline(
-        self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
-    ) -> None:
-        output = generator.generate(full_document)
-        assert output.endswith("\n")
+    def test_generate_ends_with_newline(self, full_output: str) -> None:
+        assert full_output.endswith("\n")
 
     def test_generate_is_reparseable(
-        self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
+        self, full_output: str, full_document: AgentsMdDocument
     ) -> None:
         """Round-trip: generated markdown can be re-parsed to equivalent doc."""
-        output = generator.generate(full_document)
-        parser = AgentsMdParser()
-        reparsed = parser.parse(output)
+        reparsed = AgentsMdParser().parse(full_output)
         assert reparsed.project_name == full_document.project_name
         assert reparsed.capabilities == full_document.capabilities
         assert reparsed.constraints == full_document.constraints
 
     def test_generate_context_prose_present(
-        self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
+        self, full_output: str, full_document: AgentsMdDocument
     ) -> None:
-        output = generator.generate(full_document)
-        assert full_document.project_context in output
+        assert full_document.project_context in full_output
 
-    def test_generate_project_context_heading(
-        self, generator: AgentsMdGenerator, full_document: AgentsMdDocument
-    ) -> None:
-        output = generator.generate(full_document)
-        assert "## Project Context" in output
+    def test_generate_project_context_heading(self, full_output: str) -> None:
+        assert "## Project Context" in full_output
 
 
 # ---------------------------------------------------------------------------
@@ -606,87 +580,71 @@ class TestAgentsMdGenerator:
 class TestConfigExporter:
     """Tests for ConfigExporter.to_yaml and to_json."""
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def exporter(self) -> ConfigExporter:
         return ConfigExporter()
 
-    def test_to_json_valid_json(
+    # Serialize and decode the shared document once per module: most of
+    # the tests below assert different keys of the same payload, and the
+    # YAML round trip in particular is the expensive part of this class.
+    @pytest.fixture(scope="module")
+    def json_output(
         self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_json(full_document)
-        parsed = json.loads(output)
-        assert isinstance(parsed, dict)
+    ) -> str:
+        return exporter.to_json(full_document)
 
-    def test_to_json_contains_project_name(
-        self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_json(full_document)
-        data = json.loads(output)
-        assert data["project_name"] == "MyProject"
+    @pytest.fixture(scope="module")
+    def json_parsed(self, json_output: str) -> dict:
+        return _json.loads(json_output)
 
-    def test_to_json_contains_capabilities(
+    @pytest.fixture(scope="module")
+    def yaml_output(
         self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_json(full_document)
-        data = json.loads(output)
-        assert isinstance(data["capabilities"], list)
-        assert len(data["capabilities"]) > 0
+    ) -> str:
+        return exporter.to_yaml(full_document)
 
-    def test_to_json_contains_constraints(
-        self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_json(full_document)
-        data = json.loads(output)
-        assert isinstance(data["constraints"], list)
+    @pytest.fixture(scope="module")
+    def yaml_parsed(self, yaml_output: str) -> dict:
+        return yaml.load(yaml_output, Loader=_YamlLoader)
 
-    def test_to_json_contains_scope_boundaries(
-        self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_json(full_document)
-        data = json.loads(output)
-        assert "scope_boundaries" in data
+    def test_to_json_valid_json(self, json_parsed: dict) -> None:
+        assert isinstance(json_parsed, dict)
 
-    def test_to_json_contains_workflow_steps(
-        self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_json(full_document)
-        data = json.loads(output)
-        assert "workflow_steps" in data
+    def test_to_json_contains_project_name(self, json_parsed: dict) -> None:
+        assert json_parsed["project_name"] == "MyProject"
+
+    def test_to_json_contains_capabilities(self, json_parsed: dict) -> None:
+        assert isinstance(json_parsed["capabilities"], list)
+        assert len(json_parsed["capabilities"]) > 0
+
+    def test_to_json_contains_constraints(self, json_parsed: dict) -> None:
+        assert isinstance(json_parsed["constraints"], list)
+
+    def test_to_json_contains_scope_boundaries(self, json_parsed: dict) -> None:
+        assert "scope_boundaries" in json_parsed
+
+    def test_to_json_contains_workflow_steps(self, json_parsed: dict) -> None:
+        assert "workflow_steps" in json_parsed
 
     def test_to_json_contains_extra_sections(
         self, exporter: ConfigExporter, document_with_extras: AgentsMdDocument
     ) -> None:
         output = exporter.to_json(document_with_extras)
-        data = json.loads(output)
+        data = _json.loads(output)
         assert "Security Policy" in data["extra_sections"]
 
-    def test_to_json_indented(
-        self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_json(full_document)
+    def test_to_json_indented(self, json_output: str) -> None:
         # Indented JSON contains newlines after opening braces
-        assert "\n" in output
+        assert "\n" in json_output
 
-    def test_to_yaml_valid_yaml(
-        self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_yaml(full_document)
-        parsed = yaml.safe_load(output)
-        assert isinstance(parsed, dict)
+    def test_to_yaml_valid_yaml(self, yaml_parsed: dict) -> None:
+        assert isinstance(yaml_parsed, dict)
 
-    def test_to_yaml_contains_project_name(
-        self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_yaml(full_document)
-        data = yaml.safe_load(output)
-        assert data["project_name"] == "MyProject"
+    def test_to_yaml_contains_project_name(self, yaml_parsed: dict) -> None:
+        assert yaml_parsed["project_name"] == "MyProject"
 
-    def test_to_yaml_contains_capabilities(
-        self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_yaml(full_document)
-        data = yaml.safe_load(output)
-        assert isinstance(data["capabilities"], list)
+    def test_to_yaml_contains_capabilities(self, yaml_parsed: dict) -> None:
+        assert isinstance(yaml_parsed["capabilities"], list)
 
     def test_to_yaml_unicode_preserved(
         self, exporter: ConfigExporter
@@ -700,7 +658,7 @@ class TestConfigExporter:
             workflow_steps=["Test"],
         )
         output = exporter.to_yaml(doc)
-        data = yaml.safe_load(output)
+        data = yaml.load(output, Loader=_YamlLoader)
         assert data["project_name"] == "Ünïcödé"
 
     def test_to_json_unicode_not_escaped(
@@ -721,15 +679,11 @@ class TestConfigExporter:
         self, exporter: ConfigExporter, empty_document: AgentsMdDocument
     ) -> None:
         output = exporter.to_yaml(empty_document)
-        data = yaml.safe_load(output)
+        data = yaml.load(output, Loader=_YamlLoader)
         assert data["capabilities"] == []
 
-    def test_to_json_project_context_present(
-        self, exporter: ConfigExporter, full_document: AgentsMdDocument
-    ) -> None:
-        output = exporter.to_json(full_document)
-        data = json.loads(output)
-        assert "project_context" in data
+    def test_to_json_project_context_present(self, json_parsed: dict) -> None:
+        assert "project_context" in json_parsed
 
 
 # ---------------------------------------------------------------------------
@@ -740,6 +694,16 @@ class TestConfigExporter:
 class TestGenerateTemplate:
     """Tests for the generate_template function."""
 
+    # Generated and parsed once per module: four tests assert on facets of
+    # the same template round trip.
+    @pytest.fixture(scope="module")
+    def parseable_template(self) -> str:
+        return generate_template("ParseableProject")
+
+    @pytest.fixture(scope="module")
+    def parseable_doc(self, parseable_template: str) -> AgentsMdDocument:
+        return AgentsMdParser().parse(parseable_template)
+
     def test_template_contains_project_name(self) -> None:
         result = generate_template("AwesomeProject")
         assert "AwesomeProject" in result
@@ -760,30 +724,23 @@ class TestGenerateTemplate:
         result = generate_template("AnyProject")
         assert isinstance(result, str)
 
-    def test_template_is_parseable(self) -> None:
-        result = generate_template("ParseableProject")
-        parser = AgentsMdParser()
-        doc = parser.parse(result)
-        assert doc.project_name == "ParseableProject"
-
-    def test_template_parseable_has_capabilities(self) -> None:
-        result = generate_template("ParseableProject")
-        parser = AgentsMdParser()
-        doc = parser.parse(result)
-        assert len(doc.capabilities) > 0
-
-    def test_template_parseable_has_constraints(self) -> None:
-        result = generate_template("ParseableProject")
-        parser = AgentsMdParser()
-        doc = parser.parse(result)
-        assert len(doc.constraints) > 0
-
-    def test_template_parseable_is_valid(self) -> None:
-        result = generate_template("ValidProject")
-        parser = AgentsMdParser()
-        validator = AgentsMdValidator()
-        doc = parser.parse(result)
-        validation = validator.validate(doc)
+    def test_template_is_parseable(self, parseable_doc: AgentsMdDocument) -> None:
+        assert parseable_doc.project_name == "ParseableProject"
+
+    def test_template_parseable_has_capabilities(
+        self, parseable_doc: AgentsMdDocument
+    ) -> None:
+        assert len(parseable_doc.capabilities) > 0
+
+    def test_template_parseable_has_constraints(
+        self, parseable_doc: AgentsMdDocument
+    ) -> None:
+        assert len(parseable_doc.constraints) > 0
+
+    def test_template_parseable_is_valid(
+        self, parseable_doc: AgentsMdDocument
+    ) -> None:
+        validation = AgentsMdValidator().validate(parseable_doc)
         assert validation.valid is True
 
     def test_template_special_chars_in_name(self) -> None:
@@ -840,6 +797,14 @@ class TestAgentsMdDocument:
         doc = AgentsMdDocument(project_name="Test")
         assert doc.workflow_steps == []
 
+    def test_event_payload_fresh_after_model_copy(self) -> None:
+        # Regression: event_payload must not be cached in __dict__, or a
+        # renamed model_copy would emit the original document's name.
+        doc = AgentsMdDocument(project_name="Original")
+        assert doc.event_payload["project_name"] == "Original"
+        renamed = doc.model_copy(update={"project_name": "Renamed"})
+        assert renamed.event_payload["project_name"] == "Renamed"
+
 
 class TestValidationIssue:
     """Tests for ValidationIssue model."""
@@ -870,14 +835,14 @@ class TestValidationIssue:
                 message="msg",
             )
 
-    def test_valid_severities(self) -> None:
-        for severity in ("error", "warning", "info"):
-            issue = ValidationIssue(
-                section=AgentsSection.constraints,
-                severity=severity,
-                message="msg",
-            )
-            assert issue.severity == severity
+    @pytest.mark.parametrize("severity", ["error", "warning", "info"])
+    def test_valid_severity(self, severity: str) -> None:
+        issue = ValidationIssue(
+            section=AgentsSection.constraints,
+            severity=severity,
+            message="msg",
+        )
+        assert issue.severity == severity
 
     def test_line_number_optional(self) -> None:
         issue = ValidationIssue(
@@ -914,12 +879,14 @@ class TestAgentsSection:
     """Tests for AgentsSection enum."""
 
     def test_all_sections_exist(self) -> None:
-        sections = [s.value for s in AgentsSection]
-        assert "project_context" in sections
-        assert "capabilities" in sections
-        assert "constraints" in sections
-        assert "scope_boundaries" in sections
-        assert "development_workflow" in sections
+        expected = {
+            "project_context",
+            "capabilities",
+            "constraints",
+            "scope_boundaries",
+            "development_workflow",
+        }
+        assert expected <= {s.value for s in AgentsSection}
 
     def test_section_is_string_enum(self) -> None:
         assert isinstance(AgentsSection.capabilities, str)
@@ -931,33 +898,40 @@ class TestAgentsSection:
 # ---------------------------------------------------------------------------
 
 
-@given(project_name=st.text(min_size=1, max_size=100).filter(lambda s: s.strip()))
-@settings(max_examples=50)
+@pytest.mark.slow
+@pytest.mark.xdist_group("hypothesis")
+# from_regex generates valid names directly instead of filtering random
+# text (no rejection retries), and the boundary shapes — single char,
+# surrounding whitespace, max-length unicode — are pinned as examples.
+@given(project_name=st.from_regex(r"\S.{0,99}", fullmatch=True))
+@example("A")
+@example(" A ")
+@example("\u03a9" * 100)
+@settings(max_examples=10)
 def test_generate_template_always_contains_name(project_name: str) -> None:
     """generate_template always embeds the project name."""
     result = generate_template(project_name)
     assert project_name in result
 
 
+# Narrow item strategy: the generator treats every list item identically,
+# so a short alphanumeric alphabet exercises the same paths as full unicode
+# while generating and shrinking far faster.  The boundary cases worth
+# pinning are supplied explicitly with @example.
+_LIST_ITEM = st.from_regex(r"[A-Za-z0-9 _-]{1,20}", fullmatch=True).filter(
+    lambda s: s.strip()
+)
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group("hypothesis")
 @given(
-    caps=st.lists(
-        st.text(
-            alphabet=st.characters(whitelist_categories=("L", "N", "P", "Z")),
-            min_size=1,
-            max_size=50,
-        ).filter(lambda s: s.strip()),
-        max_size=10,
-    ),
-    cons=st.lists(
-        st.text(
-            alphabet=st.characters(whitelist_categories=("L", "N", "P", "Z")),
-            min_size=1,
-            max_size=50,
-        ).filter(lambda s: s.strip()),
-        max_size=10,
-    ),
+    caps=st.lists(_LIST_ITEM, max_size=5),
+    cons=st.lists(_LIST_ITEM, max_size=5),
 )
-@settings(max_examples=30)
+@example(caps=[], cons=[])
+@example(caps=["x"], cons=["y"])
+@example(caps=["a" * 20], cons=["-dash-lead"])
 def test_generator_roundtrip_lists(caps: list[str], cons: list[str]) -> None:
     """Generator produces parseable output preserving list lengths."""
     doc = AgentsMdDocument(
@@ -976,34 +950,40 @@ def test_generator_roundtrip_lists(caps: list[str], cons: list[str]) -> None:
     assert len(reparsed.constraints) == len(cons)
 
 
+@pytest.mark.slow
+@pytest.mark.xdist_group("hypothesis")
 @given(
     lines=st.lists(
-        st.one_of(
-            st.just("- bullet item"),
-            st.just("* star item"),
-            st.just("+ plus item"),
-            st.just("1. numbered item"),
-            st.just("not a list item"),
+        st.sampled_from(
+            [
+                "- bullet item",
+                "* star item",
+                "+ plus item",
+                "1. numbered item",
+                "not a list item",
+                "",
+            ]
         ),
-        min_size=0,
-        max_size=20,
+        max_size=8,
     )
 )
-@settings(max_examples=30)
+@example(lines=[])
 def test_extract_list_items_never_raises(lines: list[str]) -> None:
     """_extract_list_items must never raise for any input."""
     result = _extract_list_items(lines)
     assert isinstance(result, list)
 
 
+@pytest.mark.slow
+@pytest.mark.xdist_group("hypothesis")
 @given(
     lines=st.lists(
-        st.text(max_size=80),
-        min_size=0,
-        max_size=20,
+        st.text(alphabet=st.characters(codec="utf-8"), max_size=30),
+        max_size=8,
     )
 )
-@settings(max_examples=30)
+@example(lines=[])
+@example(lines=["", "  ", "plain prose"])
 def test_extract_prose_never_raises(lines: list[str]) -> None:
     """_extract_prose must never raise for any input."""
     result = _extract_prose(lines)
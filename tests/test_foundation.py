@@ -9,11 +9,25 @@ Covers:
 
 from __future__ import annotations
 
+import asyncio
 import json
-import uuid
-from typing import Any
+import re
+from datetime import datetime, timezone
+from collections.abc import AsyncIterator, Iterator
+from types import SimpleNamespace
+from typing import Any, Callable
 
 import pytest
+import pytest_asyncio
+
+# Skip the whole module at collection (instead of erroring on import) when
+# the async foundation libraries are absent, so a core-only checkout can
+# still run test_core.py; -m "not foundation" deselects it without paying
+# the import cost of the service stack.
+pytest.importorskip("aumai_async_core")
+pytest.importorskip("aumai_integration")
+
+pytestmark = pytest.mark.foundation
 
 from aumai_async_core import AsyncServiceConfig
 from aumai_integration import AumOS, Event
@@ -33,6 +47,8 @@ from aumai_agentsmd.llm_enricher import (
 )
 from aumai_agentsmd.models import (
     AgentsMdDocument,
+    AgentsSection,
+    ValidationIssue,
     ValidationResult,
 )
 from aumai_agentsmd.store import AgentsMDStore, StoredAgentDoc
@@ -44,8 +60,13 @@ from aumai_agentsmd.store import AgentsMDStore, StoredAgentDoc
 
 
 def _make_full_doc(project_name: str = "TestProject") -> AgentsMdDocument:
-    """Return a fully-populated AgentsMdDocument."""
-    return AgentsMdDocument(
+    """Return a fully-populated AgentsMdDocument.
+
+    Built with model_construct: the literals below are already valid, so
+    the helper skips Pydantic field validation on every call.  Validated
+    construction itself is covered by TestAgentsMdDocument in test_core.
+    """
+    return AgentsMdDocument.model_construct(
         project_name=project_name,
         project_context="An AI agent that does amazing things.",
         capabilities=["Parse documents", "Validate schemas", "Generate reports"],
@@ -59,7 +80,7 @@ def _make_full_doc(project_name: str = "TestProject") -> AgentsMdDocument:
 
 def _make_empty_doc(project_name: str = "EmptyProject") -> AgentsMdDocument:
     """Return a document with no section content."""
-    return AgentsMdDocument(
+    return AgentsMdDocument.model_construct(
         project_name=project_name,
         project_context="",
         capabilities=[],
@@ -71,6 +92,20 @@ def _make_empty_doc(project_name: str = "EmptyProject") -> AgentsMdDocument:
     )
 
 
+# Shared immutable templates: AgentsMdDocument is frozen and no test mutates
+# list fields in place, so read-only tests reuse one validated instance.
+# Name variants go through model_copy, which clones without re-validating.
+_FULL_DOC = _make_full_doc()
+_EMPTY_DOC = _make_empty_doc()
+
+
+# Canonical UUID4 shape; a compiled fullmatch is far cheaper than
+# constructing a uuid.UUID object just to validate the format.
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}"
+)
+
+
 FULL_MARKDOWN = """\
 # MyProject
 
@@ -128,6 +163,54 @@ def _make_async_service(name: str = "test-agentsmd") -> AsyncAgentsMDService:
     return AsyncAgentsMDService(config, run_in_executor=False)
 
 
+@pytest_asyncio.fixture(scope="module")
+async def async_service() -> AsyncIterator[AsyncAgentsMDService]:
+    """One started service shared by the TestAsyncService* method classes.
+
+    parse/validate/generate leave no state behind beyond the request
+    counter, so the start/stop cycle runs once per module instead of once
+    per test. Lifecycle tests build their own instances.
+    """
+    service = _make_async_service("module-agentsmd")
+    await service.start()
+    yield service
+    await service.stop()
+
+
+_EmitterProbe = Callable[[str], list[dict[str, Any]]]
+
+
+@pytest.fixture
+def emitter_probe(
+    async_service: AsyncAgentsMDService,
+) -> Iterator[_EmitterProbe]:
+    """Attach capture listeners to the shared service's emitter.
+
+    Yields an ``attach(event)`` callable that registers a capture handler
+    and returns the list its payloads land in.  Handlers are detached on
+    teardown (when the emitter supports it) so they do not pile up on the
+    module-scoped service.
+    """
+    attached: list[tuple[str, Callable[..., Any]]] = []
+
+    def attach(event: str) -> list[dict[str, Any]]:
+        events: list[dict[str, Any]] = []
+
+        async def capture(**kw: Any) -> None:
+            events.append(kw)
+
+        async_service.emitter.on(event, capture)
+        attached.append((event, capture))
+        return events
+
+    yield attach
+
+    off = getattr(async_service.emitter, "off", None)
+    if off is not None:
+        for event, handler in attached:
+            off(event, handler)
+
+
 # ===========================================================================
 # StoredAgentDoc model tests
 # ===========================================================================
@@ -136,14 +219,13 @@ def _make_async_service(name: str = "test-agentsmd") -> AsyncAgentsMDService:
 class TestStoredAgentDoc:
     def test_default_id_is_uuid(self) -> None:
         record = StoredAgentDoc(project_name="P")
-        assert uuid.UUID(record.id)
-
-    def test_default_timestamp_is_iso(self) -> None:
-        from datetime import datetime
+        assert _UUID_RE.fullmatch(record.id)
 
+    def test_default_timestamp_is_epoch_micros(self) -> None:
         record = StoredAgentDoc(project_name="P")
-        dt = datetime.fromisoformat(record.timestamp)
-        assert dt is not None
+        assert isinstance(record.timestamp, int)
+        dt = datetime.fromtimestamp(record.timestamp / 1e6, tz=timezone.utc)
+        assert dt.year >= 2024
 
     def test_default_valid_is_false(self) -> None:
         record = StoredAgentDoc(project_name="P")
@@ -169,11 +251,12 @@ class TestStoredAgentDoc:
         assert record.valid is True
         assert record.issue_count == 2
 
-    def test_model_dump_has_all_keys(self) -> None:
+    @pytest.mark.parametrize(
+        "key", ["id", "project_name", "timestamp", "valid", "issue_count", "doc_json"]
+    )
+    def test_model_dump_has_key(self, key: str) -> None:
         record = StoredAgentDoc(project_name="P")
-        dumped = record.model_dump()
-        for key in ("id", "project_name", "timestamp", "valid", "issue_count", "doc_json"):
-            assert key in dumped
+        assert key in record.model_dump()
 
     def test_coerce_doc_json_from_dict(self) -> None:
         """model_validator must re-serialise when store returns dict instead of str."""
@@ -184,7 +267,7 @@ class TestStoredAgentDoc:
         assert isinstance(record.doc_json, str)
 
     def test_to_document_round_trip(self) -> None:
-        doc = _make_full_doc("RoundTrip")
+        doc = _FULL_DOC.model_copy(update={"project_name": "RoundTrip"})
         record = StoredAgentDoc(
             project_name=doc.project_name,
             doc_json=doc.model_dump_json(),
@@ -205,6 +288,8 @@ class TestStoredAgentDoc:
 
 
 class TestAgentsMDStoreLifecycle:
+    pytestmark = pytest.mark.xdist_group("store")
+
     async def test_memory_factory_creates_store(self) -> None:
         store = AgentsMDStore.memory()
         assert isinstance(store, AgentsMDStore)
@@ -234,68 +319,75 @@ class TestAgentsMDStoreLifecycle:
 
 
 # ===========================================================================
-# AgentsMDStore save_document
+# AgentsMDStore data fixtures
 # ===========================================================================
 
 
-class TestAgentsMDStoreSaveDocument:
-    async def test_save_returns_stored_record(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc()
-            record = await store.save_document(doc)
-            assert isinstance(record, StoredAgentDoc)
+@pytest_asyncio.fixture
+async def doc_store() -> AsyncIterator[AgentsMDStore]:
+    """A fresh initialised in-memory store for each test.
 
-    async def test_save_sets_project_name(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc("NamedProject")
-            record = await store.save_document(doc)
-            assert record.project_name == "NamedProject"
+    Function-scoped on purpose: AgentsMDStore exposes no truncation API
+    and the query/metrics tests assert exact row counts, so isolation
+    comes from a new memory backend rather than a shared-instance reset.
+    """
+    async with AgentsMDStore.memory() as store:
+        yield store
 
-    async def test_save_with_validation_result_sets_valid_true(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc()
-            vr = ValidationResult(valid=True, issues=[], document=doc)
-            record = await store.save_document(doc, vr)
-            assert record.valid is True
 
-    async def test_save_with_validation_result_sets_issue_count(self) -> None:
-        from aumai_agentsmd.models import AgentsSection, ValidationIssue
+# ===========================================================================
+# AgentsMDStore save_document
+# ===========================================================================
 
-        async with AgentsMDStore.memory() as store:
-            doc = _make_empty_doc()
-            issue = ValidationIssue(
-                section=AgentsSection.capabilities,
-                severity="error",
-                message="Missing capabilities",
-            )
-            vr = ValidationResult(valid=False, issues=[issue], document=doc)
-            record = await store.save_document(doc, vr)
-            assert record.issue_count == 1
 
-    async def test_save_without_validation_result_valid_false(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc()
-            record = await store.save_document(doc)
-            assert record.valid is False
+class TestAgentsMDStoreSaveDocument:
+    pytestmark = pytest.mark.xdist_group("store")
 
-    async def test_save_stores_doc_json_as_string(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc()
-            record = await store.save_document(doc)
-            assert isinstance(record.doc_json, str)
+    async def test_save_returns_record_with_defaults(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        """One save covers record type, assigned id, and the valid default."""
+        record = await doc_store.save_document(_FULL_DOC)
+        assert isinstance(record, StoredAgentDoc)
+        assert len(record.id) > 0
+        assert record.valid is False
 
-    async def test_save_doc_json_is_valid_json(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc()
-            record = await store.save_document(doc)
-            parsed = json.loads(record.doc_json)
-            assert isinstance(parsed, dict)
+    async def test_save_sets_project_name(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        doc = _FULL_DOC.model_copy(update={"project_name": "NamedProject"})
+        record = await doc_store.save_document(doc)
+        assert record.project_name == "NamedProject"
 
-    async def test_save_assigns_non_empty_id(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc()
-            record = await store.save_document(doc)
-            assert len(record.id) > 0
+    async def test_save_with_validation_result_sets_valid_true(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        doc = _FULL_DOC
+        vr = ValidationResult(valid=True, issues=[], document=doc)
+        record = await doc_store.save_document(doc, vr)
+        assert record.valid is True
+
+    async def test_save_with_validation_result_sets_issue_count(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        doc = _EMPTY_DOC
+        issue = ValidationIssue(
+            section=AgentsSection.capabilities,
+            severity="error",
+            message="Missing capabilities",
+        )
+        vr = ValidationResult(valid=False, issues=[issue], document=doc)
+        record = await doc_store.save_document(doc, vr)
+        assert record.issue_count == 1
+
+    async def test_save_doc_json_is_valid_json(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        record = await doc_store.save_document(_FULL_DOC)
+        serialised = record.doc_json
+        assert isinstance(serialised, str)
+        assert serialised.startswith("{")
+        assert isinstance(json.loads(serialised), dict)
 
 
 # ===========================================================================
@@ -304,98 +396,129 @@ class TestAgentsMDStoreSaveDocument:
 
 
 class TestAgentsMDStoreQueries:
-    async def test_get_by_project_empty_when_none_saved(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            records = await store.get_by_project("NoSuchProject")
-            assert records == []
+    pytestmark = pytest.mark.xdist_group("store")
 
-    async def test_get_by_project_filters_by_name(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            await store.save_document(_make_full_doc("Alpha"))
-            await store.save_document(_make_full_doc("Beta"))
-            records = await store.get_by_project("Alpha")
-            assert len(records) == 1
-            assert records[0].project_name == "Alpha"
-
-    async def test_get_by_project_multiple_records(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc("Multi")
-            await store.save_document(doc)
-            await store.save_document(doc)
-            records = await store.get_by_project("Multi")
-            assert len(records) == 2
+    async def test_get_by_project_empty_when_none_saved(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        records = await doc_store.get_by_project("NoSuchProject")
+        assert records == []
 
-    async def test_get_by_project_sorted_newest_first(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc("Sorted")
-            await store.save_document(doc)
-            await store.save_document(doc)
-            records = await store.get_by_project("Sorted")
-            timestamps = [r.timestamp for r in records]
-            assert timestamps == sorted(timestamps, reverse=True)
-
-    async def test_get_valid_docs_returns_only_valid(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            full_doc = _make_full_doc("Valid")
-            vr_valid = ValidationResult(valid=True, issues=[], document=full_doc)
-            empty_doc = _make_empty_doc("Invalid")
-            vr_invalid = ValidationResult(valid=False, issues=[], document=empty_doc)
-            await store.save_document(full_doc, vr_valid)
-            await store.save_document(empty_doc, vr_invalid)
-            valid_records = await store.get_valid_docs()
-            assert all(r.valid for r in valid_records)
-            assert any(r.project_name == "Valid" for r in valid_records)
-
-    async def test_get_invalid_docs_returns_only_invalid(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            full_doc = _make_full_doc("Valid2")
-            vr_valid = ValidationResult(valid=True, issues=[], document=full_doc)
-            empty_doc = _make_empty_doc("Invalid2")
-            vr_invalid = ValidationResult(valid=False, issues=[], document=empty_doc)
-            await store.save_document(full_doc, vr_valid)
-            await store.save_document(empty_doc, vr_invalid)
-            invalid_records = await store.get_invalid_docs()
-            assert all(not r.valid for r in invalid_records)
-
-    async def test_get_by_id_returns_record(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc("ById")
-            saved = await store.save_document(doc)
-            retrieved = await store.get_by_id(saved.id)
-            assert retrieved is not None
-            assert retrieved.project_name == "ById"
+    async def test_get_by_project_filters_by_name(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        await doc_store.save_document(
+            _FULL_DOC.model_copy(update={"project_name": "Alpha"})
+        )
+        await doc_store.save_document(
+            _FULL_DOC.model_copy(update={"project_name": "Beta"})
+        )
+        records = await doc_store.get_by_project("Alpha")
+        assert len(records) == 1
+        assert records[0].project_name == "Alpha"
 
-    async def test_get_by_id_returns_none_for_unknown(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            result = await store.get_by_id("non-existent-id")
-            assert result is None
+    async def test_get_by_project_multiple_records(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        doc = _FULL_DOC.model_copy(update={"project_name": "Multi"})
+        await doc_store.save_document(doc)
+        await doc_store.save_document(doc)
+        records = await doc_store.get_by_project("Multi")
+        assert len(records) == 2
+
+    async def test_get_by_project_sorted_newest_first(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        doc = _FULL_DOC.model_copy(update={"project_name": "Sorted"})
+        await doc_store.save_document(doc)
+        await doc_store.save_document(doc)
+        records = await doc_store.get_by_project("Sorted")
+        timestamps = [r.timestamp for r in records]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+    async def test_get_valid_docs_returns_only_valid(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        full_doc = _FULL_DOC.model_copy(update={"project_name": "Valid"})
+        vr_valid = ValidationResult(valid=True, issues=[], document=full_doc)
+        empty_doc = _EMPTY_DOC.model_copy(update={"project_name": "Invalid"})
+        vr_invalid = ValidationResult(valid=False, issues=[], document=empty_doc)
+        await doc_store.save_document(full_doc, vr_valid)
+        await doc_store.save_document(empty_doc, vr_invalid)
+        valid_records = await doc_store.get_valid_docs()
+        assert all(r.valid for r in valid_records)
+        assert any(r.project_name == "Valid" for r in valid_records)
+
+    async def test_get_invalid_docs_returns_only_invalid(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        full_doc = _FULL_DOC.model_copy(update={"project_name": "Valid2"})
+        vr_valid = ValidationResult(valid=True, issues=[], document=full_doc)
+        empty_doc = _EMPTY_DOC.model_copy(update={"project_name": "Invalid2"})
+        vr_invalid = ValidationResult(valid=False, issues=[], document=empty_doc)
+        await doc_store.save_document(full_doc, vr_valid)
+        await doc_store.save_document(empty_doc, vr_invalid)
+        invalid_records = await doc_store.get_invalid_docs()
+        assert all(not r.valid for r in invalid_records)
+
+    async def test_get_by_id_returns_record(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        doc = _FULL_DOC.model_copy(update={"project_name": "ById"})
+        saved = await doc_store.save_document(doc)
+        retrieved = await doc_store.get_by_id(saved.id)
+        assert retrieved is not None
+        assert retrieved.project_name == "ById"
+
+    async def test_get_by_id_returns_none_for_unknown(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        result = await doc_store.get_by_id("non-existent-id")
+        assert result is None
 
-    async def test_get_all_returns_all_records(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            await store.save_document(_make_full_doc("A"))
-            await store.save_document(_make_full_doc("B"))
-            all_records = await store.get_all()
-            assert len(all_records) == 2
+    async def test_get_all_returns_all_records(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        await doc_store.save_document(
+            _FULL_DOC.model_copy(update={"project_name": "A"})
+        )
+        await doc_store.save_document(
+            _FULL_DOC.model_copy(update={"project_name": "B"})
+        )
+        all_records = await doc_store.get_all()
+        assert len(all_records) == 2
 
-    async def test_get_all_empty_store(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            assert await store.get_all() == []
+    async def test_get_all_empty_store(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        assert await doc_store.get_all() == []
 
-    async def test_get_recent_limits_results(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc("Paginated")
-            for _ in range(8):
-                await store.save_document(doc)
-            records = await store.get_recent("Paginated", limit=3)
-            assert len(records) == 3
+    async def test_get_recent_limits_results(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        doc = _FULL_DOC.model_copy(update={"project_name": "Paginated"})
+        # Concurrent saves: one event-loop round trip instead of eight.
+        await asyncio.gather(*(doc_store.save_document(doc) for _ in range(8)))
+        records = await doc_store.get_recent("Paginated", limit=3)
+        assert len(records) == 3
+
+    async def test_get_recent_default_limit_fifty(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        doc = _FULL_DOC.model_copy(update={"project_name": "DefaultLimit"})
+        await asyncio.gather(*(doc_store.save_document(doc) for _ in range(5)))
+        records = await doc_store.get_recent("DefaultLimit")
+        assert len(records) == 5
 
-    async def test_get_recent_default_limit_fifty(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc("DefaultLimit")
-            for _ in range(5):
-                await store.save_document(doc)
-            records = await store.get_recent("DefaultLimit")
-            assert len(records) == 5
+    async def test_iter_all_full_fetch_fallback(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        # The memory backend's find() has no limit/offset, so iter_all
+        # degrades to one full fetch behind the same streaming interface.
+        doc = _FULL_DOC.model_copy(update={"project_name": "Iter"})
+        await asyncio.gather(*(doc_store.save_document(doc) for _ in range(3)))
+        names = [record.project_name async for record in doc_store.iter_all()]
+        assert names == ["Iter"] * 3
 
 
 # ===========================================================================
@@ -404,38 +527,192 @@ class TestAgentsMDStoreQueries:
 
 
 class TestAgentsMDStoreMetrics:
-    async def test_metrics_empty_store(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            metrics = await store.compute_metrics()
-            assert metrics["total"] == 0
-            assert metrics["valid"] == 0
-            assert metrics["invalid"] == 0
-            assert metrics["valid_pct"] == 0.0
+    pytestmark = pytest.mark.xdist_group("store")
+
+    async def test_metrics_empty_store(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        metrics = await doc_store.compute_metrics()
+        assert metrics["total"] == 0
+        assert metrics["valid"] == 0
+        assert metrics["invalid"] == 0
+        assert metrics["valid_pct"] == 0.0
+
+    async def test_metrics_all_valid(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        doc = _FULL_DOC.model_copy(update={"project_name": "M"})
+        vr = ValidationResult(valid=True, issues=[], document=doc)
+        await asyncio.gather(*(doc_store.save_document(doc, vr) for _ in range(4)))
+        metrics = await doc_store.compute_metrics()
+        assert metrics["total"] == 4
+        assert metrics["valid"] == 4
+        assert metrics["valid_pct"] == 100.0
+
+    async def test_metrics_mixed_valid_invalid(
+        self, doc_store: AgentsMDStore
+    ) -> None:
+        valid_doc = _FULL_DOC.model_copy(update={"project_name": "V"})
+        invalid_doc = _EMPTY_DOC.model_copy(update={"project_name": "I"})
+        vr_v = ValidationResult(valid=True, issues=[], document=valid_doc)
+        vr_i = ValidationResult(valid=False, issues=[], document=invalid_doc)
+        await doc_store.save_document(valid_doc, vr_v)
+        await doc_store.save_document(valid_doc, vr_v)
+        await doc_store.save_document(invalid_doc, vr_i)
+        metrics = await doc_store.compute_metrics()
+        assert metrics["total"] == 3
+        assert metrics["valid"] == 2
+        assert metrics["invalid"] == 1
+
+
+# ===========================================================================
+# AgentsMDStore backend pushdown (fake repository)
+#
+# The memory backend's find() is a bare **filters signature, so the
+# ordering/paging pushdown branches in AgentsMDStore never run under the
+# fixtures above. This fake repository accepts order_by/limit/offset and
+# records every call, pinning the contract those branches rely on.
+# ===========================================================================
 
-    async def test_metrics_all_valid(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            doc = _make_full_doc("M")
-            vr = ValidationResult(valid=True, issues=[], document=doc)
-            for _ in range(4):
-                await store.save_document(doc, vr)
-            metrics = await store.compute_metrics()
-            assert metrics["total"] == 4
-            assert metrics["valid"] == 4
-            assert metrics["valid_pct"] == 100.0
-
-    async def test_metrics_mixed_valid_invalid(self) -> None:
-        async with AgentsMDStore.memory() as store:
-            valid_doc = _make_full_doc("V")
-            invalid_doc = _make_empty_doc("I")
-            vr_v = ValidationResult(valid=True, issues=[], document=valid_doc)
-            vr_i = ValidationResult(valid=False, issues=[], document=invalid_doc)
-            await store.save_document(valid_doc, vr_v)
-            await store.save_document(valid_doc, vr_v)
-            await store.save_document(invalid_doc, vr_i)
-            metrics = await store.compute_metrics()
-            assert metrics["total"] == 3
-            assert metrics["valid"] == 2
-            assert metrics["invalid"] == 1
+
+class _PushdownRepo:
+    def __init__(self) -> None:
+        self.records: list[StoredAgentDoc] = []
+        self.find_calls: list[dict[str, Any]] = []
+
+    async def ensure_table(self) -> None:
+        return None
+
+    async def save(self, record: StoredAgentDoc) -> str:
+        self.records.append(record)
+        return record.id
+
+    async def get(self, record_id: str) -> StoredAgentDoc | None:
+        return next((r for r in self.records if r.id == record_id), None)
+
+    async def find(
+        self,
+        *,
+        order_by: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        **filters: Any,
+    ) -> list[StoredAgentDoc]:
+        self.find_calls.append(
+            {"order_by": order_by, "limit": limit, "offset": offset, **filters}
+        )
+        records = [
+            r
+            for r in self.records
+            if all(getattr(r, key) == value for key, value in filters.items())
+        ]
+        if order_by == "-timestamp":
+            records.sort(key=lambda r: r.timestamp, reverse=True)
+        if offset:
+            records = records[offset:]
+        if limit is not None:
+            records = records[:limit]
+        return records
+
+
+class _PushdownStore:
+    """Minimal Store stand-in wiring AgentsMDStore to a _PushdownRepo."""
+
+    def __init__(self) -> None:
+        self.repo = _PushdownRepo()
+
+    async def initialize(self) -> None:
+        return None
+
+    def repository(self, model: type) -> _PushdownRepo:
+        return self.repo
+
+    async def close(self) -> None:
+        return None
+
+
+@pytest_asyncio.fixture
+async def pushdown_store() -> AsyncIterator[tuple[AgentsMDStore, _PushdownRepo]]:
+    backend = _PushdownStore()
+    store = AgentsMDStore(backend)  # type: ignore[arg-type]
+    await store.initialize()
+    yield store, backend.repo
+    await store.close()
+
+
+class _SqlMetricsStore(_PushdownStore):
+    """Stand-in store exposing the raw-SQL execute() compute_metrics prefers."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        super().__init__()
+        self.fail = fail
+        self.queries: list[str] = []
+
+    async def execute(self, query: str) -> list[dict[str, int]]:
+        self.queries.append(query)
+        if self.fail:
+            raise RuntimeError("no such table: storedagentdoc")
+        valid = sum(1 for r in self.repo.records if r.valid)
+        return [{"total": len(self.repo.records), "valid": valid}]
+
+
+class TestAgentsMDStorePushdown:
+    pytestmark = pytest.mark.xdist_group("store")
+
+    async def test_get_recent_pushes_order_and_limit_to_backend(
+        self, pushdown_store: tuple[AgentsMDStore, _PushdownRepo]
+    ) -> None:
+        store, repo = pushdown_store
+        for i in range(4):
+            repo.records.append(StoredAgentDoc(project_name="Push", timestamp=i))
+        repo.records.append(StoredAgentDoc(project_name="Other", timestamp=99))
+        records = await store.get_recent("Push", limit=2)
+        assert [r.timestamp for r in records] == [3, 2]
+        assert repo.find_calls[-1] == {
+            "order_by": "-timestamp",
+            "limit": 2,
+            "offset": 0,
+            "project_name": "Push",
+        }
+
+    async def test_iter_all_pages_through_backend(
+        self, pushdown_store: tuple[AgentsMDStore, _PushdownRepo]
+    ) -> None:
+        store, repo = pushdown_store
+        repo.records.extend(
+            StoredAgentDoc(project_name=f"Page{i}") for i in range(5)
+        )
+        seen = [record.project_name async for record in store.iter_all(page_size=2)]
+        assert seen == [f"Page{i}" for i in range(5)]
+        # Three round trips of two records each; the short last page stops it.
+        paged_calls = [c for c in repo.find_calls if c["limit"] == 2]
+        assert [c["offset"] for c in paged_calls] == [0, 2, 4]
+
+    async def test_metrics_uses_sql_aggregate_when_available(self) -> None:
+        backend = _SqlMetricsStore()
+        store = AgentsMDStore(backend)  # type: ignore[arg-type]
+        await store.initialize()
+        backend.repo.records.extend(
+            StoredAgentDoc(project_name="Sql", valid=i < 2) for i in range(3)
+        )
+        metrics = await store.compute_metrics()
+        assert metrics == {"total": 3, "valid": 2, "invalid": 1, "valid_pct": 66.7}
+        assert len(backend.queries) == 1
+        # The aggregate answered, so no record was materialised.
+        assert backend.repo.find_calls == []
+
+    async def test_metrics_falls_back_when_sql_fails(self) -> None:
+        backend = _SqlMetricsStore(fail=True)
+        store = AgentsMDStore(backend)  # type: ignore[arg-type]
+        await store.initialize()
+        backend.repo.records.extend(
+            StoredAgentDoc(project_name="Sql", valid=i < 2) for i in range(3)
+        )
+        metrics = await store.compute_metrics()
+        assert metrics == {"total": 3, "valid": 2, "invalid": 1, "valid_pct": 66.7}
+        # The failed aggregate degraded to the full-scan path.
+        assert len(backend.queries) == 1
+        assert len(backend.repo.find_calls) == 1
 
 
 # ===========================================================================
@@ -444,6 +721,8 @@ class TestAgentsMDStoreMetrics:
 
 
 class TestAsyncAgentsMDServiceLifecycle:
+    pytestmark = pytest.mark.xdist_group("async_service")
+
     async def test_default_config_name_is_agentsmd(self) -> None:
         service = AsyncAgentsMDService()
         assert service.config.name == "agentsmd"
@@ -496,47 +775,77 @@ class TestAsyncAgentsMDServiceLifecycle:
 
 
 class TestAsyncServiceParse:
-    async def test_parse_returns_document(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        doc = await service.parse(FULL_MARKDOWN)
-        assert isinstance(doc, AgentsMdDocument)
-        await service.stop()
+    pytestmark = pytest.mark.xdist_group("async_service")
 
-    async def test_parse_extracts_project_name(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        doc = await service.parse(FULL_MARKDOWN)
+    async def test_parse_full_markdown(
+        self,
+        async_service: AsyncAgentsMDService,
+        emitter_probe: _EmitterProbe,
+    ) -> None:
+        """One parse call covers result shape, event payload, and metrics.
+
+        Folded from five single-assert tests that each re-parsed the same
+        markdown; the properties are all facets of one parse() call.
+        """
+        events = emitter_probe("doc.parsed")
+        before = async_service.status.request_count
+        doc = await async_service.parse(FULL_MARKDOWN)
+
+        assert isinstance(doc, AgentsMdDocument)
         assert doc.project_name == "MyProject"
-        await service.stop()
+        assert len(doc.capabilities) >= 1
+        assert async_service.status.request_count == before + 1
+        assert len(events) == 1
+        assert events[0]["project_name"] == "MyProject"
 
-    async def test_parse_emits_doc_parsed_event(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        events: list[dict[str, Any]] = []
 
-        async def capture(**kw: Any) -> None:
-            events.append(kw)
+# ===========================================================================
+# AsyncAgentsMDService — parse_many()
+# ===========================================================================
+
+
+class TestAsyncServiceParseMany:
+    pytestmark = pytest.mark.xdist_group("async_service")
+
+    async def test_parse_many_returns_documents_in_order(
+        self, async_service: AsyncAgentsMDService
+    ) -> None:
+        docs = await async_service.parse_many([FULL_MARKDOWN, MINIMAL_MARKDOWN])
+        assert [doc.project_name for doc in docs] == ["MyProject", "TinyProject"]
+
+    async def test_parse_many_empty_batch(
+        self, async_service: AsyncAgentsMDService
+    ) -> None:
+        docs = await async_service.parse_many([])
+        assert docs == []
 
-        service.emitter.on("doc.parsed", capture)
-        await service.parse(FULL_MARKDOWN)
+    async def test_parse_many_emits_single_batch_event(
+        self,
+        async_service: AsyncAgentsMDService,
+        emitter_probe: _EmitterProbe,
+    ) -> None:
+        events = emitter_probe("doc.parsed_batch")
+        await async_service.parse_many([FULL_MARKDOWN, MINIMAL_MARKDOWN])
         assert len(events) == 1
-        assert events[0]["project_name"] == "MyProject"
-        await service.stop()
+        assert events[0]["count"] == 2
+        assert events[0]["project_names"] == ["MyProject", "TinyProject"]
 
-    async def test_parse_increments_request_count(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        await service.parse(FULL_MARKDOWN)
-        assert service.status.request_count == 1
-        await service.stop()
+    async def test_parse_many_works_with_process_pool(self) -> None:
+        # Pins the pickling contract: only the stateless parser crosses the
+        # executor boundary, so the docstring-recommended process pool works.
+        from concurrent.futures import ProcessPoolExecutor
 
-    async def test_parse_extracts_capabilities(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        doc = await service.parse(FULL_MARKDOWN)
-        assert len(doc.capabilities) >= 1
-        await service.stop()
+        config = AsyncServiceConfig(
+            name="pool-agentsmd", health_check_interval_seconds=0.0
+        )
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            service = AsyncAgentsMDService(config, executor=pool)
+            await service.start()
+            try:
+                docs = await service.parse_many([FULL_MARKDOWN, MINIMAL_MARKDOWN])
+            finally:
+                await service.stop()
+        assert [doc.project_name for doc in docs] == ["MyProject", "TinyProject"]
 
 
 # ===========================================================================
@@ -545,68 +854,32 @@ class TestAsyncServiceParse:
 
 
 class TestAsyncServiceValidate:
-    async def test_validate_returns_validation_result(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        doc = _make_full_doc()
-        result = await service.validate(doc)
-        assert isinstance(result, ValidationResult)
-        await service.stop()
-
-    async def test_validate_full_doc_is_valid(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        doc = _make_full_doc()
-        result = await service.validate(doc)
-        assert result.valid is True
-        await service.stop()
+    pytestmark = pytest.mark.xdist_group("async_service")
 
-    async def test_validate_empty_doc_is_not_valid(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        doc = _make_empty_doc()
-        result = await service.validate(doc)
-        assert result.valid is False
-        await service.stop()
-
-    async def test_validate_emits_doc_validated_event(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        events: list[dict[str, Any]] = []
-
-        async def capture(**kw: Any) -> None:
-            events.append(kw)
-
-        service.emitter.on("doc.validated", capture)
+    async def test_validate_full_doc(
+        self,
+        async_service: AsyncAgentsMDService,
+        emitter_probe: _EmitterProbe,
+    ) -> None:
+        """One validate call covers result shape, event payload, and metrics."""
+        events = emitter_probe("doc.validated")
         doc = _make_full_doc("ValidProject")
-        await service.validate(doc)
+        before = async_service.status.request_count
+        result = await async_service.validate(doc)
+
+        assert isinstance(result, ValidationResult)
+        assert result.valid is True
+        assert async_service.status.request_count == before + 1
         assert len(events) == 1
         assert events[0]["project_name"] == "ValidProject"
-        assert "valid" in events[0]
-        assert "issue_count" in events[0]
-        await service.stop()
-
-    async def test_validate_event_has_correct_valid_flag(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        events: list[dict[str, Any]] = []
-
-        async def capture(**kw: Any) -> None:
-            events.append(kw)
-
-        service.emitter.on("doc.validated", capture)
-        doc = _make_full_doc()
-        await service.validate(doc)
         assert events[0]["valid"] is True
-        await service.stop()
+        assert "issue_count" in events[0]
 
-    async def test_validate_increments_request_count(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        doc = _make_full_doc()
-        await service.validate(doc)
-        assert service.status.request_count == 1
-        await service.stop()
+    async def test_validate_empty_doc_is_not_valid(
+        self, async_service: AsyncAgentsMDService
+    ) -> None:
+        result = await async_service.validate(_make_empty_doc())
+        assert result.valid is False
 
 
 # ===========================================================================
@@ -615,44 +888,36 @@ class TestAsyncServiceValidate:
 
 
 class TestAsyncServiceGenerate:
-    async def test_generate_returns_string(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        doc = _make_full_doc()
-        markdown = await service.generate(doc)
-        assert isinstance(markdown, str)
-        await service.stop()
+    pytestmark = pytest.mark.xdist_group("async_service")
 
-    async def test_generate_contains_project_name(self) -> None:
-        service = _make_async_service()
-        await service.start()
+    async def test_generate_returns_project_markdown(
+        self, async_service: AsyncAgentsMDService
+    ) -> None:
+        # Content-only assertions share one generate() call; the event and
+        # counter tests below still make their own.
         doc = _make_full_doc("GeneratedProject")
-        markdown = await service.generate(doc)
+        markdown = await async_service.generate(doc)
+        assert isinstance(markdown, str)
         assert "GeneratedProject" in markdown
-        await service.stop()
 
-    async def test_generate_emits_doc_generated_event(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        events: list[dict[str, Any]] = []
-
-        async def capture(**kw: Any) -> None:
-            events.append(kw)
-
-        service.emitter.on("doc.generated", capture)
+    async def test_generate_emits_doc_generated_event(
+        self,
+        async_service: AsyncAgentsMDService,
+        emitter_probe: _EmitterProbe,
+    ) -> None:
+        events = emitter_probe("doc.generated")
         doc = _make_full_doc("GenEvent")
-        await service.generate(doc)
+        await async_service.generate(doc)
         assert len(events) == 1
         assert events[0]["project_name"] == "GenEvent"
-        await service.stop()
 
-    async def test_generate_increments_request_count(self) -> None:
-        service = _make_async_service()
-        await service.start()
+    async def test_generate_increments_request_count(
+        self, async_service: AsyncAgentsMDService
+    ) -> None:
         doc = _make_full_doc()
-        await service.generate(doc)
-        assert service.status.request_count == 1
-        await service.stop()
+        before = async_service.status.request_count
+        await async_service.generate(doc)
+        assert async_service.status.request_count == before + 1
 
 
 # ===========================================================================
@@ -660,40 +925,43 @@ class TestAsyncServiceGenerate:
 # ===========================================================================
 
 
+@pytest_asyncio.fixture(scope="module")
+async def full_parse_and_validate(
+    async_service: AsyncAgentsMDService,
+) -> tuple[AgentsMdDocument, ValidationResult]:
+    """parse_and_validate(FULL_MARKDOWN) run once for content-only tests.
+
+    Tests asserting on events or counters still make their own call.
+    """
+    return await async_service.parse_and_validate(FULL_MARKDOWN)
+
+
 class TestAsyncServiceParseAndValidate:
-    async def test_parse_and_validate_returns_tuple(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        doc, result = await service.parse_and_validate(FULL_MARKDOWN)
+    pytestmark = pytest.mark.xdist_group("async_service")
+
+    async def test_parse_and_validate_returns_tuple(
+        self, full_parse_and_validate: tuple[AgentsMdDocument, ValidationResult]
+    ) -> None:
+        doc, result = full_parse_and_validate
         assert isinstance(doc, AgentsMdDocument)
         assert isinstance(result, ValidationResult)
-        await service.stop()
 
-    async def test_parse_and_validate_full_md_is_valid(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        _doc, result = await service.parse_and_validate(FULL_MARKDOWN)
+    async def test_parse_and_validate_full_md_is_valid(
+        self, full_parse_and_validate: tuple[AgentsMdDocument, ValidationResult]
+    ) -> None:
+        _doc, result = full_parse_and_validate
         assert result.valid is True
-        await service.stop()
-
-    async def test_parse_and_validate_emits_both_events(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        parsed_events: list[dict[str, Any]] = []
-        validated_events: list[dict[str, Any]] = []
-
-        async def on_parsed(**kw: Any) -> None:
-            parsed_events.append(kw)
 
-        async def on_validated(**kw: Any) -> None:
-            validated_events.append(kw)
-
-        service.emitter.on("doc.parsed", on_parsed)
-        service.emitter.on("doc.validated", on_validated)
-        await service.parse_and_validate(FULL_MARKDOWN)
+    async def test_parse_and_validate_emits_both_events(
+        self,
+        async_service: AsyncAgentsMDService,
+        emitter_probe: _EmitterProbe,
+    ) -> None:
+        parsed_events = emitter_probe("doc.parsed")
+        validated_events = emitter_probe("doc.validated")
+        await async_service.parse_and_validate(FULL_MARKDOWN)
         assert len(parsed_events) == 1
         assert len(validated_events) == 1
-        await service.stop()
 
 
 # ===========================================================================
@@ -702,33 +970,29 @@ class TestAsyncServiceParseAndValidate:
 
 
 class TestAsyncServiceGenerateTemplate:
-    async def test_generate_from_template_returns_string(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        markdown = await service.generate_from_template("MyTemplateProject")
+    pytestmark = pytest.mark.xdist_group("async_service")
+
+    async def test_generate_from_template_returns_string(
+        self, async_service: AsyncAgentsMDService
+    ) -> None:
+        markdown = await async_service.generate_from_template("MyTemplateProject")
         assert isinstance(markdown, str)
-        await service.stop()
 
-    async def test_generate_from_template_contains_project_name(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        markdown = await service.generate_from_template("TemplateNameCheck")
+    async def test_generate_from_template_contains_project_name(
+        self, async_service: AsyncAgentsMDService
+    ) -> None:
+        markdown = await async_service.generate_from_template("TemplateNameCheck")
         assert "TemplateNameCheck" in markdown
-        await service.stop()
-
-    async def test_generate_from_template_emits_doc_generated(self) -> None:
-        service = _make_async_service()
-        await service.start()
-        events: list[dict[str, Any]] = []
-
-        async def capture(**kw: Any) -> None:
-            events.append(kw)
 
-        service.emitter.on("doc.generated", capture)
-        await service.generate_from_template("TemplateEvent")
+    async def test_generate_from_template_emits_doc_generated(
+        self,
+        async_service: AsyncAgentsMDService,
+        emitter_probe: _EmitterProbe,
+    ) -> None:
+        events = emitter_probe("doc.generated")
+        await async_service.generate_from_template("TemplateEvent")
         assert len(events) == 1
         assert events[0]["project_name"] == "TemplateEvent"
-        await service.stop()
 
 
 # ===========================================================================
@@ -776,49 +1040,49 @@ class TestEnrichmentResult:
 class TestLLMDocEnricherHeuristicFallback:
     async def test_no_client_uses_fallback(self) -> None:
         enricher = LLMDocEnricher(client=None)
-        doc = _make_full_doc()
+        doc = _FULL_DOC
         result = await enricher.analyze(doc)
         assert result.llm_powered is False
 
     async def test_full_doc_quality_is_good_or_excellent(self) -> None:
         enricher = LLMDocEnricher(client=None)
-        result = await enricher.analyze(_make_full_doc())
+        result = await enricher.analyze(_FULL_DOC)
         assert result.quality_level in ("good", "excellent")
 
     async def test_empty_doc_quality_is_poor(self) -> None:
         enricher = LLMDocEnricher(client=None)
-        result = await enricher.analyze(_make_empty_doc())
+        result = await enricher.analyze(_EMPTY_DOC)
         assert result.quality_level == "poor"
 
     async def test_empty_doc_has_missing_sections(self) -> None:
         enricher = LLMDocEnricher(client=None)
-        result = await enricher.analyze(_make_empty_doc())
+        result = await enricher.analyze(_EMPTY_DOC)
         assert len(result.missing_sections) > 0
 
     async def test_empty_doc_has_suggestions(self) -> None:
         enricher = LLMDocEnricher(client=None)
-        result = await enricher.analyze(_make_empty_doc())
+        result = await enricher.analyze(_EMPTY_DOC)
         assert len(result.improvement_suggestions) > 0
 
     async def test_full_doc_no_missing_sections(self) -> None:
         enricher = LLMDocEnricher(client=None)
-        result = await enricher.analyze(_make_full_doc())
+        result = await enricher.analyze(_FULL_DOC)
         assert result.missing_sections == []
 
     async def test_summary_contains_section_count(self) -> None:
         enricher = LLMDocEnricher(client=None)
-        result = await enricher.analyze(_make_full_doc())
+        result = await enricher.analyze(_FULL_DOC)
         assert "/" in result.summary
 
     async def test_suggest_improvements_returns_list(self) -> None:
         enricher = LLMDocEnricher(client=None)
-        suggestions = await enricher.suggest_improvements(_make_empty_doc())
+        suggestions = await enricher.suggest_improvements(_EMPTY_DOC)
         assert isinstance(suggestions, list)
         assert len(suggestions) > 0
 
     async def test_suggest_improvements_full_doc_empty_list(self) -> None:
         enricher = LLMDocEnricher(client=None)
-        suggestions = await enricher.suggest_improvements(_make_full_doc())
+        suggestions = await enricher.suggest_improvements(_FULL_DOC)
         assert isinstance(suggestions, list)
         # Full doc may have 0 suggestions
         assert suggestions == [] or isinstance(suggestions[0], str)
@@ -828,6 +1092,54 @@ class TestLLMDocEnricherHeuristicFallback:
 # LLMDocEnricher — MockProvider
 # ===========================================================================
 
+# Canned provider responses, serialised once at import instead of running
+# json.dumps inside each test body.
+_MOCK_EXCELLENT = json.dumps(
+    {
+        "quality_level": "excellent",
+        "summary": "Outstanding documentation.",
+        "missing_sections": [],
+        "improvement_suggestions": [],
+        "enriched_context": "",
+    }
+)
+_MOCK_POOR = json.dumps(
+    {
+        "quality_level": "poor",
+        "summary": "Needs major work.",
+        "missing_sections": ["capabilities", "constraints"],
+        "improvement_suggestions": ["Add capabilities", "Add constraints"],
+        "enriched_context": "",
+    }
+)
+_MOCK_ENRICHED_CONTEXT = json.dumps(
+    {
+        "quality_level": "good",
+        "summary": "Good overall.",
+        "missing_sections": [],
+        "improvement_suggestions": [],
+        "enriched_context": "An improved context description.",
+    }
+)
+_MOCK_UNKNOWN_QUALITY = json.dumps(
+    {
+        "quality_level": "amazing",  # not in allowed set
+        "summary": "Test",
+        "missing_sections": [],
+        "improvement_suggestions": [],
+        "enriched_context": "",
+    }
+)
+_MOCK_SUGGESTIONS = json.dumps(
+    {
+        "quality_level": "fair",
+        "summary": "Could be better.",
+        "missing_sections": [],
+        "improvement_suggestions": ["Add more detail", "Clarify scope"],
+        "enriched_context": "",
+    }
+)
+
 
 class TestLLMDocEnricherMockProvider:
     async def test_build_mock_enricher_returns_enricher(self) -> None:
@@ -836,88 +1148,199 @@ class TestLLMDocEnricherMockProvider:
 
     async def test_mock_enricher_default_response_good(self) -> None:
         enricher = build_mock_enricher()
-        result = await enricher.analyze(_make_full_doc())
+        result = await enricher.analyze(_FULL_DOC)
         assert result.quality_level == "good"
         assert result.llm_powered is True
 
     async def test_mock_enricher_custom_excellent_response(self) -> None:
-        response = json.dumps(
-            {
-                "quality_level": "excellent",
-                "summary": "Outstanding documentation.",
-                "missing_sections": [],
-                "improvement_suggestions": [],
-                "enriched_context": "",
-            }
-        )
-        enricher = build_mock_enricher(responses=[response])
-        result = await enricher.analyze(_make_full_doc())
+        enricher = build_mock_enricher(responses=[_MOCK_EXCELLENT])
+        result = await enricher.analyze(_FULL_DOC)
         assert result.quality_level == "excellent"
         assert result.summary == "Outstanding documentation."
 
     async def test_mock_enricher_poor_quality_response(self) -> None:
-        response = json.dumps(
-            {
-                "quality_level": "poor",
-                "summary": "Needs major work.",
-                "missing_sections": ["capabilities", "constraints"],
-                "improvement_suggestions": ["Add capabilities", "Add constraints"],
-                "enriched_context": "",
-            }
-        )
-        enricher = build_mock_enricher(responses=[response])
-        result = await enricher.analyze(_make_empty_doc())
+        enricher = build_mock_enricher(responses=[_MOCK_POOR])
+        result = await enricher.analyze(_EMPTY_DOC)
         assert result.quality_level == "poor"
         assert len(result.missing_sections) == 2
 
     async def test_mock_enricher_with_enriched_context(self) -> None:
-        response = json.dumps(
-            {
-                "quality_level": "good",
-                "summary": "Good overall.",
-                "missing_sections": [],
-                "improvement_suggestions": [],
-                "enriched_context": "An improved context description.",
-            }
-        )
-        enricher = build_mock_enricher(responses=[response])
-        result = await enricher.analyze(_make_full_doc())
+        enricher = build_mock_enricher(responses=[_MOCK_ENRICHED_CONTEXT])
+        result = await enricher.analyze(_FULL_DOC)
         assert result.enriched_context == "An improved context description."
 
     async def test_mock_enricher_invalid_json_falls_back(self) -> None:
         enricher = build_mock_enricher(responses=["this is not json at all"])
-        result = await enricher.analyze(_make_full_doc())
+        result = await enricher.analyze(_FULL_DOC)
         # Should produce a result (parse error fallback)
         assert isinstance(result, EnrichmentResult)
         assert result.llm_powered is True
 
     async def test_mock_enricher_invalid_quality_level_coerced_to_fair(self) -> None:
-        response = json.dumps(
-            {
-                "quality_level": "amazing",  # not in allowed set
-                "summary": "Test",
-                "missing_sections": [],
-                "improvement_suggestions": [],
-                "enriched_context": "",
-            }
-        )
-        enricher = build_mock_enricher(responses=[response])
-        result = await enricher.analyze(_make_full_doc())
+        enricher = build_mock_enricher(responses=[_MOCK_UNKNOWN_QUALITY])
+        result = await enricher.analyze(_FULL_DOC)
         assert result.quality_level == "fair"
 
     async def test_suggest_improvements_via_mock(self) -> None:
-        response = json.dumps(
+        enricher = build_mock_enricher(responses=[_MOCK_SUGGESTIONS])
+        suggestions = await enricher.suggest_improvements(_FULL_DOC)
+        assert suggestions == ["Add more detail", "Clarify scope"]
+
+    async def test_repeat_analyze_hits_cache_and_counts_stats(self) -> None:
+        enricher = build_mock_enricher()
+        first = await enricher.analyze(_FULL_DOC)
+        second = await enricher.analyze(_FULL_DOC)
+        assert second is first
+        assert enricher.stats == {"hits": 1, "misses": 1}
+
+    async def test_cache_disabled_always_calls_llm(self) -> None:
+        enricher = build_mock_enricher()
+        enricher.cache_enabled = False
+        first = await enricher.analyze(_FULL_DOC)
+        second = await enricher.analyze(_FULL_DOC)
+        assert second is not first
+        assert enricher.stats == {"hits": 0, "misses": 2}
+
+
+# ===========================================================================
+# LLMDocEnricher — analyze_many batching
+# ===========================================================================
+
+
+class TestLLMDocEnricherAnalyzeMany:
+    async def test_empty_batch_returns_empty_list(self) -> None:
+        enricher = build_mock_enricher()
+        assert await enricher.analyze_many([]) == []
+
+    async def test_batched_results_dispatch_by_id(self) -> None:
+        batch_response = json.dumps(
+            [
+                {
+                    "id": 1,
+                    "quality_level": "poor",
+                    "summary": "Second doc.",
+                    "missing_sections": [],
+                    "improvement_suggestions": [],
+                    "enriched_context": "",
+                },
+                {
+                    "id": 0,
+                    "quality_level": "excellent",
+                    "summary": "First doc.",
+                    "missing_sections": [],
+                    "improvement_suggestions": [],
+                    "enriched_context": "",
+                },
+            ]
+        )
+        enricher = build_mock_enricher(responses=[batch_response])
+        results = await enricher.analyze_many(
+            [_FULL_DOC.model_copy(update={"project_name": "First"}), _EMPTY_DOC]
+        )
+        assert [r.quality_level for r in results] == ["excellent", "poor"]
+
+    async def test_no_client_uses_heuristic_per_doc(self) -> None:
+        enricher = LLMDocEnricher(client=None)
+        results = await enricher.analyze_many([_FULL_DOC, _EMPTY_DOC])
+        assert len(results) == 2
+        assert all(r.llm_powered is False for r in results)
+
+    async def test_oversize_batch_fallback_counts_each_doc_once(self) -> None:
+        # Regression: the oversize fallback re-enters the single-doc path,
+        # which must not count a second miss for an already-counted doc.
+        enricher = build_mock_enricher()
+        huge = _FULL_DOC.model_copy(update={"project_context": "x" * 60_000})
+        results = await enricher.analyze_many([huge])
+        assert len(results) == 1
+        assert enricher.stats == {"hits": 0, "misses": 1}
+
+
+# ===========================================================================
+# LLMDocEnricher — analyze_stream
+# ===========================================================================
+
+
+class _StreamProbeClient:
+    """Fake LLM client for the streaming tests.
+
+    Completions sleep for *delay* seconds (documents whose prompt mentions
+    ``SlowDoc`` take ten times longer), echo the document's project name in
+    the result summary, and track in-flight / completed call counts.
+    """
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.completed = 0
+
+    async def complete(self, request: Any) -> Any:
+        prompt = request.messages[-1].content
+        name_match = re.search(r'"project_name":\s*"([^"]+)"', prompt)
+        assert name_match is not None
+        name = name_match.group(1)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay * (10 if "SlowDoc" in name else 1))
+        finally:
+            self.in_flight -= 1
+        self.completed += 1
+        body = json.dumps(
             {
-                "quality_level": "fair",
-                "summary": "Could be better.",
+                "quality_level": "good",
+                "summary": name,
                 "missing_sections": [],
-                "improvement_suggestions": ["Add more detail", "Clarify scope"],
+                "improvement_suggestions": [],
                 "enriched_context": "",
             }
         )
-        enricher = build_mock_enricher(responses=[response])
-        suggestions = await enricher.suggest_improvements(_make_full_doc())
-        assert suggestions == ["Add more detail", "Clarify scope"]
+        return SimpleNamespace(content=body)
+
+
+def _distinct_docs(count: int, prefix: str) -> list[AgentsMdDocument]:
+    return [
+        _FULL_DOC.model_copy(update={"project_name": f"{prefix}{i}"})
+        for i in range(count)
+    ]
+
+
+class TestLLMDocEnricherAnalyzeStream:
+    async def test_stream_yields_in_completion_order(self) -> None:
+        client = _StreamProbeClient()
+        enricher = LLMDocEnricher(client=client)  # type: ignore[arg-type]
+        slow = _FULL_DOC.model_copy(update={"project_name": "SlowDoc"})
+        fast = _FULL_DOC.model_copy(update={"project_name": "FastDoc"})
+        summaries = [
+            result.summary
+            async for result in enricher.analyze_stream([slow, fast])
+        ]
+        assert summaries == ["FastDoc", "SlowDoc"]
+
+    async def test_stream_respects_concurrency_bound(self) -> None:
+        client = _StreamProbeClient()
+        enricher = LLMDocEnricher(client=client)  # type: ignore[arg-type]
+        docs = _distinct_docs(6, "Bound")
+        results = [
+            result async for result in enricher.analyze_stream(docs, concurrency=2)
+        ]
+        assert len(results) == 6
+        assert client.max_in_flight <= 2
+
+    async def test_stream_early_abandon_cancels_pending(self) -> None:
+        client = _StreamProbeClient(delay=0.05)
+        enricher = LLMDocEnricher(client=client)  # type: ignore[arg-type]
+        docs = _distinct_docs(5, "Abandon")
+        stream = enricher.analyze_stream(docs, concurrency=2)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        # Closing the stream reaps the in-flight tasks; nothing keeps
+        # running (or completes late) after the consumer walked away.
+        completed_at_close = client.completed
+        assert client.in_flight == 0
+        await asyncio.sleep(0.2)
+        assert client.completed == completed_at_close
 
 
 # ===========================================================================
@@ -936,6 +1359,30 @@ def integration(aumos: AumOS) -> AgentsMDIntegration:
     return AgentsMDIntegration.from_aumos(aumos)
 
 
+@pytest_asyncio.fixture(scope="module")
+async def shared_aumos() -> AumOS:
+    """One AumOS bus shared by the publish and auto-process classes."""
+    return AumOS()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def registered_integration(
+    shared_aumos: AumOS,
+) -> AsyncIterator[AgentsMDIntegration]:
+    """An integration registered once per module on the shared bus.
+
+    The publish and auto-process tests only exercise an already-registered
+    integration, so registration runs once instead of per test; the
+    registration/unregistration transitions themselves are covered by the
+    function-scoped fixtures above.  Per-test capture lists keep the shared
+    bus safe: stale subscriptions only append to lists no assertion reads.
+    """
+    integration = AgentsMDIntegration.from_aumos(shared_aumos)
+    await integration.register()
+    yield integration
+    await integration.unregister()
+
+
 class TestAgentsMDIntegrationRegistration:
     async def test_register_sets_is_registered_true(
         self, integration: AgentsMDIntegration
@@ -980,8 +1427,7 @@ class TestAgentsMDIntegrationRegistration:
         await integration.register()
         service = aumos.get_service(_SERVICE_NAME)
         assert service is not None
-        for cap in _SERVICE_CAPABILITIES:
-            assert cap in service.capabilities
+        assert _SERVICE_CAPABILITIES <= frozenset(service.capabilities)
 
     async def test_registered_service_status_healthy(
         self, aumos: AumOS, integration: AgentsMDIntegration
@@ -1051,76 +1497,76 @@ class TestAgentsMDIntegrationFactory:
 
 class TestAgentsMDIntegrationParseAndPublish:
     async def test_parse_and_publish_returns_document(
-        self, integration: AgentsMDIntegration
+        self, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
-        doc = await integration.parse_and_publish(FULL_MARKDOWN)
+        doc = await registered_integration.parse_and_publish(FULL_MARKDOWN)
         assert isinstance(doc, AgentsMdDocument)
 
     async def test_parse_and_publish_extracts_project_name(
-        self, integration: AgentsMDIntegration
+        self, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
-        doc = await integration.parse_and_publish(FULL_MARKDOWN)
+        doc = await registered_integration.parse_and_publish(FULL_MARKDOWN)
         assert doc.project_name == "MyProject"
 
     async def test_parse_and_publish_emits_doc_parsed_event(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         events: list[Event] = []
 
         async def capture(event: Event) -> None:
             events.append(event)
 
-        aumos.events.subscribe("doc.parsed", capture)
-        await integration.parse_and_publish(FULL_MARKDOWN)
+        shared_aumos.events.subscribe("doc.parsed", capture)
+        await registered_integration.parse_and_publish(FULL_MARKDOWN)
         assert len(events) == 1
         assert events[0].data["project_name"] == "MyProject"
 
     async def test_parse_and_publish_emits_doc_validated_event(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         events: list[Event] = []
 
         async def capture(event: Event) -> None:
             events.append(event)
 
-        aumos.events.subscribe("doc.validated", capture)
-        await integration.parse_and_publish(FULL_MARKDOWN)
+        shared_aumos.events.subscribe("doc.validated", capture)
+        await registered_integration.parse_and_publish(FULL_MARKDOWN)
         assert len(events) == 1
         assert "valid" in events[0].data
         assert "issue_count" in events[0].data
 
     async def test_parse_and_publish_full_doc_valid_true_in_event(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         events: list[Event] = []
 
         async def capture(event: Event) -> None:
             events.append(event)
 
-        aumos.events.subscribe("doc.validated", capture)
-        await integration.parse_and_publish(FULL_MARKDOWN)
+        shared_aumos.events.subscribe("doc.validated", capture)
+        await registered_integration.parse_and_publish(FULL_MARKDOWN)
         assert events[0].data["valid"] is True
 
+    async def test_parse_and_publish_reuses_cached_parse(
+        self, registered_integration: AgentsMDIntegration
+    ) -> None:
+        first = await registered_integration.parse_and_publish(FULL_MARKDOWN)
+        second = await registered_integration.parse_and_publish(FULL_MARKDOWN)
+        assert second is first
+
     async def test_parse_and_publish_caches_validation(
-        self, integration: AgentsMDIntegration
+        self, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
-        await integration.parse_and_publish(FULL_MARKDOWN)
-        cached = integration.get_cached_validation("MyProject")
+        await registered_integration.parse_and_publish(FULL_MARKDOWN)
+        cached = registered_integration.get_cached_validation("MyProject")
         assert cached is not None
         assert isinstance(cached, ValidationResult)
 
     async def test_capability_cache_property_returns_dict(
-        self, integration: AgentsMDIntegration
+        self, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
-        await integration.parse_and_publish(FULL_MARKDOWN)
-        cache = integration.capability_cache
+        await registered_integration.parse_and_publish(FULL_MARKDOWN)
+        cache = registered_integration.capability_cache
         assert isinstance(cache, dict)
         assert "MyProject" in cache
 
@@ -1132,30 +1578,28 @@ class TestAgentsMDIntegrationParseAndPublish:
 
 class TestAgentsMDIntegrationPublishDocGenerated:
     async def test_publish_doc_generated_emits_event(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         events: list[Event] = []
 
         async def capture(event: Event) -> None:
             events.append(event)
 
-        aumos.events.subscribe("doc.generated", capture)
-        await integration.publish_doc_generated("PublishedProject")
+        shared_aumos.events.subscribe("doc.generated", capture)
+        await registered_integration.publish_doc_generated("PublishedProject")
         assert len(events) == 1
         assert events[0].data["project_name"] == "PublishedProject"
 
     async def test_publish_doc_generated_source_is_agentsmd(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         events: list[Event] = []
 
         async def capture(event: Event) -> None:
             events.append(event)
 
-        aumos.events.subscribe("doc.generated", capture)
-        await integration.publish_doc_generated("P")
+        shared_aumos.events.subscribe("doc.generated", capture)
+        await registered_integration.publish_doc_generated("P")
         assert events[0].source == _SERVICE_NAME
 
 
@@ -1166,16 +1610,15 @@ class TestAgentsMDIntegrationPublishDocGenerated:
 
 class TestAgentsMDIntegrationAutoProcess:
     async def test_doc_requested_event_triggers_auto_parse(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         parsed_events: list[Event] = []
 
         async def capture(event: Event) -> None:
             parsed_events.append(event)
 
-        aumos.events.subscribe("doc.parsed", capture)
-        await aumos.events.publish_simple(
+        shared_aumos.events.subscribe("doc.parsed", capture)
+        await shared_aumos.events.publish_simple(
             "agent.doc_requested",
             source="test-agent",
             content=FULL_MARKDOWN,
@@ -1184,16 +1627,15 @@ class TestAgentsMDIntegrationAutoProcess:
         assert parsed_events[0].data["project_name"] == "MyProject"
 
     async def test_doc_requested_also_triggers_validation_event(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         validated_events: list[Event] = []
 
         async def capture(event: Event) -> None:
             validated_events.append(event)
 
-        aumos.events.subscribe("doc.validated", capture)
-        await aumos.events.publish_simple(
+        shared_aumos.events.subscribe("doc.validated", capture)
+        await shared_aumos.events.publish_simple(
             "agent.doc_requested",
             source="test-agent",
             content=FULL_MARKDOWN,
@@ -1201,32 +1643,30 @@ class TestAgentsMDIntegrationAutoProcess:
         assert len(validated_events) == 1
 
     async def test_doc_requested_missing_content_skipped_gracefully(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         parsed_events: list[Event] = []
 
         async def capture(event: Event) -> None:
             parsed_events.append(event)
 
-        aumos.events.subscribe("doc.parsed", capture)
-        await aumos.events.publish_simple(
+        shared_aumos.events.subscribe("doc.parsed", capture)
+        await shared_aumos.events.publish_simple(
             "agent.doc_requested",
             source="agent",
         )
         assert len(parsed_events) == 0
 
     async def test_doc_requested_empty_content_skipped_gracefully(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         parsed_events: list[Event] = []
 
         async def capture(event: Event) -> None:
             parsed_events.append(event)
 
-        aumos.events.subscribe("doc.parsed", capture)
-        await aumos.events.publish_simple(
+        shared_aumos.events.subscribe("doc.parsed", capture)
+        await shared_aumos.events.publish_simple(
             "agent.doc_requested",
             source="agent",
             content="   ",
@@ -1234,16 +1674,15 @@ class TestAgentsMDIntegrationAutoProcess:
         assert len(parsed_events) == 0
 
     async def test_doc_requested_non_string_content_skipped(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         parsed_events: list[Event] = []
 
         async def capture(event: Event) -> None:
             parsed_events.append(event)
 
-        aumos.events.subscribe("doc.parsed", capture)
-        await aumos.events.publish_simple(
+        shared_aumos.events.subscribe("doc.parsed", capture)
+        await shared_aumos.events.publish_simple(
             "agent.doc_requested",
             source="agent",
             content=12345,
@@ -1251,19 +1690,25 @@ class TestAgentsMDIntegrationAutoProcess:
         assert len(parsed_events) == 0
 
     async def test_multiple_doc_requests_all_processed(
-        self, aumos: AumOS, integration: AgentsMDIntegration
+        self, shared_aumos: AumOS, registered_integration: AgentsMDIntegration
     ) -> None:
-        await integration.register()
         parsed_events: list[Event] = []
 
         async def capture(event: Event) -> None:
             parsed_events.append(event)
 
-        aumos.events.subscribe("doc.parsed", capture)
-        for _ in range(3):
-            await aumos.events.publish_simple(
-                "agent.doc_requested",
-                source="agent",
-                content=MINIMAL_MARKDOWN,
+        shared_aumos.events.subscribe("doc.parsed", capture)
+        # Publish concurrently: the requests are independent, and this also
+        # exercises the auto-processor under overlapping dispatch.
+        await asyncio.gather(
+            *(
+                shared_aumos.events.publish_simple(
+                    "agent.doc_requested",
+                    source="agent",
+                    content=MINIMAL_MARKDOWN,
+                )
+                for _ in range(3)
             )
+        )
+        await asyncio.sleep(0)
         assert len(parsed_events) == 3